@@ -162,6 +162,8 @@ class TextureManager:
         self.texture_groups = []
         self.name_parser = TextureNameParser()
         self.all_texture_paths = set() # Keep track of all added texture paths to avoid duplicates
+        self._textures_by_path = {} # Path key (see _path_key) -> texture object
+        self._groups_by_name = {} # Base name -> TextureGroup
         self.settings = {
             "process_metallic": True  # Whether to convert metallic to albedo+reflection
         }
@@ -211,20 +213,49 @@ class TextureManager:
         """
         return self.name_parser.parse(file_path)
     
-    def add_texture(self, file_path, texture_type=None):
+    def classify_textures(self, file_paths):
+        """
+        Classify several textures at once.
+        
+        Args:
+            file_paths: List of texture file paths
+            
+        Returns:
+            List of (texture_type, base_name) tuples in the same order as file_paths
+        """
+        parse = self.name_parser.parse
+        return [parse(file_path) for file_path in file_paths]
+    
+    @staticmethod
+    def _path_key(abs_file_path):
+        """
+        Key used to detect duplicate textures; case-insensitive on Windows.
+        
+        Args:
+            abs_file_path: Absolute path to the texture file
+            
+        Returns:
+            Normalised path string
+        """
+        return os.path.normcase(abs_file_path)
+    
+    def add_texture(self, file_path, texture_type=None, base_name=None):
         """
         Add a texture to the manager and classify it.
         
         Args:
             file_path: Path to the texture file
             texture_type: Optional texture type override
+            base_name: Optional group base name, used together with texture_type
+                when the texture was already classified (e.g. by classify_textures)
             
         Returns:
             The added texture object, or None if the texture path already exists.
         """
         # --- Check for duplicates based on absolute path ---
         abs_file_path = os.path.abspath(file_path)
-        if abs_file_path in self.all_texture_paths:
+        path_key = self._path_key(abs_file_path)
+        if path_key in self.all_texture_paths:
             print(f"Texture already managed: {file_path}")
             return None # Indicate duplicate
         # --- End Check ---
@@ -239,7 +270,7 @@ class TextureManager:
         # Classify texture if type is not provided
         if texture_type is None:
             texture_type, base_name = self.classify_texture(file_path)
-        else:
+        elif base_name is None:
             # Use provided type but still need to parse base name
             _, base_name = self.classify_texture(file_path)
             
@@ -254,7 +285,8 @@ class TextureManager:
         group.add_texture(texture_type, texture)
 
         # Add the absolute path to the set of managed paths
-        self.all_texture_paths.add(abs_file_path)
+        self.all_texture_paths.add(path_key)
+        self._textures_by_path[path_key] = texture
         
         return texture
     
@@ -269,15 +301,61 @@ class TextureManager:
             TextureGroup instance
         """
         # Search for existing group
-        for group in self.texture_groups:
-            if group.base_name == base_name:
-                return group
+        group = self._groups_by_name.get(base_name)
+        if group is not None:
+            return group
         
         # Create new group if not found
         new_group = TextureGroup(base_name)
         self.texture_groups.append(new_group)
+        self._groups_by_name[base_name] = new_group
         return new_group
     
+    def _detach_texture(self, texture):
+        """
+        Take a texture out of its group's type slot or unknown list.
+        
+        Args:
+            texture: Texture object
+            
+        Returns:
+            The group the texture belongs to, or None if not found
+        """
+        group = self._groups_by_name.get(texture.get("base_name"))
+        if group is None:
+            return None
+        
+        texture_type = texture.get("type")
+        if texture_type == "unknown":
+            if texture in group.textures["unknown"]:
+                group.textures["unknown"].remove(texture)
+        elif group.textures.get(texture_type) is texture:
+            group.textures[texture_type] = None
+        return group
+    
+    def remove_texture(self, file_path):
+        """
+        Remove a texture from the manager, dropping its group if it becomes empty.
+        
+        Args:
+            file_path: Path of the texture to remove
+            
+        Returns:
+            True if the texture was managed and has been removed, False otherwise
+        """
+        path_key = self._path_key(os.path.abspath(file_path))
+        texture = self._textures_by_path.pop(path_key, None)
+        if texture is None:
+            return False
+        self.all_texture_paths.discard(path_key)
+        
+        group = self._detach_texture(texture)
+        if group is not None and not group.textures["unknown"] and all(
+                slot is None for slot_type, slot in group.textures.items() if slot_type != "unknown"):
+            self.texture_groups.remove(group)
+            del self._groups_by_name[group.base_name]
+        return True
+    
     def generate_intermediate_formats(self):
         """
         Generate intermediate formats for all texture groups.
@@ -320,23 +398,18 @@ class TextureManager:
         old_type = texture.get("type")
         if old_type == new_type:
             return True  # No change needed
-            
+        
+        # Move the texture from its old slot in its group to the new one
+        group = self._detach_texture(texture)
+        
         # Update texture type
         texture["type"] = new_type
-        texture["is_unknown"] = False
+        texture["is_unknown"] = (new_type == "unknown")
         
-        # Find the group containing this texture
-        for group in self.texture_groups:
-            # If it was unknown, remove from unknown list and add to specified type
-            if old_type == "unknown" and texture in group.textures["unknown"]:
-                group.textures["unknown"].remove(texture)
-                group.add_texture(new_type, texture)
-                return True
-                
-            # If it was another type, need to handle the replacement
-            # (In a real implementation, would need to find the texture and move it)
-        
-        return False
+        if group is None:
+            return False
+        group.add_texture(new_type, texture)
+        return True
     
     def get_all_groups(self):
         """
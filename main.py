@@ -24,7 +24,7 @@ from model_processing.texture_extractor import TextureExtractor # Needed for MTL
 from output_formats.mtl_exporter import export_mtl # Needed for MTL export
 from output_formats.json_exporter import export_json # Added for JSON export
 from utils.rc_processor import RCProcessor # Added for CGF generation
-from utils.thumbnail_generator import generate_thumbnail # Added for thumbnail generation
+from utils.thumbnail_generator import generate_thumbnails_batch, THUMBNAIL_PROCESS_WORKERS # Added for thumbnail generation
 
 def main():
     """
@@ -388,6 +388,8 @@ def main():
         exported_count = 0
         error_count = 0
         error_messages = []
+        rc_json_files = []  # JSON configurations converted by one RC.exe run after the loop
+        thumbnail_jobs = []  # (fbx_path, thumbnail_path, model_filename), rendered together after the loop
         total_models = len(all_imported_models)
         
         # Update progress dialog if provided
@@ -568,14 +570,8 @@ def main():
                     # Don't count as an export failure, just log it
                 else:
                     print(f"Successfully exported JSON configuration: {json_result}")
-                    # --- Start RC Processing ---
-                    print(f"Initiating RC processing for: {json_result}")
-                    rc_processor = RCProcessor()
-                    # We don't need to wait for it, it runs in the background
-                    rc_processor.process_json_file(json_result) 
-                    # Note: Progress updates for RC are handled internally by RCProcessor if a callback is set,
-                    # but we are not setting one here to keep the main export flow simple.
-                    # Consider adding progress integration later if needed.
+                    # RC processing is started once for all models after the loop
+                    rc_json_files.append(json_result)
                     
                 if result:
                     exported_count += 1
@@ -584,19 +580,8 @@ def main():
                     # --- Generate Thumbnail ---
                     thumbnail_filename = f"{base_filename}.cgf.thmb.png"
                     thumbnail_output_path = os.path.join(model_output_dir, thumbnail_filename)
-                    print(f"Attempting to generate thumbnail: {thumbnail_filename}")
-                    try:
-                        thumb_success = generate_thumbnail(fbx_output_path, thumbnail_output_path)
-                        if thumb_success:
-                            print(f"Successfully generated thumbnail: {thumbnail_output_path}")
-                        else:
-                            print(f"Warning: Thumbnail generation failed for {model_filename}")
-                            # Optionally add to error messages, but don't count as export failure
-                            # error_messages.append(f"Thumbnail generation failed for {model_filename}")
-                    except Exception as thumb_e:
-                        print(f"Error during thumbnail generation call for {model_filename}: {thumb_e}")
-                        traceback.print_exc()
-                        # error_messages.append(f"Thumbnail generation error for {model_filename}: {thumb_e}")
+                    print(f"Queueing thumbnail generation: {thumbnail_filename}")
+                    thumbnail_jobs.append((fbx_output_path, thumbnail_output_path, model_filename))
                         
                 else:
                     error_count += 1
@@ -611,6 +596,34 @@ def main():
                 traceback.print_exc()
                 error_messages.append(error_msg)
         
+        # --- Generate Thumbnails ---
+        if thumbnail_jobs:
+            try:
+                thumb_results = generate_thumbnails_batch(
+                    [(fbx_path, thumbnail_path) for fbx_path, thumbnail_path, _ in thumbnail_jobs],
+                    max_workers=THUMBNAIL_PROCESS_WORKERS
+                )
+                for (_, thumbnail_path, model_filename), thumb_success in zip(thumbnail_jobs, thumb_results):
+                    if thumb_success:
+                        print(f"Successfully generated thumbnail: {thumbnail_path}")
+                    else:
+                        print(f"Warning: Thumbnail generation failed for {model_filename}")
+                        # Optionally add to error messages, but don't count as export failure
+                        # error_messages.append(f"Thumbnail generation failed for {model_filename}")
+            except Exception as thumb_e:
+                print(f"Error during thumbnail generation: {thumb_e}")
+                traceback.print_exc()
+        
+        # --- Start RC Processing ---
+        if rc_json_files:
+            print(f"Initiating RC processing for {len(rc_json_files)} JSON configurations")
+            rc_processor = RCProcessor()
+            # We don't need to wait for it, it runs in the background
+            rc_processor.process_json_files(rc_json_files)
+            # Note: Progress updates for RC are handled internally by RCProcessor if a callback is set,
+            # but we are not setting one here to keep the main export flow simple.
+            # Consider adding progress integration later if needed.
+        
         # 最終進度更新
         if progress_dialog:
             final_progress = 1.0 if not progress_dialog.is_cancelled() else current_progress
@@ -721,6 +734,11 @@ def main():
                      print(f"Model {model_filename} has no materials. Skipping.")
                      continue
 
+                # 使用導入時保存的紋理引用；模型可能在其他進程中加載，不在當前Blender場景中
+                all_orig_refs = model_obj.get("texture_refs")
+                if all_orig_refs is None:
+                    all_orig_refs = texture_extractor.extract(model_obj)
+
                 # 自已存在的模型數據提取所有材質信息
                 for orig_mat in original_materials:
                     mat_name = orig_mat.get('name', 'UnnamedMaterial')
@@ -729,8 +747,7 @@ def main():
                         continue
 
                     processed_textures = {}
-                    # 只提取該模型的紋理引用
-                    all_orig_refs = texture_extractor.extract(model_obj)
+                    # 只使用該材質的紋理引用
                     material_orig_refs = [ref for ref in all_orig_refs if ref.material_name == mat_name]
 
                     output_format = settings.get("output_format", "tif")
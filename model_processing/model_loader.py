@@ -19,6 +19,8 @@ class ModelLoader:
         Initialize the model loader.
         """
         self.supported_formats = [".fbx", ".obj", ".dae", ".3ds", ".blend"]
+        # Directory of the most recently loaded model (None until a model is loaded)
+        self.last_loaded_dir = None
         # Initialize Blender if possible
         self.bpy = None
         try:
@@ -75,6 +77,9 @@ class ModelLoader:
         # Store the directory of the model file for texture path resolution
         self.last_loaded_dir = os.path.dirname(os.path.abspath(file_path))
         
+        # Let the OS start reading the file ahead of Blender's importer
+        self._prefetch_file(file_path)
+        
         try:
             # Clear existing Blender scene objects
             self._clear_scene()
@@ -145,6 +150,31 @@ class ModelLoader:
             print(f"Error loading model: {e}")
             return self._create_dummy_model(file_path)
     
+    def _prefetch_file(self, file_path):
+        """
+        Hint the operating system that a model file will be read sequentially.
+        
+        Blender's importers only accept a file path, so the file cannot be handed
+        over as a pre-read buffer. Instead, where `os.posix_fadvise` is available,
+        ask the kernel to read the whole file ahead so the importer's many small
+        reads are served from the page cache. This is a no-op on other platforms.
+        
+        Args:
+            file_path: Path to the model file
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+            
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass  # Prefetching is only a hint
+    
     def _clear_scene(self):
         """
         Clear existing objects, materials and images from the Blender scene.
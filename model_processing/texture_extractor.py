@@ -113,19 +113,34 @@ class TextureExtractor:
         Returns:
             List of TextureReference objects
         """
+        return list(self.extract_iter(model))
+    
+    def extract_iter(self, model):
+        """
+        Extract texture references from a model one at a time.
+        
+        Callers that process references as they are found (e.g. to classify
+        them) can consume this generator without building an intermediate list.
+        
+        Args:
+            model: Loaded model object
+            
+        Yields:
+            TextureReference objects
+        """
         # Check if this is a dummy model or if Blender is not available
         if not self.bpy or model.get("is_dummy", False):
             # Create dummy texture references if bpy is not available or model is a dummy
-            return self._create_dummy_references(model)
+            yield from self._create_dummy_references(model)
+            return
             
         # Check if this is an import-only model (created by alternative import method)
         if model.get("is_import_only", False):
             # Use the enhanced dummy reference creation that scans directories
-            return self._create_enhanced_references(model)
+            yield from self._create_enhanced_references(model)
+            return
         
         # If this is a full Blender model, extract textures using Blender's API
-        texture_references = []
-        
         # Extract textures from Blender materials
         for material in self.bpy.data.materials:
             if material.use_nodes:
@@ -143,15 +158,11 @@ class TextureExtractor:
                         texture_type = self._determine_texture_type(node, material)
                         
                         # Create texture reference
-                        texture_references.append(
-                            TextureReference(
-                                path=texture_path,
-                                texture_type=texture_type,
-                                material_name=material.name
-                            )
+                        yield TextureReference(
+                            path=texture_path,
+                            texture_type=texture_type,
+                            material_name=material.name
                         )
-        
-        return texture_references
     
     def _determine_texture_type(self, node, material):
         """
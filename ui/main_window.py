@@ -18,6 +18,7 @@ from .suffix_settings import SuffixSettingsDialog
 from .preferences_dialog import PreferencesDialog
 from language.language_manager import get_instance as get_language_manager
 from language.language_manager import get_text, change_language
+from utils.rc_processor import RCProcessor
 
 class MainWindow:
     """
@@ -263,6 +264,10 @@ class MainWindow:
         """
         # Create and show preferences dialog
         dialog = PreferencesDialog(self.root)
+        
+        # RC.exe path is read once and shared by all processors
+        if dialog.result:
+            RCProcessor.refresh_config()
     
     def _show_about(self):
         """
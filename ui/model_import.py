@@ -12,11 +12,195 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading # Added
 import queue     # Added
+import functools
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from model_processing.model_loader import ModelLoader
 from model_processing.texture_extractor import TextureExtractor
 from ui.progress_dialog import ProgressDialog # Added for type hinting/clarity
 from language.language_manager import get_text # Added
 
+# Optional drag-and-drop support for model files
+try:
+    from tkinterdnd2 import DND_FILES, TkinterDnD
+except ImportError:
+    DND_FILES = None
+    TkinterDnD = None
+
+@functools.lru_cache(maxsize=4096)
+def _path_exists(path):
+    """
+    Cached `os.path.exists` used by the import worker. Models often reference the
+    same texture from many materials, so results are memoised for the current
+    import session. Cleared by `ModelImportPanel.import_model`.
+    """
+    return os.path.exists(path)
+
+def _list_dir_files(directory):
+    """
+    List the file names in a directory with a single `os.scandir` pass.
+
+    Returns:
+        Set of `os.path.normcase`'d file names, or None if the directory cannot be read
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+    except OSError:
+        return None
+
+# Loader/extractor shared by all panels, and a small cache of recently parsed
+# models keyed by (absolute path, mtime_ns, size) -> (model, texture references)
+_model_loader = None
+_texture_extractor = None
+_model_cache = collections.OrderedDict()
+_model_cache_lock = threading.Lock()
+MODEL_CACHE_SIZE = 8
+
+# Parts of a loaded model that are not kept in imported_models_info
+MODEL_INFO_DROPPED_KEYS = ("meshes", "scene_hierarchy")
+
+# Models are imported on a small thread pool. Blender's scene is global, so the
+# bpy import/extract step itself is serialised with _bpy_lock.
+MODEL_IMPORT_WORKERS = min(8, os.cpu_count() or 1)
+_bpy_lock = threading.Lock()
+
+# When bpy is available, imports run in worker processes instead, each with its
+# own Blender scene, so CPU-bound parsing of several models runs in parallel.
+# Every process imports its own bpy (hundreds of MB), so only a few are started.
+MODEL_PROCESS_WORKERS = min(2, os.cpu_count() or 1)
+_model_process_pool = None
+_model_process_pool_lock = threading.Lock()
+_process_model_loader = None
+_process_texture_extractor = None
+
+def _init_model_process():
+    """
+    Initializer for model import processes: creates the per-process loader and extractor.
+    """
+    global _process_model_loader, _process_texture_extractor
+    _process_model_loader = ModelLoader()
+    _process_texture_extractor = TextureExtractor()
+
+def _load_and_extract_in_process(file_path):
+    """
+    Load a model and extract its texture references inside a model import process.
+
+    Args:
+        file_path: Path to the model file
+
+    Returns:
+        Tuple of (model, texture_refs); texture_refs is None if loading failed
+    """
+    model = _process_model_loader.load(file_path)
+    texture_refs = None
+    if model and not model.get("is_dummy", False):
+        texture_refs = tuple(_process_texture_extractor.extract_iter(model))
+    return model, texture_refs
+
+def _get_model_process_pool():
+    """
+    Get the process pool used for model imports, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor instance
+    """
+    global _model_process_pool
+    with _model_process_pool_lock:
+        if _model_process_pool is None:
+            _model_process_pool = ProcessPoolExecutor(max_workers=MODEL_PROCESS_WORKERS, initializer=_init_model_process)
+        return _model_process_pool
+
+def _discard_model_process_pool():
+    """
+    Drop a broken model import process pool so the next import starts a fresh one.
+    """
+    global _model_process_pool
+    with _model_process_pool_lock:
+        if _model_process_pool is not None:
+            _model_process_pool.shutdown(wait=False)
+            _model_process_pool = None
+
+# Minimum time between progress messages sent by the import worker (~20 Hz)
+PROGRESS_UPDATE_INTERVAL = 0.05
+
+# Imports that finish faster than this (ms) never create a progress dialog
+PROGRESS_DIALOG_DELAY_MS = 200
+
+# Interval (ms) at which the main thread drains the import queue. Tk may only be
+# called from the main thread, so the worker cannot wake it with an event.
+PROGRESS_POLL_INTERVAL = 100
+
+# Delay (ms) used to coalesce rapid selection changes in the imported models list
+MODEL_SELECT_DEBOUNCE_MS = 50
+
+# Number of extracted textures handed to the texture import panel per idle callback
+TEXTURE_IMPORT_CHUNK_SIZE = 25
+
+def _get_model_loader():
+    """
+    Get the process-wide ModelLoader instance.
+
+    Returns:
+        ModelLoader instance
+    """
+    global _model_loader
+    if _model_loader is None:
+        _model_loader = ModelLoader()
+    return _model_loader
+
+def _get_texture_extractor():
+    """
+    Get the process-wide TextureExtractor instance.
+
+    Returns:
+        TextureExtractor instance
+    """
+    global _texture_extractor
+    if _texture_extractor is None:
+        _texture_extractor = TextureExtractor()
+    return _texture_extractor
+
+def _model_cache_key(file_path):
+    """
+    Build the model cache key for a file, or None if the file cannot be stat'ed.
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return None
+    return (os.path.abspath(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+
+def _get_cached_model(cache_key):
+    """
+    Look up a previously parsed model.
+
+    Returns:
+        (model, texture_refs) tuple or None on a cache miss
+    """
+    if cache_key is None:
+        return None
+    with _model_cache_lock:
+        entry = _model_cache.get(cache_key)
+        if entry is not None:
+            _model_cache.move_to_end(cache_key)
+        return entry
+
+def _store_cached_model(cache_key, model, texture_refs):
+    """
+    Store a parsed model and its texture references, evicting the oldest entry
+    once the cache holds more than MODEL_CACHE_SIZE models.
+    """
+    if cache_key is None:
+        return
+    with _model_cache_lock:
+        _model_cache[cache_key] = (model, texture_refs)
+        _model_cache.move_to_end(cache_key)
+        while len(_model_cache) > MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+
 class ModelImportPanel:
     """
     UI panel for model import and texture extraction.
@@ -31,13 +215,22 @@ class ModelImportPanel:
         """
         self.parent = parent
         self.imported_models_info = [] # List to store info about all imported models (populated by worker)
-        self.model_loader = ModelLoader()
-        self.texture_extractor = TextureExtractor()
+        self.model_loader = _get_model_loader()
+        self.texture_extractor = _get_texture_extractor()
         self.texture_import_panel = None  # Will be set by main window
         self.progress_dialog = None # Added to hold progress dialog instance
         self.progress_queue = None # Added for thread communication
         self.worker_thread = None # Added to hold worker thread instance
         self.currently_selected_model_textures = [] # Keep track of textures for the selected model in the list
+        self._displayed_model_info = None # Model info whose textures are currently shown in the treeview
+        self._seen_texture_paths = set() # Texture paths already sent to processing during the current import
+        self._model_select_after_id = None # Pending debounced `_on_model_select` call
+        self._last_model_selection = () # `curselection()` seen by the last `_on_model_select`
+        self._progress_poll = None # Pending `after` id of the next queue check
+        self._tree_rows = () # (material, type, path) tuples backing the virtualised treeview
+        self._tree_offset = 0 # Index of the first row shown in the treeview
+        self._tree_window = range(0) # Row indices currently inserted into the treeview
+        self._tree_missing_rows = frozenset() # Row indices whose texture file does not exist
 
         # Create frame
         self.frame = parent
@@ -61,6 +254,9 @@ class ModelImportPanel:
         import_button = ttk.Button(import_frame, text=get_text("model_import.import_button", "Import Model(s)"), command=self.import_model)
         import_button.pack(side=tk.LEFT, padx=(0, 5))
 
+        # Allow dropping model files onto the panel to skip the file dialog
+        self._init_drag_and_drop(main_frame)
+
         # --- Add Imported Models List Frame ---
         models_list_frame = ttk.LabelFrame(main_frame, text=get_text("model_import.imported_models", "Imported Models"))
         models_list_frame.pack(fill=tk.X, padx=5, pady=(10, 5)) # Add some padding
@@ -70,7 +266,7 @@ class ModelImportPanel:
         models_scrollbar_x = ttk.Scrollbar(models_list_frame, orient="horizontal", command=self.models_listbox.xview)
         self.models_listbox.configure(yscrollcommand=models_scrollbar_y.set, xscrollcommand=models_scrollbar_x.set)
         # --- Bind selection event ---
-        self.models_listbox.bind('<<ListboxSelect>>', self._on_model_select)
+        self.models_listbox.bind('<<ListboxSelect>>', self._schedule_model_select)
         # --- End Bind ---
 
         models_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
@@ -113,18 +309,23 @@ class ModelImportPanel:
         self.hsb.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Create treeview
+        # Only the rows in view are inserted (see _render_tree_window), so the
+        # vertical scrollbar is driven by the panel rather than by the treeview.
         self.tree = ttk.Treeview(
             self.tree_frame,
             columns=("material", "type", "path"),
             show="headings",
-            yscrollcommand=self.vsb.set,
             xscrollcommand=self.hsb.set
         )
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Configure scrollbars
-        self.vsb.config(command=self.tree.yview)
+        self.vsb.config(command=self._on_vscroll)
         self.hsb.config(command=self.tree.xview)
+        self.tree.bind("<Configure>", lambda event: self._render_tree_window())
+        self.tree.bind("<MouseWheel>", self._on_tree_mousewheel)
+        self.tree.bind("<Button-4>", self._on_tree_mousewheel)
+        self.tree.bind("<Button-5>", self._on_tree_mousewheel)
 
         # Configure columns
         self.tree.heading("material", text=get_text("model_import.col_material", "Material"))
@@ -133,6 +334,7 @@ class ModelImportPanel:
         self.tree.column("material", width=100, anchor=tk.W)
         self.tree.column("type", width=100, anchor=tk.W)
         self.tree.column("path", width=300, anchor=tk.W)
+        self.tree.tag_configure("missing", foreground="red")
 
         # Create action buttons frame
         action_frame = ttk.Frame(main_frame)
@@ -157,6 +359,36 @@ class ModelImportPanel:
         add_to_processing_button.pack(side=tk.LEFT, padx=5)
         self.add_to_processing_button = add_to_processing_button
 
+    def _init_drag_and_drop(self, widget):
+        """
+        Register a widget as a drop target for model files if tkinterdnd2 is installed.
+
+        Args:
+            widget: Widget that accepts dropped files
+        """
+        if TkinterDnD is None:
+            return
+
+        try:
+            TkinterDnD._require(widget.winfo_toplevel())
+            widget.drop_target_register(DND_FILES)
+            widget.dnd_bind('<<Drop>>', self._on_drop_files)
+        except Exception as e:
+            print(f"Drag and drop not available: {e}")
+
+    def _on_drop_files(self, event):
+        """
+        Handles model files dropped onto the panel.
+
+        Args:
+            event: tkinterdnd2 drop event
+        """
+        dropped_paths = self.frame.tk.splitlist(event.data)
+        model_paths = [path for path in dropped_paths if self.model_loader.can_load(path)]
+        if model_paths:
+            self.import_model(list(model_paths))
+        return event.action
+
     def set_texture_import_panel(self, panel):
         """
         Set the texture import panel reference for adding textures.
@@ -184,8 +416,14 @@ class ModelImportPanel:
             # Called from button, open dialog
             selected_paths = filedialog.askopenfilenames(
                 title=get_text("model_import.dialog_title", "Select Model Files"),
+                # Combined filter first, then one pattern per format for native OS dialog filtering
                 filetypes=(
                     (get_text("model_import.filetype_3d", "3D model files"), "*.fbx *.obj *.dae *.3ds *.blend"),
+                    ("FBX", "*.fbx"),
+                    ("OBJ", "*.obj"),
+                    ("DAE", "*.dae"),
+                    ("3DS", "*.3ds"),
+                    ("Blend", "*.blend"),
                     (get_text("model_import.filetype_all", "All files"), "*.*")
                 )
             )
@@ -196,9 +434,19 @@ class ModelImportPanel:
             # Called with paths provided directly
             paths_to_process = initial_file_paths
 
+        # Load each model only once, even if it was passed several times
+        unique_paths = {}
+        for path in paths_to_process:
+            unique_paths.setdefault(os.path.normcase(os.path.abspath(path)), path)
+        paths_to_process = list(unique_paths.values())
+
         if not paths_to_process:
              return
 
+        # New import session: re-validate texture paths from scratch
+        _path_exists.cache_clear()
+        self._seen_texture_paths = set()
+
         # --- Clear previous import results if started via button ---
         if initial_file_paths is None:
             self.imported_models_info.clear()
@@ -206,20 +454,14 @@ class ModelImportPanel:
             self.path_var.set("")
             self.materials_var.set("0")
             self.textures_var.set("0")
-            for item in self.tree.get_children(): # Clear last model's texture list too
-                self.tree.delete(item)
+            self._populate_treeview([]) # Clear last model's texture list too
             self.add_to_processing_button.config(state=tk.DISABLED) # Disable button
             self.parent.update()
         # --- End Clear ---
 
         # --- Setup for Background Processing ---
         self.progress_queue = queue.Queue()
-        self.progress_dialog = ProgressDialog(
-            self.parent,
-            title=get_text("model_import.progress_title", "Importing Models..."),
-            allow_cancel=True
-        )
-        self.progress_dialog.set_cancel_callback(self._cancel_import)
+        self._safe_close_progress() # Drop a dialog left over from the previous import
 
         # Start worker thread
         self.worker_thread = threading.Thread(
@@ -229,112 +471,99 @@ class ModelImportPanel:
         )
         self.worker_thread.start()
 
-        # Start checking the queue for updates
-        self.parent.after(100, self._check_progress_queue)
+        # The worker only writes to the queue; Tk is only touched from this thread, which polls it
+        self._progress_poll = self.parent.after(PROGRESS_POLL_INTERVAL, self._check_progress_queue)
+
+        # Only show a progress dialog if the import is not over almost immediately
+        self.parent.after(PROGRESS_DIALOG_DELAY_MS, self._show_progress_if_still_running)
         # --- End Setup ---
 
+    def _show_progress_if_still_running(self):
+        """
+        Creates the progress dialog once the import has run for PROGRESS_DIALOG_DELAY_MS.
+        """
+        if self.progress_dialog is not None or self.progress_queue is None:
+            return
+        if not (self.worker_thread and self.worker_thread.is_alive()):
+            return
+
+        self.progress_dialog = ProgressDialog(
+            self.parent,
+            title=get_text("model_import.progress_title", "Importing Models..."),
+            allow_cancel=True
+        )
+        self.progress_dialog.set_cancel_callback(self._cancel_import)
+
     def _worker_import_models(self, file_paths, progress_queue):
         """
         Worker thread function to load models and extract textures.
+        Models are handed to a thread pool and results are reported as they complete.
 
         Args:
             file_paths: List of model file paths to process.
             progress_queue: Queue to send progress updates back to the main thread.
         """
-        loaded_models_data = [] # Store results locally first
-        all_extracted_texture_paths = []
         total_files = len(file_paths)
+        results = [None] * total_files # Per-file results, kept in the order the files were given
+        completed_count = 0
         success_count = 0
         error_count = 0
         cancelled = False
+        last_progress_sent = 0.0
+        # Look up the progress text templates once for the whole batch
+        loading_template = get_text("model_import.progress_loading", "Loading: {filename}")
+        status_template = get_text("model_import.progress_status", "Model {current}/{total}")
 
         try:
-            for i, file_path in enumerate(file_paths):
-                # Check for cancellation flag from main thread via progress dialog state
-                # This check is done within the main thread's queue check now
-                # if progress_queue.empty() and hasattr(self, 'progress_dialog') and self.progress_dialog and self.progress_dialog.is_cancelled():
-                #      cancelled = True
-                #      progress_queue.put({"type": "cancelled"}) # Inform main thread
-                #      break # Exit loop if cancelled
-
-                progress = (i + 1) / total_files
-                filename = os.path.basename(file_path)
-                current_op_text = get_text("model_import.progress_loading", "Loading: {filename}").format(filename=filename)
-                status_text = get_text("model_import.progress_status", "Model {current}/{total}").format(current=i+1, total=total_files)
-
-                # Send progress update
-                progress_queue.put({
-                    "type": "progress",
-                    "progress": progress,
-                    "current": current_op_text,
-                    "status": status_text
-                })
-
-                # Check for cancellation *after* sending progress, before heavy work
-                if self.progress_dialog and self.progress_dialog.is_cancelled():
-                    cancelled = True
-                    break # Exit loop if cancelled
-
-                model = None
-                current_extracted_refs = []
-                model_info = { # Initialize info dict
-                    "path": file_path,
-                    "filename": filename,
-                    "materials": 0,
-                    "model_obj": None, # Store the loaded model object
-                    "extracted_textures": [] # Store accurately classified textures for this model
-                }
-
-                try:
-                    # Load model using ModelLoader
-                    model = self.model_loader.load(file_path)
-
-                    if model and not model.get("is_dummy", False):
-                        model_info["model_obj"] = model # Store the actual model object
-                        model_info["materials"] = len(model.get("materials", []))
-
-                        # Extract textures for the current model
-                        current_extracted_refs = self.texture_extractor.extract(model)
-
-                        # Get accurate types and store them with the model info
-                        accurate_textures = self._get_accurate_texture_info(current_extracted_refs)
-                        model_info["extracted_textures"] = accurate_textures
-
-                        # Collect paths to add to processing later
-                        current_texture_paths = [tex["path"] for tex in accurate_textures if tex.get("path") and os.path.exists(tex["path"])]
-                        all_extracted_texture_paths.extend(current_texture_paths)
-
+            with ThreadPoolExecutor(max_workers=max(1, min(MODEL_IMPORT_WORKERS, total_files))) as executor:
+                futures = {executor.submit(self._load_one, file_path): i for i, file_path in enumerate(file_paths)}
+
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is None: # Skipped because the import was cancelled
+                        continue
+
+                    i = futures[future]
+                    results[i] = result
+                    completed_count += 1
+                    if result[2]:
                         success_count += 1
                     else:
-                        print(f"Failed to load model or dummy model returned for: {file_path}")
-                        model_info["filename"] += get_text("model_import.load_failed_suffix", " (Load Failed)")
                         error_count += 1
 
-                except Exception as e:
-                    error_count += 1
-                    print(f"Error importing model {file_path}: {e}")
-                    model_info["filename"] += get_text("model_import.load_error_suffix", " (Error)")
-                    # Optionally add dummy model if needed downstream
-                    # loaded_models.append(self.model_loader._create_dummy_model(file_path))
-
-                loaded_models_data.append(model_info) # Add info for this model (success or fail)
-
-                # --- Attempt Memory Release (Optional/Experimental) ---
-                # Explicit memory management from threads with libraries like bpy is complex and often unsafe.
-                # Relying on Python's GC after the loop might be the most practical approach.
-                # If using assimp, check its documentation for potential cleanup functions.
-                del model # Help Python's GC, may or may not release significant memory immediately
-                # --- End Memory Release ---
-
+                    # Hand this model's textures to the main thread right away
+                    if result[1]:
+                        progress_queue.put({"type": "model_done", "texture_paths": result[1]})
+
+                    # Send progress update, throttled so a batch of small models doesn't flood Tk
+                    now = time.monotonic()
+                    if now - last_progress_sent >= PROGRESS_UPDATE_INTERVAL or completed_count == total_files:
+                        last_progress_sent = now
+                        filename = os.path.basename(file_paths[i])
+                        current_op_text = loading_template.format(filename=filename)
+                        status_text = status_template.format(current=completed_count, total=total_files)
+                        progress_queue.put({
+                            "type": "progress",
+                            "progress": completed_count / total_files,
+                            "current": current_op_text,
+                            "status": status_text
+                        })
+
+                    # Stop scheduling further models once the user cancels
+                    if self.progress_dialog and self.progress_dialog.is_cancelled():
+                        cancelled = True
+                        for pending in futures:
+                            pending.cancel()
+                        break
 
             # Send completion message
             if cancelled:
                  progress_queue.put({"type": "cancelled"})
             else:
+                loaded_models_data = [result[0] for result in results if result is not None]
                 progress_queue.put({
                     "type": "completed",
                     "results": loaded_models_data,
-                    "texture_paths": list(set(all_extracted_texture_paths)), # Unique paths
                     "success_count": success_count,
                     "error_count": error_count,
                     "total_files": total_files
@@ -345,48 +574,149 @@ class ModelImportPanel:
             print(f"Critical error in model import worker thread: {e}")
             progress_queue.put({"type": "error", "message": str(e)})
 
+    def _load_and_extract(self, file_path):
+        """
+        Loads a model and extracts its texture references.
+
+        With bpy available this runs in the model import process pool; otherwise
+        (or if the pool fails) it runs in this process under `_bpy_lock`.
+
+        Args:
+            file_path: Path to the model file
+
+        Returns:
+            Tuple of (model, texture_refs); texture_refs is None if loading failed
+        """
+        if self.model_loader.bpy is not None:
+            try:
+                return _get_model_process_pool().submit(_load_and_extract_in_process, file_path).result()
+            except BrokenProcessPool as e:
+                print(f"Model import process pool failed, importing {file_path} in-process: {e}")
+                _discard_model_process_pool()
+            except Exception as e:
+                print(f"Model import process failed for {file_path}, importing in-process: {e}")
+
+        with _bpy_lock:
+            # Load model using ModelLoader
+            model = self.model_loader.load(file_path)
+            current_extracted_refs = None
+
+            # Extract textures while the model is still the one in the Blender scene
+            if model and not model.get("is_dummy", False):
+                current_extracted_refs = tuple(self.texture_extractor.extract_iter(model))
+
+        return model, current_extracted_refs
+
+    def _load_one(self, file_path):
+        """
+        Loads a single model and classifies its textures. Runs on an import pool thread.
+
+        The Blender import and extraction step runs in a worker process (see
+        `_load_and_extract`); path resolution and classification run on this thread.
+
+        Args:
+            file_path: Path to the model file
+
+        Returns:
+            Tuple of (model_info, existing_texture_paths, loaded_successfully),
+            or None if the import was cancelled before this model was started
+        """
+        if self.progress_dialog and self.progress_dialog.is_cancelled():
+            return None
+
+        filename = os.path.basename(file_path)
+        model_info = { # Initialize info dict
+            "path": file_path,
+            "filename": filename,
+            "materials": 0,
+            "model_obj": None, # Slimmed copy of the loaded model object
+            "extracted_textures": [], # Store accurately classified textures for this model
+            "has_valid_textures": False # Whether any extracted texture exists on disk
+        }
+        current_texture_paths = []
+        loaded = False
+
+        try:
+            # Reuse the parse of an unchanged model file if it was imported before
+            cache_key = _model_cache_key(file_path)
+            cached = _get_cached_model(cache_key)
+            if cached is not None:
+                model, current_extracted_refs = cached
+            else:
+                model, current_extracted_refs = self._load_and_extract(file_path)
+                if current_extracted_refs is not None:
+                    _store_cached_model(cache_key, model, current_extracted_refs)
+
+            if model and not model.get("is_dummy", False):
+                # Keep only what MTL export reads; mesh and hierarchy data can be large.
+                # The model may have been loaded in a worker process, so its texture
+                # references are carried along rather than read back from Blender's scene.
+                model_info["model_obj"] = {key: value for key, value in model.items() if key not in MODEL_INFO_DROPPED_KEYS}
+                model_info["model_obj"]["texture_refs"] = current_extracted_refs
+                model_info["materials"] = len(model.get("materials", []))
+
+                # Get accurate types and store them with the model info
+                model_dir = os.path.dirname(os.path.abspath(file_path))
+                accurate_textures = self._get_accurate_texture_info(current_extracted_refs, model_dir)
+                model_info["extracted_textures"] = accurate_textures
+
+                # Collect unique paths (in order) to add to processing later
+                current_texture_paths = list(dict.fromkeys(tex["path"] for tex in accurate_textures if tex["exists"]))
+                model_info["has_valid_textures"] = bool(current_texture_paths)
+                loaded = True
+            else:
+                print(f"Failed to load model or dummy model returned for: {file_path}")
+                model_info["filename"] += get_text("model_import.load_failed_suffix", " (Load Failed)")
+
+        except Exception as e:
+            print(f"Error importing model {file_path}: {e}")
+            model_info["filename"] += get_text("model_import.load_error_suffix", " (Error)")
+
+        return model_info, current_texture_paths, loaded
+
 
     def _check_progress_queue(self):
         """
         Checks the queue for messages from the worker thread and updates the UI.
-        Called periodically from the main thread using `after`.
+        Runs on the main thread, rescheduled with `after` while the worker is alive.
         """
-        # Check if the dialog was closed prematurely (e.g., by user closing main window)
-        if not self.progress_dialog or not self.progress_dialog.dialog.winfo_exists():
+        if self.progress_queue is None: # Late event after the import finished
+            return
+
+        # Check if the dialog was closed prematurely (e.g., by user closing main window).
+        # No dialog at all just means it has not been shown yet.
+        if self.progress_dialog is not None and not self.progress_dialog.dialog.winfo_exists():
             self._cleanup_after_import()
             return
 
+        latest_progress = None
         try:
             while True: # Process all messages currently in the queue
                 message = self.progress_queue.get_nowait()
 
                 if message["type"] == "progress":
-                    if not self.progress_dialog.is_cancelled():
-                        self.progress_dialog.update_progress(
-                            message["progress"],
-                            current=message["current"],
-                            status=message["status"]
-                        )
+                    latest_progress = message # Only the newest progress is shown per check
+                elif message["type"] == "model_done":
+                    # Add this model's textures to the main processing panel as soon as it finishes
+                    new_paths = [path for path in message["texture_paths"] if path not in self._seen_texture_paths]
+                    self._seen_texture_paths.update(new_paths)
+                    if new_paths and self.texture_import_panel:
+                        print(f"Adding {len(new_paths)} unique extracted texture paths to processing...")
+                        self.parent.after_idle(self._drain_texture_imports, new_paths)
                 elif message["type"] == "completed":
                     # --- Final UI Updates After Successful Completion ---
                     self.imported_models_info = message["results"] # Update main list
                     self._update_model_list_display() # Update listbox
 
-                    # Add textures to main processing panel
-                    texture_paths_to_add = message["texture_paths"]
-                    if texture_paths_to_add:
-                        print(f"Adding {len(texture_paths_to_add)} unique extracted texture paths to processing...")
-                        if self.texture_import_panel:
-                            # This might still block the UI briefly if many textures are added,
-                            # consider if texture_import_panel.import_textures needs optimization too.
-                            self.texture_import_panel.import_textures(texture_paths_to_add)
-                        else:
-                            messagebox.showerror(get_text("error.title", "Error"), get_text("model_import.error_texture_panel_missing", "Texture import panel not available."))
+                    # Textures were handed to the processing panel as each model finished
+                    if self._seen_texture_paths and not self.texture_import_panel:
+                        messagebox.showerror(get_text("error.title", "Error"), get_text("model_import.error_texture_panel_missing", "Texture import panel not available."))
 
                     # Close progress dialog
-                    self.progress_dialog.show_completion(success=True)
-                    # Keep dialog open briefly?
-                    self.parent.after(1000, self._safe_close_progress) # Close after 1 sec
+                    if self.progress_dialog is not None:
+                        self.progress_dialog.show_completion(success=True)
+                        # Keep dialog open briefly?
+                        self.parent.after(1000, self._safe_close_progress) # Close after 1 sec
 
                     # Show summary message
                     summary_msg = get_text("model_import.summary_finished", "Finished importing {total} models.\nSuccessfully loaded: {success}\nErrors: {errors}").format(
@@ -414,10 +744,17 @@ class ModelImportPanel:
                     return # Stop checking queue
 
         except queue.Empty:
-            # Queue is empty, check if thread is still running
+            # Queue is drained, redraw the progress once with the newest values
+            if latest_progress is not None and self.progress_dialog is not None and not self.progress_dialog.is_cancelled():
+                self.progress_dialog.update_progress(
+                    latest_progress["progress"],
+                    current=latest_progress["current"],
+                    status=latest_progress["status"]
+                )
+
+            # Check if thread is still running
             if self.worker_thread and self.worker_thread.is_alive():
-                # Reschedule check
-                self.parent.after(100, self._check_progress_queue)
+                self._progress_poll = self.parent.after(PROGRESS_POLL_INTERVAL, self._check_progress_queue)
             else:
                 # Thread finished but no completion/error message? (Should not happen ideally)
                 print("Worker thread finished unexpectedly.")
@@ -429,6 +766,23 @@ class ModelImportPanel:
             self._safe_close_progress()
             self._cleanup_after_import() # Ensure cleanup happens
 
+    def _drain_texture_imports(self, texture_paths, start=0):
+        """
+        Feeds extracted texture paths to the texture import panel in chunks,
+        yielding to the Tk event loop between chunks via `after_idle`.
+
+        Args:
+            texture_paths: List of texture paths to import
+            start: Index of the first path of the next chunk
+        """
+        if not self.texture_import_panel:
+            return
+
+        end = start + TEXTURE_IMPORT_CHUNK_SIZE
+        self.texture_import_panel.import_textures(texture_paths[start:end], show_summary=False)
+        if end < len(texture_paths):
+            self.parent.after_idle(self._drain_texture_imports, texture_paths, end)
+
     def _cancel_import(self):
         """Callback function when the cancel button is pressed in the progress dialog."""
         print("Cancel requested by user.")
@@ -437,6 +791,9 @@ class ModelImportPanel:
 
     def _cleanup_after_import(self):
         """Resets state variables after import finishes or is cancelled/errored."""
+        if self._progress_poll is not None:
+            self.parent.after_cancel(self._progress_poll)
+            self._progress_poll = None
         self.progress_queue = None
         self.worker_thread = None
         # Don't reset self.progress_dialog here, _safe_close_progress handles it
@@ -473,7 +830,7 @@ class ModelImportPanel:
         model_info = self.imported_models_info[selected_index]
         current_model = model_info.get("model_obj")
 
-        if not current_model or current_model.get("is_dummy", False):
+        if current_model is None or current_model.get("is_dummy", False):
              messagebox.showerror(get_text("error.title", "Error"), get_text("model_import.error_no_valid_model_data", "No valid model data loaded for the selected item."))
              # print("No valid model loaded to extract textures from.")
              return [] # Return empty list
@@ -483,8 +840,10 @@ class ModelImportPanel:
             # Ideally, texture refs are stored during import. We use the stored ones.
             accurate_textures = model_info.get("extracted_textures", [])
 
-            # Populate the treeview for this model
-            self._populate_treeview(accurate_textures)
+            # Populate the treeview for this model unless it is already shown
+            if self._displayed_model_info is not model_info:
+                self._populate_treeview(accurate_textures)
+                self._displayed_model_info = model_info
 
             # Update statistics display
             self.textures_var.set(str(len(accurate_textures)))
@@ -501,39 +860,82 @@ class ModelImportPanel:
             messagebox.showerror(get_text("model_import.error_extraction_failed_title", "Extraction Error"), get_text("model_import.error_extraction_failed_msg", "Error extracting textures: {error}").format(error=e))
             return [] # Return empty list on error
 
-    def _get_accurate_texture_info(self, texture_refs):
+    def _get_accurate_texture_info(self, texture_refs, model_dir=None):
         """
-        Takes a list of TextureReference objects and returns a list of dictionaries
+        Takes an iterable of TextureReference objects and returns a list of dictionaries
         with accurately classified texture types.
+
+        Args:
+            texture_refs: Iterable of TextureReference objects
+            model_dir: Directory of the model file, used to resolve relative texture paths
         """
         accurate_textures = []
-        accurate_texture_manager = None
-        if self.texture_import_panel and hasattr(self.texture_import_panel, 'texture_manager'):
-            accurate_texture_manager = self.texture_import_panel.texture_manager
+        accurate_texture_manager = getattr(self.texture_import_panel, 'texture_manager', None)
+        # Materials often share textures, so resolve and classify each path only once
+        resolved_paths = {} # ref.path -> (abs_path, exists)
+        classified_paths = {} # abs_path -> (texture_type, base_name)
+        model_dir_files = None # normcase'd file names in model_dir, listed on first use
+        model_dir_listed = False
+
+        resolved_refs = [] # (ref, abs_path, exists) per reference
 
         for ref in texture_refs:
+            resolved = resolved_paths.get(ref.path)
+            if resolved is None:
+                abs_path = None
+                exists = None
+
+                # Resolve absolute path if possible
+                if ref.path:
+                     if os.path.isabs(ref.path):
+                         abs_path = ref.path
+                     elif model_dir is not None: # Use directory of the model file
+                         potential_path = os.path.join(model_dir, ref.path)
+                         # Bare file names are looked up in one listing of the model directory
+                         is_bare_name = os.path.basename(ref.path) == ref.path
+                         if is_bare_name and not model_dir_listed:
+                             model_dir_files = _list_dir_files(model_dir)
+                             model_dir_listed = True
+                         if is_bare_name and model_dir_files is not None:
+                             found = os.path.normcase(ref.path) in model_dir_files
+                         else:
+                             found = _path_exists(potential_path)
+                         if found:
+                             abs_path = os.path.normpath(potential_path)
+                             exists = True
+                         else: # Fallback: try relative to CWD (less likely)
+                             potential_path_cwd = os.path.join(os.getcwd(), ref.path)
+                             if _path_exists(potential_path_cwd):
+                                  abs_path = os.path.normpath(potential_path_cwd)
+                                  exists = True
+
+                # Check existence once here (in the worker) so the UI never has to stat the file
+                if exists is None:
+                    exists = abs_path is not None and _path_exists(abs_path)
+                resolved = resolved_paths[ref.path] = (abs_path, exists)
+
+            resolved_refs.append((ref, resolved[0], resolved[1]))
+
+        # Classify all existing textures with a single batch call
+        if accurate_texture_manager:
+            paths_to_classify = list(dict.fromkeys(abs_path for abs_path, exists in resolved_paths.values() if exists))
+            if paths_to_classify:
+                try:
+                    classified_paths.update(zip(paths_to_classify, accurate_texture_manager.classify_textures(paths_to_classify)))
+                except Exception as e:
+                    print(f"Warning: Batch classification failed, classifying textures individually: {e}")
+
+        for ref, abs_path, exists in resolved_refs:
             accurate_type = ref.texture_type # Default to preliminary type
             base_name = "Unknown" # Default base name
-            abs_path = None
-
-            # Resolve absolute path if possible
-            if ref.path:
-                 if os.path.isabs(ref.path):
-                     abs_path = ref.path
-                 elif self.model_loader.last_loaded_dir: # Use directory of the model file
-                     potential_path = os.path.join(self.model_loader.last_loaded_dir, ref.path)
-                     if os.path.exists(potential_path):
-                         abs_path = os.path.normpath(potential_path)
-                     else: # Fallback: try relative to CWD (less likely)
-                         potential_path_cwd = os.path.join(os.getcwd(), ref.path)
-                         if os.path.exists(potential_path_cwd):
-                              abs_path = os.path.normpath(potential_path_cwd)
 
             # Use the main texture manager for accurate classification if available and path exists
-            if accurate_texture_manager and abs_path and os.path.exists(abs_path):
+            if accurate_texture_manager and exists:
                 try:
                     # Use the absolute path for classification
-                    accurate_type, base_name = accurate_texture_manager.classify_texture(abs_path)
+                    if abs_path not in classified_paths:
+                        classified_paths[abs_path] = accurate_texture_manager.classify_texture(abs_path)
+                    accurate_type, base_name = classified_paths[abs_path]
                 except Exception as e:
                     print(f"Warning: Could not accurately classify {abs_path}: {e}")
                     accurate_type = ref.texture_type # Fallback
@@ -557,7 +959,8 @@ class ModelImportPanel:
                 "material": ref.material_name,
                 "filename": ref.filename, # Original filename from model
                 "processed_path": ref.processed_path,
-                "base_name": base_name
+                "base_name": base_name,
+                "exists": exists # Whether the resolved file exists on disk
             }
             accurate_textures.append(texture_dict)
         return accurate_textures
@@ -565,30 +968,127 @@ class ModelImportPanel:
     def _populate_treeview(self, texture_list):
         """
         Clears and populates the internal treeview with a list of texture dictionaries.
+        Callers showing a specific model set `_displayed_model_info` afterwards.
         """
-        # Clear existing textures in the treeview
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Add to treeview using the accurate type from the dictionary
-        for texture in texture_list:
-            display_path = texture.get("path", texture.get("filename", "N/A")) # Show path or filename
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    texture.get("material", "Unknown"),
-                    texture.get("type", "Unknown"), # Display the accurate type
-                    display_path
-                )
+        self._displayed_model_info = None
+
+        if not texture_list and not self._tree_rows:
+            # Already empty; the "no selection" paths clear repeatedly
+            return
+
+        # Drop the previous rows in a single call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._tree_window = range(0)
+
+        # Keep the rows as plain tuples; only the visible window is inserted
+        unknown = "Unknown"
+        self._tree_missing_rows = frozenset(i for i, texture in enumerate(texture_list) if not texture.get("exists"))
+        self._tree_rows = tuple(
+            (
+                get("material", unknown),
+                get("type", unknown), # Display the accurate type
+                get("path", get("filename", "N/A")) # Show path or filename
             )
+            for get in (texture.get for texture in texture_list)
+        )
+        self._tree_offset = 0
+        self._render_tree_window()
+
+    def _visible_tree_row_count(self):
+        """
+        Returns how many rows fit in the treeview at its current size.
+        """
+        height = self.tree.winfo_height()
+        if height <= 1: # Not mapped yet, use the configured height
+            return int(self.tree.cget("height"))
+
+        try:
+            row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        except (ValueError, tk.TclError):
+            row_height = 20
+        heading_height = row_height + 5
+        return max(1, (height - heading_height) // row_height)
+
+    def _render_tree_window(self):
+        """
+        Synchronises the treeview items with the rows in the current scroll window,
+        inserting and deleting only the rows that entered or left the view.
+        """
+        rows = self._tree_rows
+        total = len(rows)
+        visible = self._visible_tree_row_count()
+        first = max(0, min(self._tree_offset, total - visible))
+        last = min(total, first + visible)
+        self._tree_offset = first
+
+        shown = self._tree_window
+        removed = [str(i) for i in shown if i < first or i >= last]
+        if removed:
+            self.tree.delete(*removed)
+
+        wanted = range(first, last)
+        # Call the Tcl insert command directly to skip Treeview.insert's option formatting
+        tk_call = self.tree.tk.call
+        widget = self.tree._w
+        missing = self._tree_missing_rows
+        for i in wanted:
+            if i not in shown:
+                tk_call(widget, "insert", "", i - first, "-id", str(i), "-values", rows[i], "-tags", "missing" if i in missing else "")
+        self._tree_window = wanted
+
+        if total:
+            self.vsb.set(first / total, last / total)
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _on_vscroll(self, *args):
+        """
+        Scrollbar command for the virtualised treeview ("moveto" / "scroll").
+        """
+        total = len(self._tree_rows)
+        visible = self._visible_tree_row_count()
+        if args[0] == "moveto":
+            self._tree_offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = visible if args[2] == "pages" else 1
+            self._tree_offset += int(args[1]) * step
+        self._render_tree_window()
+
+    def _on_tree_mousewheel(self, event):
+        """
+        Scrolls the virtualised treeview with the mouse wheel.
+        """
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            units = -1 if event.delta > 0 else 1
+        self._on_vscroll("scroll", units * 3, "units")
+        return "break"
+
+    def _schedule_model_select(self, event):
+        """
+        Debounces <<ListboxSelect>> so rapid keyboard navigation only updates
+        the details for the model the selection settles on.
+        """
+        # Focus changes also fire <<ListboxSelect>>; drop events that don't change the selection
+        if self._model_select_after_id is None and self.models_listbox.curselection() == self._last_model_selection:
+            return
+        if self._model_select_after_id is not None:
+            self.parent.after_cancel(self._model_select_after_id)
+        self._model_select_after_id = self.parent.after(MODEL_SELECT_DEBOUNCE_MS, self._on_model_select, event)
 
     def _on_model_select(self, event):
         """
         Handles selection changes in the imported models listbox.
         Updates the info panel and texture list to reflect the selected model.
         """
+        self._model_select_after_id = None
         selected_indices = self.models_listbox.curselection()
+        self._last_model_selection = selected_indices
         if not selected_indices:
             # No selection, clear details
             self.path_var.set("")
@@ -604,6 +1104,10 @@ class ModelImportPanel:
             model_info = self.imported_models_info[selected_index]
             # model_obj = model_info.get("model_obj") # No longer need the full object here
 
+            # <<ListboxSelect>> also fires on focus changes; nothing to do if this model is already shown
+            if model_info is self._displayed_model_info:
+                return
+
             # Update info panel
             self.path_var.set(model_info.get("path", ""))
             self.materials_var.set(str(model_info.get("materials", 0)))
@@ -611,13 +1115,13 @@ class ModelImportPanel:
             # Use the stored extracted textures
             accurate_textures = model_info.get("extracted_textures", [])
             self._populate_treeview(accurate_textures)
+            self._displayed_model_info = model_info
             self.textures_var.set(str(len(accurate_textures)))
 
             # Store these textures temporarily in case "Add to Processing" is clicked
             self.currently_selected_model_textures = accurate_textures
             # Enable button if textures exist and are valid paths
-            valid_textures_exist = any(tex.get("path") and os.path.exists(tex["path"]) for tex in accurate_textures)
-            if valid_textures_exist:
+            if model_info.get("has_valid_textures"):
                 self.add_to_processing_button.config(state=tk.NORMAL)
             else:
                 self.add_to_processing_button.config(state=tk.DISABLED)
@@ -637,11 +1141,14 @@ class ModelImportPanel:
         Updates the listbox displaying imported models.
         """
         self.models_listbox.delete(0, tk.END) # Clear existing list
-        for model_info in self.imported_models_info:
-            display_text = model_info.get("filename", "Unknown Model")
-            # Optionally add more info like material count:
-            # display_text += f" (Mats: {model_info.get('materials', 0)})"
-            self.models_listbox.insert(tk.END, display_text)
+        get = dict.get # Bound once for the comprehension; entries are always dicts
+        display_texts = [get(model_info, "filename", "Unknown Model")
+                         for model_info in self.imported_models_info]
+        # Optionally add more info like material count:
+        # display_text += f" (Mats: {model_info.get('materials', 0)})"
+        if display_texts:
+            # One variadic insert instead of a Tcl call per model
+            self.models_listbox.insert(tk.END, *display_texts)
         # Select the first item by default if list is not empty
         if self.imported_models_info:
              self.models_listbox.selection_set(0)
@@ -668,8 +1175,9 @@ class ModelImportPanel:
             )
             return
 
-        # Get valid, existing texture paths from the selected model's textures
-        existing_paths = [texture["path"] for texture in textures_to_add if texture.get("path") and os.path.exists(texture["path"])]
+        # Existence was checked by the import worker, so no files are stat'ed here;
+        # unresolved textures have no path and are skipped by their exists flag
+        existing_paths = list(dict.fromkeys(texture["path"] for texture in textures_to_add if texture.get("exists")))
 
         if not existing_paths:
             messagebox.showerror(get_text("error.title", "Error"), get_text("model_import.error_no_valid_files_selected", "No valid texture files found for the selected model."))
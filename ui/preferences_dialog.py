@@ -7,11 +7,15 @@ This module provides a dialog for setting application preferences.
 """
 
 import os
+import stat
 import tkinter as tk
 from tkinter import ttk, filedialog
 from language.language_manager import get_text
 from utils.config_manager import ConfigManager
 
+# Delay before re-checking RC.exe after the path entry changes
+RC_STATUS_DEBOUNCE_MS = 150
+
 class PreferencesDialog:
     """
     Dialog for setting application preferences.
@@ -27,12 +31,23 @@ class PreferencesDialog:
         self.parent = parent
         self.result = False
         self.config_manager = ConfigManager()
+        self._rc_status_after_id = None
+        
+        # RC.exe status texts, resolved once rather than per keystroke
+        self._rc_status_texts = {
+            "not_selected": get_text("preferences.rc_not_selected", "RC.exe not selected"),
+            "not_found": get_text("preferences.rc_not_found", "RC.exe file not found"),
+            "not_file": get_text("preferences.rc_not_file", "Selected path is not a file"),
+            "not_executable": get_text("preferences.rc_not_executable", "Selected file is not executable"),
+            "not_exe": get_text("preferences.rc_not_exe", "Selected file is not an .exe file"),
+            "valid": get_text("preferences.rc_valid", "RC.exe path is valid"),
+        }
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()  # Stay hidden until all widgets are laid out
         self.dialog.title(get_text("preferences.title", "Preferences"))
         self.dialog.transient(parent)
-        self.dialog.grab_set()
         self.dialog.resizable(False, False)
         
         # Set minimum size
@@ -43,6 +58,8 @@ class PreferencesDialog:
         
         # Create UI elements
         self._init_ui()
+        self.dialog.deiconify()
+        self.dialog.grab_set()
         
         # Wait for the dialog to close
         parent.wait_window(self.dialog)
@@ -116,7 +133,7 @@ class PreferencesDialog:
         rc_status_label.grid(row=1, column=1, sticky=tk.W, padx=5, pady=(0, 10))
         
         # Connect RC path entry to update status
-        self.rc_path_var.trace_add("write", lambda name, index, mode: self._update_rc_status())
+        self.rc_path_var.trace_add("write", lambda name, index, mode: self._schedule_rc_status())
         
         # Button frame
         button_frame = ttk.Frame(main_frame)
@@ -154,25 +171,42 @@ class PreferencesDialog:
         if file_path:
             self.rc_path_var.set(file_path)
     
+    def _schedule_rc_status(self):
+        """
+        Re-check the RC.exe path once typing pauses.
+        """
+        if self._rc_status_after_id is not None:
+            self.dialog.after_cancel(self._rc_status_after_id)
+        self._rc_status_after_id = self.dialog.after(RC_STATUS_DEBOUNCE_MS, self._update_rc_status)
+    
     def _update_rc_status(self):
         """
         Update the RC.exe status label.
         """
+        self._rc_status_after_id = None
+        texts = self._rc_status_texts
         rc_path = self.rc_path_var.get()
         
         if not rc_path:
-            self.rc_status_var.set(get_text("preferences.rc_not_selected", "RC.exe not selected"))
-        elif not os.path.exists(rc_path):
-            self.rc_status_var.set(get_text("preferences.rc_not_found", "RC.exe file not found"))
-        elif not os.path.isfile(rc_path):
-            self.rc_status_var.set(get_text("preferences.rc_not_file", "Selected path is not a file"))
-        elif not os.access(rc_path, os.X_OK):
-            # Not always reliable on Windows, but try it
-            self.rc_status_var.set(get_text("preferences.rc_not_executable", "Selected file is not executable"))
+            self.rc_status_var.set(texts["not_selected"])
+            return
+        
+        # A single stat covers the exists/file/executable checks
+        try:
+            mode = os.stat(rc_path).st_mode
+        except OSError:
+            self.rc_status_var.set(texts["not_found"])
+            return
+        
+        if not stat.S_ISREG(mode):
+            self.rc_status_var.set(texts["not_file"])
+        elif os.name != "nt" and not mode & 0o111:
+            # Execute bits are meaningless on Windows
+            self.rc_status_var.set(texts["not_executable"])
         elif not rc_path.lower().endswith(".exe"):
-            self.rc_status_var.set(get_text("preferences.rc_not_exe", "Selected file is not an .exe file"))
+            self.rc_status_var.set(texts["not_exe"])
         else:
-            self.rc_status_var.set(get_text("preferences.rc_valid", "RC.exe path is valid"))
+            self.rc_status_var.set(texts["valid"])
     
     def _on_ok(self):
         """
@@ -8,15 +8,71 @@ visualizing texture processing results.
 """
 
 import os
+import collections
+import functools
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk
-from PIL import Image, ImageTk
+import numpy as np
+from PIL import Image, ImageDraw, ImageTk
+
+# Checkerboard tile size and colours for placeholder images
+PLACEHOLDER_TILE = 20
+PLACEHOLDER_LIGHT = (217, 217, 217)  # gray85
+PLACEHOLDER_DARK = (191, 191, 191)   # gray75
+
+# Scaled previews are cached per texture and canvas size bucket
+SCALED_CACHE_SIZE = 8
+SCALE_BUCKET = 32
+RESIZE_DEBOUNCE_MS = 100
+
+# Worker threads used to decode and scale preview images
+PREVIEW_LOAD_WORKERS = 2
+
+# Interval (ms) at which the main thread checks for a finished background load
+PREVIEW_LOAD_POLL_MS = 20
+
+# Previews are downscaled with BILINEAR; LANCZOS is reserved for high quality mode
+_Resampling = getattr(Image, "Resampling", Image)
+PREVIEW_RESAMPLE = _Resampling.BILINEAR
+PREVIEW_RESAMPLE_HQ = _Resampling.LANCZOS
+
+@functools.lru_cache(maxsize=64)
+def _scale_dims(width, height, canvas_width, canvas_height):
+    """
+    Fit (width, height) into the canvas size, keeping the aspect ratio.
+    
+    Returns:
+        Tuple of (scaled_width, scaled_height)
+    """
+    # Ensure minimum size
+    canvas_width = max(canvas_width, 10)
+    canvas_height = max(canvas_height, 10)
+    
+    # Calculate aspect ratios
+    image_ratio = width / height
+    canvas_ratio = canvas_width / canvas_height
+    
+    if image_ratio > canvas_ratio:
+        # Image is wider than canvas
+        scaled_width = canvas_width
+        scaled_height = max(1, int(scaled_width / image_ratio))
+    else:
+        # Image is taller than canvas
+        scaled_height = canvas_height
+        scaled_width = max(1, int(scaled_height * image_ratio))
+    
+    return int(scaled_width), int(scaled_height)
+
 
 class PreviewPanel:
     """
     UI panel for texture preview and comparison.
     """
     
+    # Placeholder PhotoImages keyed by (width, height, text)
+    _placeholder_cache = {}
+    
     def __init__(self, parent):
         """
         Initialize the preview panel.
@@ -27,8 +83,13 @@ class PreviewPanel:
         self.parent = parent
         self.current_texture = None
         self.original_image = None
-        self.processed_image = None
-        self.original_pil_image = None  # Store the PIL image to prevent garbage collection
+        self._scaled_cache = collections.OrderedDict()
+        self._resize_after_id = None
+        self._io_pool = ThreadPoolExecutor(max_workers=PREVIEW_LOAD_WORKERS)
+        self._load_token = 0  # Incremented per request so stale loads are dropped
+        self._preview_item = None  # Canvas item currently shown and what it was drawn from
+        self._drawn_image = None
+        self._drawn_center = None
         
         # Create frame
         self.frame = parent
@@ -88,9 +149,30 @@ class PreviewPanel:
         Args:
             event: Event object
         """
-        # Update preview to fit new size
+        # Only redraw once the user stops resizing
+        if self._resize_after_id is not None:
+            self.canvas.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.canvas.after(RESIZE_DEBOUNCE_MS, self._on_resize_settled)
+    
+    def _on_resize_settled(self):
+        """
+        Redraw the preview after a burst of resize events.
+        """
+        self._resize_after_id = None
         self._update_preview()
     
+    def _get_target_size(self):
+        """
+        Get the canvas size used for scaling, rounded down to a bucket.
+        
+        Returns:
+            Tuple of (target_width, target_height)
+        """
+        canvas_width = max(self.canvas.winfo_width(), 300)
+        canvas_height = max(self.canvas.winfo_height(), 300)
+        return (canvas_width - canvas_width % SCALE_BUCKET,
+                canvas_height - canvas_height % SCALE_BUCKET)
+    
     def set_textures(self, textures):
         """
         Set available textures for preview.
@@ -113,6 +195,7 @@ class PreviewPanel:
             texture: Texture object to preview
         """
         self.current_texture = texture
+        self._load_token += 1
         
         if texture is None:
             # Clear preview
@@ -120,57 +203,131 @@ class PreviewPanel:
             self.type_var.set("")
             self.dimensions_var.set("")
             self.original_image = None
-            self.processed_image = None
-            self.original_pil_image = None
             self._update_preview()
             return
         
         # Update info
-        self.name_var.set(os.path.basename(texture.get("path", "")))
+        self.name_var.set(texture.get("filename") or os.path.basename(texture.get("path", "")))
         self.type_var.set(texture.get("type", "Unknown"))
         
-        # Clear existing images
-        self.original_image = None
-        self.processed_image = None
-        
         # Load the actual image
         try:
             file_path = texture.get("path", "")
-            if not os.path.exists(file_path):
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except OSError:
                 raise FileNotFoundError(f"File not found: {file_path}")
-                
-            # Load image using PIL
-            pil_image = Image.open(file_path)
-            self.original_pil_image = pil_image
             
-            # Update dimensions info
-            self.dimensions_var.set(f"{pil_image.width} x {pil_image.height}")
+            target_size = self._get_target_size()
+            cache_key = (file_path, mtime, target_size)
+            cached = self._scaled_cache.get(cache_key)
+            if cached is None:
+                # Decode and scale off the main thread, keep showing the previous image meanwhile
+                self.dimensions_var.set("Loading...")
+                token = self._load_token
+                future = self._io_pool.submit(self._load_worker, file_path, target_size)
+                # Tk may only be called from the main thread, so it polls the future
+                self.canvas.after(PREVIEW_LOAD_POLL_MS, self._poll_load, future, token, cache_key)
+                return
+            
+            self._scaled_cache.move_to_end(cache_key)
+            self.original_image, dimensions = cached
+            self.dimensions_var.set(dimensions)
+            
+        except Exception as e:
+            print(f"Error loading image: {e}")
+            self.original_image = self._create_placeholder(300, 300, "Error")
+            self.dimensions_var.set("Error loading image")
+        
+        # Update preview
+        self._update_preview()
+    
+    def _load_worker(self, file_path, target_size):
+        """
+        Open and scale an image in a worker thread.
+        
+        Args:
+            file_path: Path to the image file
+            target_size: (width, height) to fit into
+            
+        Returns:
+            Tuple of (scaled PIL Image or None, dimensions text)
+        """
+        # Only the scaled copy is kept; the full-resolution image and file are released here.
+        # PIL's decompression bomb limit stays in force; images beyond it are not previewed.
+        try:
+            pil_image = Image.open(file_path)
+        except Image.DecompressionBombError as e:
+            print(f"Image too large to preview: {e}")
+            return None, "Image too large to preview"
+        with pil_image:
+            dimensions = f"{pil_image.width} x {pil_image.height}"
+            # Scaling drafts and decodes the image before the file is closed
+            scaled_image = self._create_scaled_image(pil_image, target_size)
+        return scaled_image, dimensions
+    
+    def _poll_load(self, future, token, cache_key):
+        """
+        Wait on the main thread for a background load to finish.
+        
+        Args:
+            future: Future returned by the load worker
+            token: Load token at submission time
+            cache_key: Key to store the scaled image under
+        """
+        if token != self._load_token:
+            # The user already picked a different texture
+            return
+        if not future.done():
+            self.canvas.after(PREVIEW_LOAD_POLL_MS, self._poll_load, future, token, cache_key)
+            return
+        self._finish_load(future, token, cache_key)
+    
+    def _finish_load(self, future, token, cache_key):
+        """
+        Display a finished background load on the main thread.
+        
+        Args:
+            future: Future returned by the load worker
+            token: Load token at submission time
+            cache_key: Key to store the scaled image under
+        """
+        if token != self._load_token:
+            # The user already picked a different texture
+            return
+        
+        try:
+            scaled_image, dimensions = future.result()
+            self.dimensions_var.set(dimensions)
             
             # Create PhotoImage for display
-            scaled_image = self._create_scaled_image(pil_image)
             if scaled_image:
                 self.original_image = ImageTk.PhotoImage(scaled_image)
+                self._scaled_cache[cache_key] = (self.original_image, dimensions)
+                if len(self._scaled_cache) > SCALED_CACHE_SIZE:
+                    self._scaled_cache.popitem(last=False)
             else:
                 self.original_image = self._create_placeholder(300, 300, "Error")
             
-            # Create processed image (for now, just a copy of original)
-            self.processed_image = self.original_image
-            
         except Exception as e:
             print(f"Error loading image: {e}")
             self.original_image = self._create_placeholder(300, 300, "Error")
-            self.processed_image = self._create_placeholder(300, 300, "Error")
             self.dimensions_var.set("Error loading image")
         
         # Update preview
         self._update_preview()
     
-    def _create_scaled_image(self, pil_image):
+    def _create_scaled_image(self, pil_image, target_size=None, high_quality=False):
         """
         Create a scaled version of the PIL image to fit the canvas.
         
+        Downscaling happens in place on pil_image, so pass a freshly
+        opened image rather than one that is still needed at full size.
+        
         Args:
             pil_image: PIL Image object
+            target_size: (width, height) to fit into (optional)
+            high_quality: Use LANCZOS instead of BILINEAR resampling
             
         Returns:
             Scaled PIL Image object
@@ -179,24 +336,32 @@ class PreviewPanel:
             return None
             
         try:
-            # Get canvas dimensions
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
+            # Get canvas dimensions (at least 300x300)
+            if target_size is None:
+                target_size = self._get_target_size()
+            canvas_width, canvas_height = target_size
             
-            # Use at least 300x300 if canvas is too small
-            canvas_width = max(canvas_width, 300)
-            canvas_height = max(canvas_height, 300)
+            if pil_image.width <= canvas_width and pil_image.height <= canvas_height:
+                # Already fits: show at native size instead of upscaling
+                if pil_image.mode in ("RGB", "RGBA", "LA"):
+                    pil_image.load()
+                    return pil_image
+                return pil_image.convert("RGB")
             
             # Calculate scaled dimensions
             width, height = self._get_scaled_dimensions(pil_image.width, pil_image.height, canvas_width, canvas_height)
             
-            # Resize image (use LANCZOS for best quality)
-            if pil_image.mode in ["RGBA", "LA"]:
-                # Handle images with alpha channel
-                return pil_image.resize((width, height), Image.LANCZOS)
-            else:
-                # Convert other modes to RGB
-                return pil_image.convert("RGB").resize((width, height), Image.LANCZOS)
+            resample = PREVIEW_RESAMPLE_HQ if high_quality else PREVIEW_RESAMPLE
+            
+            # Let the JPEG decoder reduce the image while decoding (no-op for other formats)
+            pil_image.draft("RGB", (width, height))
+            
+            # Keep alpha channels, convert other modes to RGB
+            if pil_image.mode not in ("RGB", "RGBA", "LA"):
+                pil_image = pil_image.convert("RGB")
+            
+            pil_image.thumbnail((width, height), resample)
+            return pil_image
                 
         except Exception as e:
             print(f"Error creating scaled image: {e}")
@@ -220,47 +385,43 @@ class PreviewPanel:
         if canvas_height is None:
             canvas_height = self.canvas.winfo_height()
         
-        # Ensure minimum size
-        canvas_width = max(canvas_width, 10)
-        canvas_height = max(canvas_height, 10)
-        
-        # Calculate aspect ratios
-        image_ratio = width / height
-        canvas_ratio = canvas_width / canvas_height
-        
-        if image_ratio > canvas_ratio:
-            # Image is wider than canvas
-            scaled_width = canvas_width
-            scaled_height = max(1, int(scaled_width / image_ratio))
-        else:
-            # Image is taller than canvas
-            scaled_height = canvas_height
-            scaled_width = max(1, int(scaled_height * image_ratio))
-        
-        return int(scaled_width), int(scaled_height)
+        return _scale_dims(width, height, canvas_width, canvas_height)
     
     def _update_preview(self):
         """
         Update the preview display with the current texture.
         """
+        cx = self.canvas.winfo_width() // 2
+        cy = self.canvas.winfo_height() // 2
+        image = self.original_image or None
+        
+        if self._preview_item is not None and self._drawn_image is image:
+            # Same content: skip the redraw, or just move it if the canvas was resized
+            if self._drawn_center != (cx, cy):
+                self.canvas.coords(self._preview_item, cx, cy)
+                self._drawn_center = (cx, cy)
+            return
+        
         # Clear canvas
         self.canvas.delete("all")
+        self._drawn_image = image
+        self._drawn_center = (cx, cy)
         
-        if not self.original_image:
+        if image is None:
             # No image to display
-            self.canvas.create_text(
-                self.canvas.winfo_width() // 2,
-                self.canvas.winfo_height() // 2,
+            self._preview_item = self.canvas.create_text(
+                cx,
+                cy,
                 text="No texture selected",
                 font=("Arial", 12)
             )
             return
         
         # Always show original image since we removed the view mode selection
-        self.canvas.create_image(
-            self.canvas.winfo_width() // 2,
-            self.canvas.winfo_height() // 2,
-            image=self.original_image,
+        self._preview_item = self.canvas.create_image(
+            cx,
+            cy,
+            image=image,
             anchor=tk.CENTER
         )
     
@@ -276,15 +437,32 @@ class PreviewPanel:
         Returns:
             PhotoImage object
         """
-        # Create a PhotoImage
-        placeholder = tk.PhotoImage(width=width, height=height)
-        
-        # Fill with checkerboard pattern (simple placeholder)
-        for x in range(width):
-            for y in range(height):
-                color = "gray85" if (x // 20 + y // 20) % 2 == 0 else "gray75"
-                placeholder.put(color, (x, y))
+        key = (width, height, text)
+        cached = self._placeholder_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Build the checkerboard in one vectorized pass
+        yy, xx = np.indices((height, width))
+        dark = ((yy // PLACEHOLDER_TILE + xx // PLACEHOLDER_TILE) & 1).astype(bool)
+        pixels = np.where(
+            dark[..., None],
+            np.array(PLACEHOLDER_DARK, dtype=np.uint8),
+            np.array(PLACEHOLDER_LIGHT, dtype=np.uint8)
+        )
+        image = Image.fromarray(pixels, "RGB")
+        draw = ImageDraw.Draw(image)
+        
+        if text:
+            left, top, right, bottom = draw.textbbox((0, 0), text)
+            draw.text(
+                ((width - (right - left)) // 2, (height - (bottom - top)) // 2),
+                text,
+                fill=(0, 0, 0)
+            )
         
+        placeholder = ImageTk.PhotoImage(image)
+        self._placeholder_cache[key] = placeholder
         return placeholder
     
     def compare_original_and_processed(self, original, processed):
@@ -295,8 +473,5 @@ class PreviewPanel:
             original: Original texture object
             processed: Processed texture object (not used)
         """
-        # Set current texture
+        # Set current texture (this also refreshes the preview)
         self.set_current_texture(original)
-        
-        # Update preview
-        self._update_preview()
@@ -7,10 +7,14 @@ This module provides a progress dialog UI component to display
 progress information during lengthy operations.
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk
 from language.language_manager import get_text
 
+# Minimum time between repaints triggered by progress updates (~30 Hz)
+PAINT_INTERVAL = 0.033
+
 class ProgressDialog:
     """
     Progress dialog UI component.
@@ -27,12 +31,20 @@ class ProgressDialog:
         """
         self.parent = parent
         self.cancelled = False
+        self._last_paint = 0.0
+        self._dirty = False  # Set when labels changed since the last repaint
+        self._flush_pending = False
+        
+        # Resolve fixed texts once instead of on every update
+        self._txt_preparing = get_text("progress.preparing", "Preparing...")
+        self._txt_complete = get_text("progress.complete", "Operation complete")
+        self._txt_failed = get_text("progress.failed", "Operation failed")
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()  # Stay hidden until all widgets are packed
         self.dialog.title(title or get_text("progress.title", "Processing..."))
         self.dialog.transient(parent)
-        self.dialog.grab_set()
         self.dialog.resizable(False, False)
         
         # Set minimum size
@@ -66,7 +78,7 @@ class ProgressDialog:
         self.progress_bar.pack(fill=tk.X, pady=(0, 10))
         
         # Current operation label
-        self.current_var = tk.StringVar(value=get_text("progress.preparing", "Preparing..."))
+        self.current_var = tk.StringVar(value=self._txt_preparing)
         self.current_label = ttk.Label(
             self.main_frame,
             textvariable=self.current_var
@@ -114,8 +126,11 @@ class ProgressDialog:
         # Prevent window close button
         self.dialog.protocol("WM_DELETE_WINDOW", self._on_close_request)
         
-        # Update UI
-        self.dialog.update()
+        # Show the fully built dialog with a single geometry pass; input
+        # events are left for the caller's first progress update
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.dialog.update_idletasks()
 
     def update_stage(self, stage_text):
         """
@@ -125,7 +140,11 @@ class ProgressDialog:
             stage_text: Text to display for the current stage
         """
         self.stage_var.set(stage_text)
-        self.dialog.update() # Ensure immediate update
+        # Usually followed by update_progress, which repaints both at once
+        self._dirty = True
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.dialog.after_idle(self._flush)
     
     def _center_window(self):
         """
@@ -169,6 +188,28 @@ class ProgressDialog:
             self.status_var.set(status)
         
         # Update UI
+        self._dirty = True
+        self._flush(force=progress >= 1.0)
+    
+    def _flush(self, force=False):
+        """
+        Repaint pending changes, at most once per PAINT_INTERVAL unless forced.
+        
+        A full update() is kept rather than update_idletasks() because
+        callers running on the Tk thread rely on it to service the
+        Cancel button.
+        
+        Args:
+            force: Repaint even if the last repaint was recent
+        """
+        self._flush_pending = False
+        if not self._dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_paint < PAINT_INTERVAL:
+            return
+        self._last_paint = now
+        self._dirty = False
         self.dialog.update()
     
     def set_cancel_callback(self, callback):
@@ -215,9 +256,9 @@ class ProgressDialog:
         
         # Update current text
         if success:
-            self.current_var.set(get_text("progress.complete", "Operation complete"))
+            self.current_var.set(self._txt_complete)
         else:
-            self.current_var.set(get_text("progress.failed", "Operation failed"))
+            self.current_var.set(self._txt_failed)
         
         # Hide cancel button if exists
         if hasattr(self, 'cancel_button'):
@@ -232,7 +273,8 @@ class ProgressDialog:
                 self.close_button.pack(side=tk.RIGHT, pady=(10, 0))
         
         # Update UI
-        self.dialog.update()
+        self._dirty = True
+        self._flush(force=True)
     
     def is_complete(self):
         """
@@ -7,10 +7,59 @@ This module provides a dialog for configuring texture type suffix settings.
 """
 
 import os
+import copy
 import json
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk, messagebox
 
+# Use orjson for settings file I/O when available; both backends read and write compact UTF-8 bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Default suffixes used when no settings file exists
+DEFAULT_SUFFIX_SETTINGS = {
+    "diffuse": ["diff", "diffuse", "albedo", "basecolor", "color", "col", "_d"],
+    "normal": ["normal", "nrm", "norm", "_n"],
+    "specular": ["spec", "specular", "_s"],
+    "glossiness": ["gloss", "glossy", "glossiness", "smoothness", "_g"],
+    "roughness": ["rough", "roughness", "_r"],
+    "displacement": ["disp", "displacement", "height", "bump", "_h"],
+    "metallic": ["metal", "metallic", "metalness", "_m"],
+    "ao": ["ao", "ambient", "occlusion"],
+    "alpha": ["alpha", "opacity", "transparency", "_a"],
+    "emissive": ["emissive", "emission", "glow", "_e"],
+    "sss": ["sss", "subsurface"],
+    "removable_suffixes": ["2k", "4k", "8k", "dx", "gl", "directx", "opengl"]
+}
+
+# Texture types shown in the dialog, in display order
+TEXTURE_TYPE_LABELS = (
+    ("diffuse", "Diffuse/Albedo"),
+    ("normal", "Normal Maps"),
+    ("specular", "Specular Maps"),
+    ("glossiness", "Glossiness Maps"),
+    ("roughness", "Roughness Maps"),
+    ("displacement", "Displacement/Height Maps"),
+    ("metallic", "Metallic Maps"),
+    ("ao", "Ambient Occlusion Maps"),
+    ("alpha", "Alpha/Transparency Maps"),
+    ("emissive", "Emissive/Glow Maps"),
+    ("sss", "Subsurface Scattering Maps"),
+    ("removable_suffixes", "Removable Suffixes (dx, gl, etc.)")
+)
+
+# Parsed settings files keyed by path -> {"mtime": ..., "size": ..., "data": ...}
+_SETTINGS_CACHE = {}
+
 class SuffixSettingsDialog:
     """
     Dialog for configuring texture type suffix settings.
@@ -59,9 +108,25 @@ class SuffixSettingsDialog:
         )
         instruction.pack(fill=tk.X, pady=(0, 10))
         
+        # Toggle between per-type entries and editing the whole settings as JSON
+        self.json_mode_var = tk.BooleanVar(value=False)
+        json_toggle = ttk.Checkbutton(
+            main_frame,
+            text="Edit as JSON",
+            variable=self.json_mode_var,
+            command=self._toggle_json_mode
+        )
+        json_toggle.pack(anchor=tk.W, pady=(0, 10))
+        
+        # Container for the entry fields, swapped out in JSON mode
+        self.fields_frame = ttk.Frame(main_frame)
+        self.fields_frame.pack(fill=tk.BOTH, expand=True)
+        self.json_frame = None  # Created on first switch to JSON mode
+        self.json_text = None
+        
         # Create scrollable frame for suffix entries
-        canvas = tk.Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(self.fields_frame)
+        scrollbar = ttk.Scrollbar(self.fields_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
         scrollable_frame.bind(
@@ -79,24 +144,9 @@ class SuffixSettingsDialog:
         self.entries = {}
         row = 0
         
-        # Define texture types and default suffixes
-        texture_types = [
-            ("diffuse", "Diffuse/Albedo"),
-            ("normal", "Normal Maps"),
-            ("specular", "Specular Maps"),
-            ("glossiness", "Glossiness Maps"),
-            ("roughness", "Roughness Maps"),
-            ("displacement", "Displacement/Height Maps"),
-            ("metallic", "Metallic Maps"),
-            ("ao", "Ambient Occlusion Maps"),
-            ("alpha", "Alpha/Transparency Maps"),
-            ("emissive", "Emissive/Glow Maps"),
-            ("sss", "Subsurface Scattering Maps"),
-            ("removable_suffixes", "Removable Suffixes (dx, gl, etc.)")
-        ]
         
         # Create entry for each texture type
-        for type_key, type_label in texture_types:
+        for type_key, type_label in TEXTURE_TYPE_LABELS:
             ttk.Label(scrollable_frame, text=f"{type_label}:").grid(
                 row=row, column=0, sticky=tk.W, padx=5, pady=5
             )
@@ -131,32 +181,27 @@ class SuffixSettingsDialog:
         """
         settings_file = self._get_settings_file()
         
-        # Default settings
-        default_settings = {
-            "diffuse": ["diff", "diffuse", "albedo", "basecolor", "color", "col", "_d"],
-            "normal": ["normal", "nrm", "norm", "_n"],
-            "specular": ["spec", "specular", "_s"],
-            "glossiness": ["gloss", "glossy", "glossiness", "smoothness", "_g"],
-            "roughness": ["rough", "roughness", "_r"],
-            "displacement": ["disp", "displacement", "height", "bump", "_h"],
-            "metallic": ["metal", "metallic", "metalness", "_m"],
-            "ao": ["ao", "ambient", "occlusion"],
-            "alpha": ["alpha", "opacity", "transparency", "_a"],
-            "emissive": ["emissive", "emission", "glow", "_e"],
-            "sss": ["sss", "subsurface"],
-            "removable_suffixes": ["2k", "4k", "8k", "dx", "gl", "directx", "opengl"]
-        }
-        
         # Try to load settings from file
         try:
-            if os.path.exists(settings_file):
-                with open(settings_file, 'r') as f:
-                    self.settings = json.load(f)
-            else:
-                self.settings = default_settings
+            st = os.stat(settings_file)
+            cached = _SETTINGS_CACHE.get(settings_file)
+            if cached and cached["mtime"] == st.st_mtime_ns and cached["size"] == st.st_size:
+                # Unchanged since the last open, skip the read and parse
+                self.settings = copy.deepcopy(cached["data"])
+                return
+            
+            # Single read of the raw bytes; json decodes UTF-8 itself
+            self.settings = _json_loads(Path(settings_file).read_bytes())
+            _SETTINGS_CACHE[settings_file] = {
+                "mtime": st.st_mtime_ns,
+                "size": st.st_size,
+                "data": copy.deepcopy(self.settings)
+            }
+        except FileNotFoundError:
+            self.settings = copy.deepcopy(DEFAULT_SUFFIX_SETTINGS)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load suffix settings: {e}")
-            self.settings = default_settings
+            self.settings = copy.deepcopy(DEFAULT_SUFFIX_SETTINGS)
     
     def _save_settings(self):
         """
@@ -164,21 +209,37 @@ class SuffixSettingsDialog:
         """
         settings_file = self._get_settings_file()
         
-        # Collect settings from entries
-        new_settings = {}
-        for type_key, entry in self.entries.items():
-            # Get suffixes from entry, split by comma, and strip whitespace
-            suffixes = [suffix.strip() for suffix in entry.get().split(",") if suffix.strip()]
-            new_settings[type_key] = suffixes
+        # Collect settings from the JSON text or the entries
+        if self.json_mode_var.get():
+            new_settings = self._parse_json_text()
+            if new_settings is None:
+                return
+        else:
+            new_settings = self._collect_entries()
+        
+        # Nothing to write if the file already holds these suffixes; order is kept, as it sets match priority
+        if os.path.exists(settings_file) and new_settings == self.settings:
+            self.result = True
+            self.dialog.destroy()
+            return
         
         # Save settings to file
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(settings_file), exist_ok=True)
             
-            # Write settings to file
-            with open(settings_file, 'w') as f:
-                json.dump(new_settings, f, indent=4)
+            # Write settings to a temporary file and swap it in, so a failed write never leaves a truncated file
+            tmp_file = settings_file + ".tmp"
+            Path(tmp_file).write_bytes(_json_dumps(new_settings))
+            os.replace(tmp_file, settings_file)
+            
+            # Keep the cache in step so the next open doesn't re-read the file
+            st = os.stat(settings_file)
+            _SETTINGS_CACHE[settings_file] = {
+                "mtime": st.st_mtime_ns,
+                "size": st.st_size,
+                "data": copy.deepcopy(new_settings)
+            }
             
             self.settings = new_settings
             self.result = True
@@ -186,6 +247,84 @@ class SuffixSettingsDialog:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save suffix settings: {e}")
     
+    def _collect_entries(self):
+        """
+        Collect settings from the per-type entry fields.
+        
+        Returns:
+            Dict mapping type keys to suffix lists
+        """
+        new_settings = {}
+        for type_key, entry in self.entries.items():
+            # Get suffixes from entry, split by comma, and strip whitespace
+            suffixes = [suffix.strip() for suffix in entry.get().split(",") if suffix.strip()]
+            new_settings[type_key] = suffixes
+        return new_settings
+    
+    def _parse_json_text(self):
+        """
+        Parse and validate the settings in the JSON editor.
+        
+        Returns:
+            Dict mapping type keys to suffix lists, or None if invalid (an error is shown)
+        """
+        try:
+            data = json.loads(self.json_text.get("1.0", tk.END))
+        except json.JSONDecodeError as e:
+            messagebox.showerror("Error", f"Invalid JSON: {e}", parent=self.dialog)
+            return None
+        
+        if not isinstance(data, dict):
+            messagebox.showerror("Error", "Suffix settings must be a JSON object.", parent=self.dialog)
+            return None
+        
+        unknown_keys = [key for key in data if key not in self.entries]
+        if unknown_keys:
+            messagebox.showerror("Error", f"Unknown texture types: {', '.join(unknown_keys)}", parent=self.dialog)
+            return None
+        
+        for key, value in data.items():
+            if not isinstance(value, list) or not all(isinstance(suffix, str) for suffix in value):
+                messagebox.showerror("Error", f"Suffixes for '{key}' must be a list of strings.", parent=self.dialog)
+                return None
+        
+        # Missing types behave like an empty entry field
+        return {
+            type_key: [suffix.strip() for suffix in data.get(type_key, []) if suffix.strip()]
+            for type_key in self.entries
+        }
+    
+    def _toggle_json_mode(self):
+        """
+        Switch between the per-type entry fields and the JSON editor, carrying edits across.
+        """
+        if self.json_mode_var.get():
+            if self.json_frame is None:
+                self.json_frame = ttk.Frame(self.fields_frame.master)
+                self.json_text = tk.Text(self.json_frame, wrap=tk.NONE, undo=True)
+                json_scrollbar = ttk.Scrollbar(self.json_frame, orient="vertical", command=self.json_text.yview)
+                self.json_text.configure(yscrollcommand=json_scrollbar.set)
+                self.json_text.pack(side="left", fill="both", expand=True)
+                json_scrollbar.pack(side="right", fill="y")
+            
+            self.json_text.delete("1.0", tk.END)
+            self.json_text.insert("1.0", json.dumps(self._collect_entries(), indent=2))
+            self.fields_frame.pack_forget()
+            self.json_frame.pack(fill=tk.BOTH, expand=True)
+            self.json_text.focus_set()
+        else:
+            new_settings = self._parse_json_text()
+            if new_settings is None:
+                # Stay in JSON mode until the text is fixed
+                self.json_mode_var.set(True)
+                return
+            
+            for type_key, entry in self.entries.items():
+                entry.delete(0, tk.END)
+                entry.insert(0, ", ".join(new_settings[type_key]))
+            self.json_frame.pack_forget()
+            self.fields_frame.pack(fill=tk.BOTH, expand=True)
+    
     def _get_settings_file(self):
         """
         Get the path to the suffix settings file.
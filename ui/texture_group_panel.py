@@ -7,9 +7,125 @@ This module provides UI components for displaying and managing texture groups.
 """
 
 import os
+import re
 import tkinter as tk
 from tkinter import ttk
 
+# Delay before selection changes update the details, so held arrow keys only update once
+SELECT_DEBOUNCE_MS = 50
+
+# Filename hints used to suggest a type for unknown textures, checked in order;
+# each entry is a substring alternation matched in a single regex scan
+_TYPE_HINTS = tuple(
+    (texture_type, re.compile("|".join(map(re.escape, hints))))
+    for texture_type, hints in (
+        ("normal", ("_n", "normal", "norm")),
+        ("specular", ("_s", "spec")),
+        ("glossiness", ("_g", "gloss")),
+        ("roughness", ("_r", "rough")),
+        ("displacement", ("_h", "height", "disp")),
+        ("metallic", ("_m", "metal")),
+        ("ao", ("_ao", "ambient", "occl")),
+        ("emissive", ("_e", "emiss", "glow")),
+        ("sss", ("_sss", "subsurf")),
+        ("arm", ("_arm",)),
+    )
+)
+
+def _suggest_type(filename):
+    """
+    Suggest a texture type from a lowercase filename.
+    
+    Args:
+        filename: Lowercase file name
+        
+    Returns:
+        Suggested texture type, "diffuse" if nothing matches
+    """
+    for texture_type, pattern in _TYPE_HINTS:
+        if pattern.search(filename):
+            return texture_type
+    return "diffuse"
+
+
+def _annotate_unknown(texture):
+    """
+    Cache the basename and suggested type on an unknown texture dict.
+    
+    Args:
+        texture: Texture dictionary
+        
+    Returns:
+        The same texture dictionary
+    """
+    if "_basename" not in texture:
+        basename = texture.get("filename") or os.path.basename(texture.get("path", ""))
+        texture["_basename"] = basename
+        texture["_suggested_type"] = _suggest_type(basename.lower())
+    return texture
+
+
+class _GroupView:
+    """
+    Uniform view of a texture group, built once from either a TextureGroup
+    object or a legacy group dictionary.
+    """
+    
+    __slots__ = ("base_name", "textures", "unknowns", "legacy_textures", "types_str", "unknown_summary")
+    
+    def __init__(self, group):
+        """
+        Wrap a texture group.
+        
+        Args:
+            group: TextureGroup object or legacy group dictionary
+        """
+        # Handle both TextureGroup objects and dictionaries, once
+        if hasattr(group, 'base_name'):
+            # It's a TextureGroup object; textures and unknowns are the group's own containers
+            self.base_name = group.base_name
+            self.textures = group.textures
+            self.unknowns = group.textures.get("unknown", [])
+            self.legacy_textures = None
+        else:
+            # It's still a dictionary (for compatibility)
+            self.base_name = group.get("base_name", "Unknown")
+            self.textures = None
+            self.unknowns = []
+            self.legacy_textures = group.get("textures", [])
+        self.refresh()
+    
+    def refresh(self):
+        """
+        Recompute the display strings after the group changed.
+        """
+        if self.textures is not None:
+            texture_types = [texture_type for texture_type, texture in self.textures.items()
+                             if texture_type != "unknown" and texture is not None]
+        else:
+            texture_types = [texture.get("type", "unknown") for texture in self.legacy_textures]
+        self.types_str = ", ".join(texture_types)
+        self.unknown_summary = "" if not self.unknowns else f"{len(self.unknowns)} unknown"
+    
+    def all_textures(self):
+        """
+        Get every texture in the group, known types first, then unknowns.
+        
+        Returns:
+            List of texture dictionaries
+        """
+        if self.textures is None:
+            return self.legacy_textures
+        
+        all_textures = []
+        for texture_type, texture in self.textures.items():
+            if texture_type != "unknown" and texture is not None:
+                all_textures.append(texture)
+            elif texture_type == "unknown":
+                all_textures.extend(texture)  # Unknown is a list
+        return all_textures
+
+
 class TextureGroupPanel:
     """
     UI panel for displaying and managing texture groups.
@@ -24,6 +140,9 @@ class TextureGroupPanel:
         """
         self.parent = parent
         self.texture_groups = []  # List to store grouped textures
+        self._group_views = []  # _GroupView per group, same order as texture_groups
+        self._select_after_id = None  # Pending debounced `_on_group_select` call
+        self._unknown_select_after_id = None  # Pending debounced `_on_unknown_select` call
         self.preview_panel = None
         
         # Create frame
@@ -80,7 +199,7 @@ class TextureGroupPanel:
         
         # Bind double click event
         self.tree.bind("<Double-1>", self._on_group_double_click)
-        self.tree.bind("<<TreeviewSelect>>", self._on_group_select)
+        self.tree.bind("<<TreeviewSelect>>", self._schedule_group_select)
         
         # Create group details frame
         details_frame = ttk.LabelFrame(main_frame, text="Group Details")
@@ -125,7 +244,7 @@ class TextureGroupPanel:
         classify_button.pack(side=tk.LEFT, padx=5)
         
         # Bind selection events
-        self.unknown_list.bind('<<ListboxSelect>>', self._on_unknown_select)
+        self.unknown_list.bind('<<ListboxSelect>>', self._schedule_unknown_select)
     
     def set_preview_panel(self, preview_panel):
         """
@@ -136,6 +255,29 @@ class TextureGroupPanel:
         """
         self.preview_panel = preview_panel
     
+    def _schedule_group_select(self, event):
+        """
+        Debounce group selection so rapid keyboard navigation only updates
+        the details for the group the selection settles on.
+        
+        Args:
+            event: Event object
+        """
+        if self._select_after_id is not None:
+            self.tree.after_cancel(self._select_after_id)
+        self._select_after_id = self.tree.after(SELECT_DEBOUNCE_MS, self._on_group_select, event)
+    
+    def _schedule_unknown_select(self, event):
+        """
+        Debounce unknown texture selection the same way as group selection.
+        
+        Args:
+            event: Event object
+        """
+        if self._unknown_select_after_id is not None:
+            self.unknown_list.after_cancel(self._unknown_select_after_id)
+        self._unknown_select_after_id = self.unknown_list.after(SELECT_DEBOUNCE_MS, self._on_unknown_select, event)
+    
     def _on_group_select(self, event):
         """
         Handle group selection event.
@@ -143,50 +285,29 @@ class TextureGroupPanel:
         Args:
             event: Event object
         """
+        self._select_after_id = None
         # Get selected item
         selected_items = self.tree.selection()
         if not selected_items:
             return
         
         # Get group data from selection
-        item = selected_items[0]
-        group_idx = int(self.tree.item(item, "text"))
+        group_idx = int(selected_items[0])  # Rows use the group index as their iid
         if group_idx < 0 or group_idx >= len(self.texture_groups):
             return
             
-        group = self.texture_groups[group_idx]
-        
-        # Update details based on group type
-        if hasattr(group, 'base_name'):
-            # It's a TextureGroup object
-            self.base_name_var.set(group.base_name)
-            
-            # Get texture types in group
-            types = []
-            for texture_type, texture in group.textures.items():
-                if texture_type != "unknown" and texture is not None:
-                    types.append(texture_type)
-                    
-            self.types_var.set(", ".join(types))
-            
-            # Update unknown textures list
-            self.unknown_list.delete(0, tk.END)
-            
-            unknown_textures = group.textures.get("unknown", [])
-            for i, texture in enumerate(unknown_textures):
-                self.unknown_list.insert(tk.END, os.path.basename(texture.get("path", f"Unknown {i}")))
-                # Set background color to highlight unknown textures
-                # Using tags for coloring in Tkinter
-                # Note: In a real implementation, would need to handle tags properly
-        else:
-            # It's a dictionary (for compatibility)
-            self.base_name_var.set(group.get("base_name", ""))
-            
-            types = [texture.get("type", "unknown") for texture in group.get("textures", [])]
-            self.types_var.set(", ".join(types))
-            
-            # Clear unknown list for dictionary-based groups
-            self.unknown_list.delete(0, tk.END)
+        view = self._group_views[group_idx]
+        
+        # Update details
+        self.base_name_var.set(view.base_name)
+        self.types_var.set(view.types_str)
+        
+        # Update unknown textures list (always empty for dictionary-based groups)
+        self.unknown_list.delete(0, tk.END)
+        names = [_annotate_unknown(texture)["_basename"] or f"Unknown {i}"
+                 for i, texture in enumerate(view.unknowns)]
+        if names:
+            self.unknown_list.insert(tk.END, *names)
     
     def _on_group_double_click(self, event):
         """
@@ -201,26 +322,11 @@ class TextureGroupPanel:
             return
         
         # Get group data from selection
-        item = selected_items[0]
-        group_idx = int(self.tree.item(item, "text"))
+        group_idx = int(selected_items[0])  # Rows use the group index as their iid
         if group_idx < 0 or group_idx >= len(self.texture_groups):
             return
             
-        group = self.texture_groups[group_idx]
-        
-        # Collect all textures from the group based on group type
-        all_textures = []
-        
-        if hasattr(group, 'base_name'):
-            # It's a TextureGroup object
-            for texture_type, texture in group.textures.items():
-                if texture_type != "unknown" and texture is not None:
-                    all_textures.append(texture)
-                elif texture_type == "unknown":
-                    all_textures.extend(texture)  # Unknown is a list
-        else:
-            # It's a dictionary (for compatibility)
-            all_textures = group.get("textures", [])
+        all_textures = self._group_views[group_idx].all_textures()
         
         # Show group textures in preview panel if available
         if self.preview_panel:
@@ -235,45 +341,18 @@ class TextureGroupPanel:
         """
         self.texture_groups = groups
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add groups to treeview
-        for i, group in enumerate(groups):
-            # Handle both TextureGroup objects and dictionaries
-            if hasattr(group, 'base_name'):
-                # It's a TextureGroup object
-                base_name = group.base_name
-                
-                # Get texture types (excluding unknown)
-                texture_types = []
-                for texture_type, texture in group.textures.items():
-                    if texture_type != "unknown" and texture is not None:
-                        texture_types.append(texture_type)
-                
-                # Get unknown textures
-                unknown_textures = group.textures.get("unknown", [])
-                unknown_summary = "" if not unknown_textures else f"{len(unknown_textures)} unknown"
-            else:
-                # It's still a dictionary (for compatibility)
-                base_name = group.get("base_name", "Unknown")
-                textures = group.get("textures", [])
-                texture_types = [texture.get("type", "unknown") for texture in textures]
-                unknown_summary = ""
-            
-            # Add to treeview with highlighting for groups with unknown textures
-            item = self.tree.insert(
-                "", 
-                "end", 
-                text=str(i),  # Store index as text for retrieval
-                values=(base_name, ", ".join(texture_types), unknown_summary)
-            )
-            
-            # If there are unknown textures, highlight the row
-            if unknown_textures:
-                # In a full implementation, would use tags to highlight the row
-                pass
+        # Clear existing items in a single call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        
+        # Wrap every group once, then insert all rows in one pass
+        self._group_views = [_GroupView(group) for group in groups]
+        
+        # Add to treeview; the group index doubles as the item id for direct lookup
+        insert = self.tree.insert
+        for i, view in enumerate(self._group_views):
+            insert("", "end", iid=str(i), values=(view.base_name, view.types_str, view.unknown_summary))
     
     def _on_unknown_select(self, event):
         """
@@ -282,6 +361,7 @@ class TextureGroupPanel:
         Args:
             event: Event object
         """
+        self._unknown_select_after_id = None
         # Get selected indices
         selected_items = self.unknown_list.curselection()
         if not selected_items:
@@ -292,39 +372,13 @@ class TextureGroupPanel:
         if current_group_idx is None:
             return
             
-        group = self.texture_groups[current_group_idx]
-        unknown_textures = group.textures.get("unknown", [])
+        unknown_textures = self._group_views[current_group_idx].unknowns
         
         if selected_items[0] < len(unknown_textures):
-            texture = unknown_textures[selected_items[0]]
-            filename = os.path.basename(texture.get("path", "")).lower()
-            
-            # Simple pattern matching to suggest texture type
-            texture_type = "diffuse"  # Default suggestion
-            
-            if "_n" in filename or "normal" in filename or "norm" in filename:
-                texture_type = "normal"
-            elif "_s" in filename or "spec" in filename:
-                texture_type = "specular"
-            elif "_g" in filename or "gloss" in filename:
-                texture_type = "glossiness"
-            elif "_r" in filename or "rough" in filename:
-                texture_type = "roughness"
-            elif "_h" in filename or "height" in filename or "disp" in filename:
-                texture_type = "displacement"
-            elif "_m" in filename or "metal" in filename:
-                texture_type = "metallic"
-            elif "_ao" in filename or "ambient" in filename or "occl" in filename:
-                texture_type = "ao"
-            elif "_e" in filename or "emiss" in filename or "glow" in filename:
-                texture_type = "emissive"
-            elif "_sss" in filename or "subsurf" in filename:
-                texture_type = "sss"
-            elif "_arm" in filename:
-                texture_type = "arm"
+            texture = _annotate_unknown(unknown_textures[selected_items[0]])
             
             # Set the suggested type in the combobox
-            self.type_var.set(texture_type)
+            self.type_var.set(texture["_suggested_type"])
         
     def _set_texture_type(self):
         """
@@ -340,11 +394,11 @@ class TextureGroupPanel:
         if current_group_idx is None:
             return
             
-        group = self.texture_groups[current_group_idx]
-        if not hasattr(group, 'textures'):
+        view = self._group_views[current_group_idx]
+        if view.textures is None:
             return
             
-        unknown_textures = group.textures.get("unknown", [])
+        unknown_textures = view.unknowns
         
         if selected_items[0] < len(unknown_textures):
             texture = unknown_textures[selected_items[0]]
@@ -359,9 +413,9 @@ class TextureGroupPanel:
             texture["is_unknown"] = False
             
             # Add to the appropriate type in the group
-            if new_type in group.textures:
+            if new_type in view.textures:
                 # If there's already a texture of this type, replace it
-                group.textures[new_type] = texture
+                view.textures[new_type] = texture
             
             # Refresh the display
             self.unknown_list.delete(selected_items[0])
@@ -380,8 +434,7 @@ class TextureGroupPanel:
         if not selected_items:
             return None
             
-        item = selected_items[0]
-        group_idx = int(self.tree.item(item, "text"))
+        group_idx = int(selected_items[0])  # Rows use the group index as their iid
         if group_idx < 0 or group_idx >= len(self.texture_groups):
             return None
             
@@ -395,31 +448,10 @@ class TextureGroupPanel:
             group_idx: Index of the group to refresh
         """
         if 0 <= group_idx < len(self.texture_groups):
-            group = self.texture_groups[group_idx]
-            
-            # Find the item in the treeview
-            for item in self.tree.get_children():
-                if int(self.tree.item(item, "text")) == group_idx:
-                    # Update the display values based on group type
-                    if hasattr(group, 'base_name'):
-                        # It's a TextureGroup object
-                        texture_types = []
-                        for texture_type, texture in group.textures.items():
-                            if texture_type != "unknown" and texture is not None:
-                                texture_types.append(texture_type)
-                        
-                        unknown_textures = group.textures.get("unknown", [])
-                        unknown_summary = "" if not unknown_textures else f"{len(unknown_textures)} unknown"
-                        
-                        self.tree.item(item, values=(group.base_name, ", ".join(texture_types), unknown_summary))
-                    else:
-                        # It's a dictionary (for compatibility)
-                        base_name = group.get("base_name", "Unknown")
-                        textures = group.get("textures", [])
-                        type_summary = ", ".join([t.get("type", "unknown") for t in textures])
-                        
-                        self.tree.item(item, values=(base_name, type_summary, ""))
-                    break
+            # Only this group changed, so only its view is refreshed
+            view = self._group_views[group_idx]
+            view.refresh()
+            self.tree.item(str(group_idx), values=(view.base_name, view.types_str, view.unknown_summary))
     
     def get_texture_groups(self):
         """
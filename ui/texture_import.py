@@ -9,10 +9,196 @@ This module provides the UI components for importing and classifying textures.
 import os
 import json
 import re
+import collections
+import functools
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from core.texture_manager import TextureManager
 
+# Use an Aho-Corasick automaton for suffix scanning when pyahocorasick is installed;
+# otherwise the precompiled regular expressions are used
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Imports larger than this from a single directory are checked against one
+# os.scandir listing instead of touching each file individually
+SCANDIR_IMPORT_THRESHOLD = 100
+
+# Imported files are classified on a worker thread and handed to the UI in
+# batches of this size; the UI checks for finished batches every INGEST_POLL_MS
+INGEST_BATCH_SIZE = 50
+INGEST_POLL_MS = 50
+
+# Resolution tags stripped from file names along with the type suffixes when grouping
+RESOLUTION_SUFFIXES = ("1k", "2k", "4k", "8k", "512", "1024", "2048", "4096", "8192")
+
+# Characters that may not border a type suffix in a lowercased file name
+_SUFFIX_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+# Compiled matching state for one set of suffix settings (see _compile_suffix_state)
+_SuffixState = collections.namedtuple(
+    "_SuffixState",
+    "type_patterns all_suffixes_sorted strip_pattern type_order type_automaton strip_automaton"
+)
+
+def _build_automaton(entries):
+    """
+    Build an Aho-Corasick automaton from (key, value) pairs.
+    
+    Args:
+        entries: Iterable of (key, value) pairs
+        
+    Returns:
+        Finalised ahocorasick.Automaton, or None if no keys were added
+    """
+    automaton = ahocorasick.Automaton()
+    for key, value in entries:
+        automaton.add_word(key, value)
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+@functools.lru_cache(maxsize=1)
+def _compile_suffix_state(settings_key):
+    """
+    Compile the classification and grouping matchers for a set of suffix settings.
+    
+    Args:
+        settings_key: Suffix settings as a tuple of (type name, tuple of suffixes) pairs
+        
+    Returns:
+        _SuffixState
+    """
+    # A suffix only counts when surrounded by characters that aren't letters or numbers
+    # (e.g., 'color' shouldn't match 'colorful'); all of a type's suffixes share one pattern
+    type_patterns = {}
+    for type_name, suffixes in settings_key:
+        if not suffixes:
+            continue
+        alternation = "|".join(re.escape(suffix.lower()) for suffix in suffixes)
+        type_patterns[type_name] = re.compile(r'[^a-z0-9](?:' + alternation + r')(?:[^a-z0-9]|$)')
+    
+    # Every suffix stripped when grouping, lowercased and longest first to avoid partial matches
+    all_suffixes_sorted = sorted(
+        {suffix.lower() for _, suffixes in settings_key for suffix in suffixes} | set(RESOLUTION_SUFFIXES),
+        key=len, reverse=True
+    )
+    
+    # One pattern matching any suffix at the end or before an underscore or hyphen
+    strip_pattern = re.compile(
+        r"(.+?)[-_](?:" + "|".join(re.escape(suffix) for suffix in all_suffixes_sorted) + r")(?:[-_]|$)",
+        re.IGNORECASE
+    )
+    
+    # Automata scanning a name for all suffixes in one pass, if pyahocorasick is available
+    type_order = list(type_patterns)
+    type_automaton = None
+    strip_automaton = None
+    if ahocorasick is not None:
+        # Each suffix maps to the priority of the first type that lists it
+        suffixes_by_type = dict(settings_key)
+        first_type = {}
+        for priority, type_name in enumerate(type_order):
+            for suffix in suffixes_by_type[type_name]:
+                first_type.setdefault(suffix.lower(), priority)
+        type_automaton = _build_automaton(
+            (suffix, (len(suffix), priority)) for suffix, priority in first_type.items()
+        )
+        strip_automaton = _build_automaton(
+            (suffix, len(suffix)) for suffix in all_suffixes_sorted
+        )
+    
+    return _SuffixState(type_patterns, all_suffixes_sorted, strip_pattern, type_order, type_automaton, strip_automaton)
+
+def _match_type(state, filename):
+    """
+    Find the texture type whose suffixes appear in a file name.
+    
+    Types are checked in settings order, so the first type with a matching
+    suffix wins.
+    
+    Args:
+        state: _SuffixState to match with
+        filename: Lowercased file name
+        
+    Returns:
+        Matching texture type, or None
+    """
+    automaton = state.type_automaton
+    if automaton is None:
+        for type_name, pattern in state.type_patterns.items():
+            if pattern.search(filename):
+                return type_name
+        return None
+    
+    word_chars = _SUFFIX_WORD_CHARS
+    length = len(filename)
+    best = None
+    for end, (suffix_length, priority) in automaton.iter(filename):
+        start = end - suffix_length + 1
+        if start == 0 or filename[start - 1] in word_chars:
+            continue
+        if end + 1 < length and filename[end + 1] in word_chars:
+            continue
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+    return None if best is None else state.type_order[best]
+
+def _strip_grouping_suffixes(state, base_name):
+    """
+    Remove all recognized suffixes from a file name without its extension.
+    
+    Everything from the first underscore or hyphen that is followed by a
+    suffix and then another separator or the end of the name is dropped.
+    
+    Args:
+        state: _SuffixState to match with
+        base_name: File name without extension
+        
+    Returns:
+        The name with its suffixes removed
+    """
+    automaton = state.strip_automaton
+    if automaton is None:
+        strip_pattern = state.strip_pattern
+        match = strip_pattern.match(base_name)
+        while match:
+            base_name = match.group(1)
+            match = strip_pattern.match(base_name)
+        return base_name
+    
+    lowered = base_name.lower()
+    length = len(lowered)
+    cut = length
+    for end, suffix_length in automaton.iter(lowered):
+        separator = end - suffix_length
+        if separator < 1 or separator >= cut or lowered[separator] not in "-_":
+            continue
+        if end + 1 < length and lowered[end + 1] not in "-_":
+            continue
+        cut = separator
+    return base_name[:cut]
+
+def _list_dir_files(directory):
+    """
+    List the file names in a directory with a single `os.scandir` pass.
+    
+    Returns:
+        Set of `os.path.normcase`'d file names, or None if the directory cannot be read
+    """
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            return {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+    except OSError:
+        return None
+
 class TextureImportPanel:
     """
     UI panel for texture import and classification.
@@ -30,6 +216,16 @@ class TextureImportPanel:
         self.group_panel = None  # Reference to texture group panel
         self.preview_panel = None  # Reference to preview panel
         self.suffix_settings = {}  # Suffix settings
+        self._pending_group_update = False  # Group panel refresh queued for idle time
+        self.all_textures = []  # Imported texture objects, in list order
+        self._path_to_index = {}  # Texture path -> index in all_textures
+        self._ingest_queue = queue.Queue()  # (job, batch) messages from import worker threads
+        self._ingest_jobs = 0  # Imports whose worker has not reported completion yet
+        self._ingest_generation = 0  # Bumped on clear so in-flight imports are discarded
+        self._list_offset = 0  # Index of the first texture shown in the list
+        self._list_window = range(0)  # Texture indices currently inserted into the list
+        self._selected_indices = set()  # Texture indices selected in the list, including scrolled-out rows
+        self._preview_index = None  # Texture index last sent to the preview panel
         
         # Load suffix settings
         self.load_suffix_settings()
@@ -70,15 +266,21 @@ class TextureImportPanel:
         list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Create texture list with scrollbar
-        self.texture_list = tk.Listbox(list_frame, selectmode=tk.EXTENDED)  # Enable multiple selection
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.texture_list.yview)
-        self.texture_list.configure(yscrollcommand=scrollbar.set)
+        # Only the rows in view are inserted (see _render_list_window), so the
+        # scrollbar is driven by the panel rather than by the treeview.
+        self.texture_list = ttk.Treeview(list_frame, show="tree", selectmode="extended")  # Enable multiple selection
+        self.list_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self._on_list_scroll)
         
         self.texture_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.list_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Bind list selection event
-        self.texture_list.bind('<<ListboxSelect>>', self._on_texture_select)
+        # Bind list selection, resize and scroll events
+        self.texture_list.bind('<<TreeviewSelect>>', self._on_texture_select)
+        self.texture_list.bind("<ButtonPress-1>", self._on_list_press)
+        self.texture_list.bind("<Configure>", lambda event: self._render_list_window())
+        self.texture_list.bind("<MouseWheel>", self._on_list_mousewheel)
+        self.texture_list.bind("<Button-4>", self._on_list_mousewheel)
+        self.texture_list.bind("<Button-5>", self._on_list_mousewheel)
         
         # Create classification options frame
         classify_frame = ttk.LabelFrame(main_frame, text="Classification Options")
@@ -101,6 +303,11 @@ class TextureImportPanel:
         # Delete selected button (Definition moved to import_frame)
         # delete_button = ttk.Button(classify_frame, text="Delete Selected", command=self._delete_selected)
         # delete_button.grid(row=0, column=3, padx=5, pady=5)
+        
+        # Status line for the outcome of imports and edits
+        self.status_var = tk.StringVar()
+        status_label = ttk.Label(main_frame, textvariable=self.status_var, foreground="gray")
+        status_label.pack(fill=tk.X, padx=5, pady=(5, 0))
     
     def set_group_panel(self, group_panel):
         """
@@ -151,6 +358,39 @@ class TextureImportPanel:
         except Exception as e:
             print(f"Failed to load suffix settings: {e}")
             self.suffix_settings = default_settings
+        
+        # The matching state used by classify_textures/group_textures is compiled on first use
+        self._suffix_settings_key = tuple(
+            (type_name, tuple(suffixes)) for type_name, suffixes in self.suffix_settings.items()
+        )
+    
+    def _suffix_state(self):
+        """
+        Get the compiled suffix matching state for the current suffix settings.
+        
+        Returns:
+            _SuffixState, compiled on first use after the settings change
+        """
+        return _compile_suffix_state(self._suffix_settings_key)
+    
+    def _schedule_group_update(self):
+        """
+        Refresh the texture group panel once the event loop is idle.
+        
+        Several imports or deletions in a row collapse into a single refresh.
+        """
+        if not self.group_panel or self._pending_group_update:
+            return
+        self._pending_group_update = True
+        self.frame.after_idle(self._flush_group_update)
+    
+    def _flush_group_update(self):
+        """
+        Push the current texture groups to the group panel.
+        """
+        self._pending_group_update = False
+        if self.group_panel:
+            self.group_panel.set_texture_groups(self.texture_manager.get_all_groups())
     
     def _get_suffix_settings_file(self):
         """
@@ -161,6 +401,111 @@ class TextureImportPanel:
         """
         return os.path.expanduser("~/.cryengine_texture_processor_suffixes.json")
     
+    def _visible_list_row_count(self):
+        """
+        Returns how many rows fit in the texture list at its current size.
+        """
+        height = self.texture_list.winfo_height()
+        if height <= 1: # Not mapped yet, use the configured height
+            return int(self.texture_list.cget("height"))
+        
+        try:
+            row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        except (ValueError, tk.TclError):
+            row_height = 20
+        return max(1, height // row_height)
+    
+    def _render_list_window(self):
+        """
+        Synchronise the texture list with the textures in the current scroll window,
+        inserting and deleting only the rows that entered or left the view.
+        """
+        textures = self.all_textures
+        total = len(textures)
+        visible = self._visible_list_row_count()
+        first = max(0, min(self._list_offset, total - visible))
+        last = min(total, first + visible)
+        self._list_offset = first
+        
+        shown = self._list_window
+        removed = [str(i) for i in shown if i < first or i >= last]
+        if removed:
+            self.texture_list.delete(*removed)
+        
+        wanted = range(first, last)
+        # Call the Tcl insert command directly to skip Treeview.insert's option formatting
+        tk_call = self.texture_list.tk.call
+        widget = self.texture_list._w
+        added = []
+        for i in wanted:
+            if i not in shown:
+                tk_call(widget, "insert", "", i - first, "-id", str(i), "-text", textures[i]["filename"])
+                added.append(i)
+        self._list_window = wanted
+        
+        # Rows scrolled back into view keep their selection
+        reselect = [str(i) for i in added if i in self._selected_indices]
+        if reselect:
+            self.texture_list.selection_add(reselect)
+        
+        if total:
+            self.list_scrollbar.set(first / total, last / total)
+        else:
+            self.list_scrollbar.set(0.0, 1.0)
+    
+    def _reset_list_window(self):
+        """
+        Redraw the texture list from scratch after textures were removed or reordered.
+        """
+        children = self.texture_list.get_children()
+        if children:
+            self.texture_list.delete(*children)
+        self._list_window = range(0)
+        self._preview_index = None
+        self._render_list_window()
+    
+    def _on_list_scroll(self, *args):
+        """
+        Scrollbar command for the virtualised texture list ("moveto" / "scroll").
+        """
+        total = len(self.all_textures)
+        visible = self._visible_list_row_count()
+        if args[0] == "moveto":
+            self._list_offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = visible if args[2] == "pages" else 1
+            self._list_offset += int(args[1]) * step
+        self._render_list_window()
+    
+    def _on_list_mousewheel(self, event):
+        """
+        Scroll the virtualised texture list with the mouse wheel.
+        """
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            units = -1 if event.delta > 0 else 1
+        self._on_list_scroll("scroll", units * 3, "units")
+        return "break"
+    
+    def _on_list_press(self, event):
+        """
+        A plain click replaces the selection, including rows scrolled out of view.
+        """
+        if not event.state & 0x0005:  # Neither Shift nor Control held
+            self._selected_indices.clear()
+    
+    def _get_selected_indices(self):
+        """
+        Get the selected texture indices in list order.
+        
+        Returns:
+            Sorted list of indices into all_textures
+        """
+        return sorted(self._selected_indices)
+    
     def _on_texture_select(self, event):
         """
         Handle texture selection event.
@@ -168,15 +513,18 @@ class TextureImportPanel:
         Args:
             event: Event object
         """
-        # Get selected indices
-        selected = self.texture_list.curselection()
+        # Rows outside the window keep their state; rows in view follow the treeview
+        selected = {int(iid) for iid in self.texture_list.selection()}
+        self._selected_indices.difference_update(self._list_window)
+        self._selected_indices.update(selected)
         if not selected:
             return
         
         # Get selected texture
-        index = selected[0]
-        if index < 0 or index >= len(self.all_textures):
+        index = min(selected)
+        if index >= len(self.all_textures) or index == self._preview_index:
             return
+        self._preview_index = index
         
         texture = self.all_textures[index]
         
@@ -196,30 +544,36 @@ class TextureImportPanel:
         if not result:
             return
             
-        # Clear the list
-        self.texture_list.delete(0, tk.END)
-        
-        # Clear stored textures
+        # Clear stored textures, and drop results of imports still in progress
+        self._ingest_generation += 1
         self.all_textures = []
+        self._path_to_index = {}
+        self._selected_indices.clear()
+        
+        # Clear the list
+        self._reset_list_window()
         
         # Reset texture manager
         self.texture_manager = TextureManager()
         
         # Update texture group panel if available
-        if self.group_panel:
-            self.group_panel.set_texture_groups([])
+        self._schedule_group_update()
             
-        messagebox.showinfo("Cleared", "All textures have been cleared.")
+        self.status_var.set("All textures have been cleared.")
     
-    def import_textures(self, file_paths=None):
+    def import_textures(self, file_paths=None, show_summary=True):
         """
         Import textures from files.
         
+        Classification runs on a background thread; the textures are added to the
+        list and the texture manager in batches as results arrive.
+        
         Args:
             file_paths: List of file paths or None to open file dialog
+            show_summary: Whether to report the result in the status line
             
         Returns:
-            List of imported texture objects
+            Number of files queued for import
         """
         if file_paths is None:
             # Open file dialog to select texture files
@@ -232,59 +586,151 @@ class TextureImportPanel:
             )
             
             if not file_paths:  # User canceled
-                return []
+                return 0
+        
+        # Duplicates are rejected by the texture manager when the results are added
+        pending_paths = list(file_paths)
+        job = {
+            "generation": self._ingest_generation,
+            "added": 0,
+            "skipped": 0,
+            "show_summary": show_summary,
+        }
+        self._ingest_jobs += 1
+        worker = threading.Thread(
+            target=self._ingest_worker,
+            args=(pending_paths, job, self.texture_manager.classify_textures),
+            daemon=True
+        )
+        worker.start()
+        
+        # Start polling for results unless a previous import already is
+        if self._ingest_jobs == 1:
+            self.frame.after(INGEST_POLL_MS, self._drain_ingest_queue)
+        
+        if show_summary:
+            self.status_var.set(f"Importing {len(pending_paths)} textures...")
+        
+        return len(pending_paths)
+    
+    def _ingest_worker(self, file_paths, job, classify_textures):
+        """
+        Classify texture files off the Tk main thread.
+        
+        Runs on a worker thread and only talks to the UI through the ingest queue.
         
-        # Add textures to existing list without clearing, checking for duplicates
+        Args:
+            file_paths: Texture paths to classify
+            job: Bookkeeping dict for this import
+            classify_textures: TextureManager.classify_textures of the manager in use
+        """
+        try:
+            # Drop selected files that have disappeared before they reach the analyzer
+            file_paths = self._drop_missing_in_common_dir(file_paths)
+            
+            for start in range(0, len(file_paths), INGEST_BATCH_SIZE):
+                batch = file_paths[start:start + INGEST_BATCH_SIZE]
+                self._ingest_queue.put((job, list(zip(batch, classify_textures(batch)))))
+        except Exception as e:
+            print(f"Error classifying imported textures: {e}")
+        finally:
+            # Always report completion so the poll loop can stop
+            self._ingest_queue.put((job, None))
+    
+    def _drain_ingest_queue(self):
+        """
+        Add classified textures from the ingest queue on the Tk main thread.
+        """
+        ingest_queue = self._ingest_queue
+        path_to_index = self._path_to_index
+        add_texture = self.texture_manager.add_texture
         textures_added = []
-        duplicates_skipped = 0
+        next_index = len(self.all_textures)
         
-        # Ensure self.all_textures exists
-        if not hasattr(self, 'all_textures'):
-            self.all_textures = []
+        while True:
+            try:
+                job, batch = ingest_queue.get_nowait()
+            except queue.Empty:
+                break
             
-        # Get existing paths for quick lookup
-        existing_paths = {tex.get("path") for tex in self.all_textures if tex.get("path")}
-
-        for path in file_paths:
-            # --- Check for duplicates ---
-            if path in existing_paths:
-                print(f"Skipping duplicate texture: {path}")
-                duplicates_skipped += 1
+            if batch is None:
+                # This import has been fully classified
+                self._ingest_jobs -= 1
+                if job["show_summary"] and job["generation"] == self._ingest_generation:
+                    success_msg = f"Successfully imported {job['added']} textures."
+                    if job["skipped"] > 0:
+                        success_msg += f" Skipped {job['skipped']} duplicate textures."
+                    self.status_var.set(success_msg)
                 continue
-            # --- End Check ---
-
-            # Add to the manager which handles classification, grouping, and duplicate checking
-            texture = self.texture_manager.add_texture(path)
-
-            if texture is None: # TextureManager indicated it's a duplicate
-                print(f"Skipping duplicate texture (already managed): {path}")
-                duplicates_skipped += 1
-                continue # Skip the rest of the loop for this path
             
-            # If texture is not None, it's a new texture
-            textures_added.append(texture)
+            # Results of an import started before the list was cleared are dropped
+            if job["generation"] != self._ingest_generation:
+                continue
             
-            # Add to list display
-            self.texture_list.insert(tk.END, os.path.basename(path))
+            for path, (texture_type, base_name) in batch:
+                # Add to the manager which handles grouping and duplicate checking
+                texture = add_texture(path, texture_type, base_name)
+                
+                if texture is None: # TextureManager indicated it's a duplicate
+                    print(f"Skipping duplicate texture (already managed): {path}")
+                    job["skipped"] += 1
+                    continue # Skip the rest of the loop for this path
+                
+                # If texture is not None, it's a new texture
+                textures_added.append(texture)
+                job["added"] += 1
+                
+                # Record the original path for deletions
+                # Note: The manager handles persistent duplicate checking via absolute paths
+                path_to_index[path] = next_index
+                next_index += 1
+        
+        if textures_added:
+            # Store newly added textures
+            self.all_textures.extend(textures_added)
+            
+            # Add to list display; only rows that land in view are inserted
+            self._render_list_window()
             
-            # Add the original path to the set for this import session's check
-            # Note: The manager now handles persistent duplicate checking via absolute paths
-            existing_paths.add(path)
+            # Update texture group panel if available
+            self._schedule_group_update()
         
-        # Store newly added textures
-        self.all_textures.extend(textures_added)
+        if self._ingest_jobs > 0:
+            self.frame.after(INGEST_POLL_MS, self._drain_ingest_queue)
+    
+    def _drop_missing_in_common_dir(self, file_paths):
+        """
+        Drop paths that no longer exist when a large selection shares one directory.
         
-        # Update texture group panel if available
-        if self.group_panel:
-            self.group_panel.set_texture_groups(self.texture_manager.get_all_groups())
+        The directory is listed once with os.scandir rather than checking each
+        file, which matters on network drives.
+        
+        Args:
+            file_paths: Selected texture paths
+            
+        Returns:
+            The paths that are still present as files
+        """
+        if len(file_paths) <= SCANDIR_IMPORT_THRESHOLD:
+            return file_paths
         
-        # Show success message (including skipped count)
-        success_msg = f"Successfully imported {len(textures_added)} textures."
-        if duplicates_skipped > 0:
-            success_msg += f"\nSkipped {duplicates_skipped} duplicate textures."
-        messagebox.showinfo("Import Complete", success_msg)
+        dirs = {os.path.dirname(path) for path in file_paths}
+        if len(dirs) != 1:
+            return file_paths
         
-        return textures_added
+        present = _list_dir_files(next(iter(dirs)))
+        if present is None:
+            return file_paths
+        
+        normcase = os.path.normcase
+        basename = os.path.basename
+        kept = []
+        for path in file_paths:
+            if normcase(basename(path)) in present:
+                kept.append(path)
+            else:
+                print(f"Skipping missing texture: {path}")
+        return kept
     
     def _set_texture_type(self):
         """
@@ -295,7 +741,7 @@ class TextureImportPanel:
             return
         
         # Get selected indices
-        selected_indices = self.texture_list.curselection()
+        selected_indices = self._get_selected_indices()
         if not selected_indices:
             messagebox.showinfo("Info", "No textures selected.")
             return
@@ -309,26 +755,15 @@ class TextureImportPanel:
             if index < len(self.all_textures):
                 texture = self.all_textures[index]
                 
-                # Update texture type
-                texture["type"] = new_type
+                # Move the texture to its new slot within its group
+                self.texture_manager.update_texture_type(texture, new_type)
                 updated_textures.append(texture)
-                
-                # Update the display in texture list
-                filename = os.path.basename(texture.get("path", ""))
-                self.texture_list.delete(index)
-                self.texture_list.insert(index, filename)
-        
-        # Re-organize groups with the updated textures
-        self.texture_manager = TextureManager()
-        for texture in self.all_textures:
-            self.texture_manager.add_texture(texture["path"], texture["type"])
         
         # Update texture group panel if available
-        if self.group_panel:
-            self.group_panel.set_texture_groups(self.texture_manager.get_all_groups())
+        self._schedule_group_update()
         
         # Show success message
-        messagebox.showinfo("Update Successful", f"Successfully updated {len(updated_textures)} textures to type '{new_type}'.")
+        self.status_var.set(f"Successfully updated {len(updated_textures)} textures to type '{new_type}'.")
     
     def _delete_selected(self):
         """
@@ -339,7 +774,7 @@ class TextureImportPanel:
             return
         
         # Get selected indices in reverse order (to avoid index shifting)
-        selected_indices = sorted(self.texture_list.curselection(), reverse=True)
+        selected_indices = self._get_selected_indices()[::-1]
         if not selected_indices:
             messagebox.showinfo("Info", "No textures selected.")
             return
@@ -350,29 +785,33 @@ class TextureImportPanel:
         if not result:
             return
         
-        # Delete from the listbox and the texture list
+        # Delete from the texture list
         deleted_paths = []
         for index in selected_indices:
             if index < len(self.all_textures):
                 # Keep track of the deleted texture paths
-                deleted_paths.append(self.all_textures[index]["path"])
-                # Delete from the UI list
-                self.texture_list.delete(index)
+                path = self.all_textures[index]["path"]
+                deleted_paths.append(path)
+                self._path_to_index.pop(path, None)
         
-        # Create a new list without the deleted textures
-        self.all_textures = [texture for texture in self.all_textures if texture["path"] not in deleted_paths]
+        # Compact the list in one sweep, then reindex the remaining paths
+        path_to_index = self._path_to_index
+        self.all_textures = [texture for texture in self.all_textures if texture["path"] in path_to_index]
+        self._path_to_index = {texture["path"]: index for index, texture in enumerate(self.all_textures)}
         
-        # Rebuild texture manager with the remaining textures
-        self.texture_manager = TextureManager()
-        for texture in self.all_textures:
-            self.texture_manager.add_texture(texture["path"])
+        # Indices shifted, so redraw the list from scratch
+        self._selected_indices.clear()
+        self._reset_list_window()
+        
+        # Drop the deleted textures from the manager; the other groups are left untouched
+        for path in deleted_paths:
+            self.texture_manager.remove_texture(path)
         
         # Update texture group panel if available
-        if self.group_panel:
-            self.group_panel.set_texture_groups(self.texture_manager.get_all_groups())
+        self._schedule_group_update()
         
         # Show success message
-        messagebox.showinfo("Delete Successful", f"Successfully deleted {count} textures.")
+        self.status_var.set(f"Successfully deleted {count} textures.")
     
     def classify_textures(self, textures):
         """
@@ -401,21 +840,13 @@ class TextureImportPanel:
         }
         
         # Classification based on filename using suffix settings
+        state = self._suffix_state()
         for texture in textures:
             filename = texture["filename"].lower()
             texture_type = "unknown"
             
             # Check each texture type for matching suffixes
-            for type_name, suffixes in self.suffix_settings.items():
-                for suffix in suffixes:
-                    # Ensure the suffix is surrounded by characters that aren't letters or numbers
-                    # This helps prevent partial matches (e.g., 'color' shouldn't match 'colorful')
-                    pattern = r'[^a-z0-9]' + re.escape(suffix.lower()) + r'([^a-z0-9]|$)'
-                    if re.search(pattern, filename):
-                        texture_type = type_name
-                        break
-                if texture_type != "unknown":
-                    break
+            texture_type = _match_type(state, filename) or texture_type
             
             # Store the classified type in the texture
             texture["type"] = texture_type
@@ -444,19 +875,8 @@ class TextureImportPanel:
             all_textures.extend(texture_list)
         
         # Group by base name (removing ALL suffixes)
-        base_names = {}
-        
-        # Create a pattern to match any suffix
-        all_suffixes = []
-        for suffixes in self.suffix_settings.values():
-            all_suffixes.extend(suffixes)
-        
-        # Sort suffixes by length (longest first) to avoid partial matches
-        all_suffixes.sort(key=len, reverse=True)
-        
-        # Add common resolution suffixes
-        resolution_suffixes = ["1k", "2k", "4k", "8k", "512", "1024", "2048", "4096", "8192"]
-        all_suffixes.extend(resolution_suffixes)
+        base_names = collections.defaultdict(list)
+        state = self._suffix_state()
         
         for texture in all_textures:
             filename = texture["filename"]
@@ -466,17 +886,7 @@ class TextureImportPanel:
             
             # Remove all recognized suffixes
             original_base_name = base_name
-            changed = True
-            while changed:
-                changed = False
-                for suffix in all_suffixes:
-                    # Pattern to match suffix at the end or before an underscore or hyphen
-                    pattern = f"(.+?)[-_]{re.escape(suffix)}([-_]|$)"
-                    match = re.match(pattern, base_name, re.IGNORECASE)
-                    if match:
-                        base_name = match.group(1)
-                        changed = True
-                        break
+            base_name = _strip_grouping_suffixes(state, base_name)
             
             # If no suffixes were found, use the original name
             if base_name == original_base_name:
@@ -486,9 +896,6 @@ class TextureImportPanel:
                     base_name = base_name[:last_separator]
             
             # Add to base name dictionary
-            if base_name not in base_names:
-                base_names[base_name] = []
-            
             base_names[base_name].append(texture)
         
         # Create texture groups
@@ -7,10 +7,17 @@ This module provides functionality for generating CGF files for CryEngine using
 """
 
 import os
+import stat
+import logging
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from utils.config_manager import ConfigManager
 
+# RC.exe's per-file log is only shown when this logger is set to DEBUG
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 class CGFProcessor:
     """
     Class for processing JSON config files into CGF files for CryEngine.
@@ -20,7 +27,7 @@ class CGFProcessor:
         """
         Initialize the CGF processor.
         """
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager.shared()
         self.rc_exe_path = self.config_manager.get("rc_exe_path", "")
         self.processing_thread = None
         self.cancel_flag = False
@@ -80,7 +87,7 @@ class CGFProcessor:
         
         return True
     
-    def process_json_files(self, json_files, output_dir=None, overwrite=True):
+    def process_json_files(self, json_files, output_dir=None, overwrite=True, max_workers=None):
         """
         Process multiple JSON config files into CGF files.
         
@@ -89,6 +96,8 @@ class CGFProcessor:
             output_dir (str, optional): Directory to save CGF files. If None, 
                                          CGF files will be saved in the same directory as JSON files
             overwrite (bool): Whether to overwrite existing CGF files
+            max_workers (int, optional): Maximum number of RC.exe runs at a time.
+                                         Defaults to twice the CPU count, at most 12
             
         Returns:
             True if processing started successfully, False otherwise
@@ -110,17 +119,20 @@ class CGFProcessor:
         # Reset cancel flag
         self.cancel_flag = False
         
+        if max_workers is None:
+            max_workers = min(12, (os.cpu_count() or 1) * 2)
+        
         # Start processing thread
         self.processing_thread = threading.Thread(
             target=self._process_files_thread,
-            args=(json_files, output_dir, overwrite),
+            args=(json_files, output_dir, overwrite, max_workers),
             daemon=True
         )
         self.processing_thread.start()
         
         return True
     
-    def _process_files_thread(self, json_files, output_dir, overwrite):
+    def _process_files_thread(self, json_files, output_dir, overwrite, max_workers):
         """
         Thread function to process multiple JSON files.
         
@@ -128,6 +140,7 @@ class CGFProcessor:
             json_files (list): List of JSON file paths to process
             output_dir (str): Directory to save CGF files
             overwrite (bool): Whether to overwrite existing CGF files
+            max_workers (int): Maximum number of worker threads
         """
         try:
             total_files = len(json_files)
@@ -142,39 +155,59 @@ class CGFProcessor:
             if self.progress_callback:
                 self.progress_callback(0.0, "Starting CGF generation", f"Found {total_files} JSON files")
             
-            # Process each file
+            # Determine output file paths, choosing the layout once for all files
+            splitext = os.path.splitext
+            if output_dir:
+                join = os.path.join
+                basename = os.path.basename
+                output_files = [
+                    join(output_dir, splitext(basename(json_file))[0] + ".cgf")
+                    for json_file in json_files
+                ]
+            else:
+                output_files = [splitext(json_file)[0] + ".cgf" for json_file in json_files]
+            
+            # Process files with ThreadPoolExecutor; RC.exe runs are independent
             completed = 0
-            for i, json_file in enumerate(json_files):
-                # Check if cancelled
-                if self.cancel_flag:
+            finished = 0
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for json_file, output_file in zip(json_files, output_files):
+                    # Stop queueing work once cancelled
+                    if self.cancel_flag:
+                        break
+                    
+                    futures[executor.submit(self._process_json_file, json_file, output_file, overwrite)] = json_file
+                
+                # Report each file as it completes
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    finished += 1
+                    if future.result():
+                        completed += 1
+                    
+                    # Check if cancelled
+                    if self.cancel_flag:
+                        if self.progress_callback:
+                            self.progress_callback(
+                                completed / total_files,
+                                "CGF generation cancelled",
+                                f"Processed {completed} of {total_files} files"
+                            )
+                        # Cancel all pending futures
+                        for f in futures:
+                            if not f.done():
+                                f.cancel()
+                        break
+                    
+                    # Update progress
                     if self.progress_callback:
                         self.progress_callback(
-                            completed / total_files,
-                            "CGF generation cancelled",
-                            f"Processed {completed} of {total_files} files"
+                            finished / total_files,
+                            f"Processed {os.path.basename(futures[future])}",
+                            f"File {finished} of {total_files}"
                         )
-                    break
-                
-                # Update progress
-                if self.progress_callback:
-                    self.progress_callback(
-                        i / total_files,
-                        f"Processing {os.path.basename(json_file)}",
-                        f"File {i + 1} of {total_files}"
-                    )
-                
-                # Determine output file path
-                if output_dir:
-                    base_name = os.path.splitext(os.path.basename(json_file))[0]
-                    output_file = os.path.join(output_dir, f"{base_name}.cgf")
-                else:
-                    base_name = os.path.splitext(json_file)[0]
-                    output_file = f"{base_name}.cgf"
-                
-                # Process the file
-                success = self._process_json_file(json_file, output_file, overwrite)
-                if success:
-                    completed += 1
             
             # Final progress update
             if self.progress_callback and not self.cancel_flag:
@@ -255,15 +288,22 @@ class CGFProcessor:
             if self.cancel_flag:
                 return False
             
-            # Check if JSON file exists
-            if not os.path.exists(json_file):
+            # Check if JSON file exists (a single stat; a directory is not a JSON file)
+            try:
+                if not stat.S_ISREG(os.stat(json_file).st_mode):
+                    raise FileNotFoundError(json_file)
+            except OSError:
                 print(f"JSON file not found: {json_file}")
                 return False
             
-            # Check if output file exists and overwrite is False
-            if os.path.exists(output_file) and not overwrite:
-                print(f"Output file already exists: {output_file}")
-                return False
+            # Check if output file exists, which only matters when not overwriting
+            if not overwrite:
+                try:
+                    os.stat(output_file)
+                    print(f"Output file already exists: {output_file}")
+                    return False
+                except FileNotFoundError:
+                    pass
             
             # Get output extension (cgf by default)
             output_ext = os.path.splitext(output_file)[1].lstrip('.').lower()
@@ -285,24 +325,20 @@ class CGFProcessor:
             if output_filename:
                 cmd.append(f'/overwritefilename="{output_filename}"')
             
-            # Log the command
-            print(f"Running RC.exe command: {' '.join(cmd)}")
-            
-            # Run RC.exe
+            # Run RC.exe; its log is only shown in debug mode, and only the
+            # error output is captured, to be decoded if the run fails
+            verbose = logger.isEnabledFor(logging.DEBUG)
+            if verbose:
+                logger.debug("Running RC.exe command: %s", " ".join(cmd))
             result = subprocess.run(
                 cmd,
                 check=False,
-                capture_output=True,
-                text=True
+                stdout=None if verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             
-            # Log the output
-            print(f"RC.exe output for {json_file}:")
-            print(result.stdout)
-            
             if result.returncode != 0:
-                print(f"RC.exe error for {json_file}:")
-                print(result.stderr)
+                print(f"RC.exe error for {json_file}:\n{result.stderr.decode(errors='replace')}")
                 return False
             
             # Check if output file was created
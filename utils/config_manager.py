@@ -7,13 +7,67 @@ This module provides functionality for managing application configuration.
 """
 
 import os
+import copy
 import json
+import hashlib
+import collections
+import threading
+
+# Use orjson for configuration file I/O when available; both backends read and write UTF-8 bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=4).encode("utf-8")
+
+# Delay before changes made with set() are written to disk; further changes restart it
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# Parsed configuration files keyed by path -> {"digest": ..., "data": ...}. Entries are
+# validated by a hash of the file contents, since mtimes on network homes are too coarse
+# or skewed to notice every change.
+_CONFIG_CACHE = {}
+
+def _content_digest(raw):
+    """
+    Hash of a configuration file's bytes, used to validate _CONFIG_CACHE entries.
+    """
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
 
 class ConfigManager:
     """
     Class for managing application configuration.
     """
     
+    # Instance returned by shared()
+    _shared_instance = None
+    
+    @classmethod
+    def shared(cls):
+        """
+        Get a process-wide manager for the default configuration file.
+        
+        The configuration is reloaded if the file changed on disk since it was
+        last read or written by this instance.
+        
+        Returns:
+            Shared ConfigManager instance
+        """
+        instance = cls._shared_instance
+        if instance is None:
+            instance = cls._shared_instance = cls()
+        else:
+            instance._reload_if_changed()
+        return instance
+    
     def __init__(self, config_file=None):
         """
         Initialize the configuration manager.
@@ -23,6 +77,9 @@ class ConfigManager:
         """
         self.config_file = config_file or self._get_default_config_path()
         self.config = self._load_config()
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._save_timer = None
     
     def _get_default_config_path(self):
         """
@@ -47,18 +104,47 @@ class ConfigManager:
         config = self._get_default_config()
         
         # Try to load from file
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                
-                # Update default config with loaded values
-                config.update(loaded_config)
-            except Exception as e:
-                print(f"Error loading configuration from {self.config_file}: {e}")
+        try:
+            with open(self.config_file, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            self._file_digest = None
+            return config
+        self._file_digest = digest = _content_digest(raw)
+        
+        cached = _CONFIG_CACHE.get(self.config_file)
+        if cached and cached["digest"] == digest:
+            # Same contents as when it was last parsed, skip the parse
+            config.update(copy.deepcopy(cached["data"]))
+            return config
+        
+        try:
+            loaded_config = _json_loads(raw)
+            
+            _CONFIG_CACHE[self.config_file] = {
+                "digest": digest,
+                "data": copy.deepcopy(loaded_config)
+            }
+            
+            # Update default config with loaded values
+            config.update(loaded_config)
+        except Exception as e:
+            print(f"Error loading configuration from {self.config_file}: {e}")
         
         return config
     
+    def _reload_if_changed(self):
+        """
+        Reload the configuration if the file changed since this instance last saw it.
+        """
+        try:
+            with open(self.config_file, 'rb') as f:
+                digest = _content_digest(f.read())
+        except OSError:
+            digest = None
+        if digest != self._file_digest:
+            self.config = self._load_config()
+    
     def _get_default_config(self):
         """
         Get default configuration.
@@ -86,19 +172,65 @@ class ConfigManager:
         Returns:
             True if save was successful, False otherwise
         """
+        with self._lock:
+            # An explicit save supersedes any pending debounced one
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            return self._write_config()
+    
+    def _write_config(self):
+        """
+        Write the configuration atomically: to a temporary file, then moved into place.
+        
+        Returns:
+            True if save was successful, False otherwise
+        """
+        tmp_file = self.config_file + ".tmp"
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
             
-            # Save to file
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            # Save to file; a crash mid-write leaves the previous file intact
+            raw = _json_dumps(self.config)
+            with open(tmp_file, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
+            
+            # Keep the cache in step so other instances don't re-parse the file
+            self._file_digest = _content_digest(raw)
+            _CONFIG_CACHE[self.config_file] = {
+                "digest": self._file_digest,
+                "data": copy.deepcopy(self.config)
+            }
             
             return True
         except Exception as e:
             print(f"Error saving configuration to {self.config_file}: {e}")
             return False
     
+    def _schedule_save(self):
+        """
+        Mark the configuration dirty and (re)start the debounced save timer.
+        """
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _flush(self):
+        """
+        Timer callback writing pending changes.
+        """
+        with self._lock:
+            self._save_timer = None
+            if self._dirty:
+                self._write_config()
+    
     def get(self, key, default=None):
         """
         Get a configuration value.
@@ -120,31 +252,42 @@ class ConfigManager:
             key: Configuration key
             value: Value to set
         """
-        self.config[key] = value
+        with self._lock:
+            self.config[key] = value
+        self._schedule_save()
     
-    def add_recent_file(self, file_path, max_recent=10):
+    def _add_recent(self, key, entry, max_recent):
         """
-        Add a file to the recent files list.
+        Move an entry to the front of a most-recently-used list in the configuration.
         
         Args:
-            file_path: File path to add
-            max_recent: Maximum number of recent files to keep
+            key: Configuration key of the list
+            entry: Entry to add or promote
+            max_recent: Maximum number of entries to keep
         """
-        # Get current recent files
-        recent_files = self.config.get("recent_files", [])
-        
-        # Remove if already in list
-        if file_path in recent_files:
-            recent_files.remove(file_path)
-        
-        # Add to beginning of list
-        recent_files.insert(0, file_path)
+        # The list is stored as-is; the ordered dict only lives for this update
+        recent = collections.OrderedDict.fromkeys(self.config.get(key, []))
+        recent[entry] = None
+        recent.move_to_end(entry, last=False)
         
         # Trim to max_recent
-        recent_files = recent_files[:max_recent]
+        while len(recent) > max_recent:
+            recent.popitem(last=True)
         
         # Update config
-        self.config["recent_files"] = recent_files
+        with self._lock:
+            self.config[key] = list(recent)
+        self._schedule_save()
+    
+    def add_recent_file(self, file_path, max_recent=10):
+        """
+        Add a file to the recent files list.
+        
+        Args:
+            file_path: File path to add
+            max_recent: Maximum number of recent files to keep
+        """
+        self._add_recent("recent_files", file_path, max_recent)
     
     def add_recent_directory(self, directory, max_recent=10):
         """
@@ -154,18 +297,4 @@ class ConfigManager:
             directory: Directory path to add
             max_recent: Maximum number of recent directories to keep
         """
-        # Get current recent directories
-        recent_dirs = self.config.get("recent_directories", [])
-        
-        # Remove if already in list
-        if directory in recent_dirs:
-            recent_dirs.remove(directory)
-        
-        # Add to beginning of list
-        recent_dirs.insert(0, directory)
-        
-        # Trim to max_recent
-        recent_dirs = recent_dirs[:max_recent]
-        
-        # Update config
-        self.config["recent_directories"] = recent_dirs
+        self._add_recent("recent_directories", directory, max_recent)
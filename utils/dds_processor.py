@@ -7,12 +7,106 @@ This module provides functionality for generating DDS files for CryEngine using
 """
 
 import os
+import sys
+import atexit
+import logging
+import tempfile
 import subprocess
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
 from utils.config_manager import ConfigManager
 from utils.image_processing import ImageProcessor
 
+# RC.exe's per-file log is only shown when this logger is set to DEBUG
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Upper bound for the number of TIFs handed to one RC.exe run
+RC_MAX_BATCH_SIZE = 32
+
+# Thumbnails of TIFs larger than this are resized in worker processes, where the
+# work is not serialised by the GIL; smaller ones are cheaper to do in-thread
+THUMBNAIL_PROCESS_MIN_BYTES = 1 << 20
+USE_THUMBNAIL_PROCESSES = not getattr(sys, "frozen", False)
+
+# Thread pool running RC.exe for all DDSProcessor instances, created on first use
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+def _get_executor(max_workers):
+    """
+    Get the shared RC.exe thread pool, creating it on first use.
+    
+    Args:
+        max_workers: Requested worker count; the pool gets at least one thread per CPU
+        
+    Returns:
+        ThreadPoolExecutor
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=max(max_workers, os.cpu_count() or 1))
+            atexit.register(_EXECUTOR.shutdown, wait=False)
+        return _EXECUTOR
+
+# Process pool for large thumbnails, created on first use
+_thumbnail_pool = None
+_thumbnail_pool_lock = threading.Lock()
+
+def _get_thumbnail_pool():
+    """
+    Get the shared thumbnail process pool, creating it on first use.
+    
+    Returns:
+        ProcessPoolExecutor
+    """
+    global _thumbnail_pool
+    with _thumbnail_pool_lock:
+        if _thumbnail_pool is None:
+            _thumbnail_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _thumbnail_pool
+
+def _stat_or_none(path):
+    """
+    Stat a file, returning None if it cannot be stat'ed.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        os.stat_result, or None if the file is missing or unreadable
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def run_rc(args):
+    """
+    Run RC.exe.
+    
+    RC.exe's log is only streamed to the console when debug logging is enabled
+    and is discarded otherwise; its error output is only decoded when the run fails.
+    
+    Args:
+        args: Command line as a list of strings
+        
+    Returns:
+        Tuple of (returncode, stderr), stderr being empty on success
+    """
+    verbose = logger.isEnabledFor(logging.DEBUG)
+    result = subprocess.run(
+        args,
+        check=False,
+        stdout=None if verbose else subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        return result.returncode, result.stderr.decode(errors="replace")
+    return result.returncode, ""
+
 class DDSProcessor:
     """
     Class for processing TIF files into DDS files for CryEngine.
@@ -22,11 +116,14 @@ class DDSProcessor:
         """
         Initialize the DDS processor.
         """
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager.shared()
         self.rc_exe_path = self.config_manager.get("rc_exe_path", "")
         self.processing_thread = None
         self.cancel_flag = False
         self.progress_callback = None
+        self._thumbnail_futures = []
+        self._thumbnail_lock = threading.Lock()
+        self._tif_sizes = {}
     
     def set_progress_callback(self, callback):
         """
@@ -37,13 +134,15 @@ class DDSProcessor:
         """
         self.progress_callback = callback
     
-    def process_tif_files(self, tif_files, max_workers=12):
+    def process_tif_files(self, tif_files, max_workers=12, batch_size=None):
         """
         Process TIF files into DDS files.
         
         Args:
             tif_files: List of TIF file paths to process
             max_workers: Maximum number of worker threads
+            batch_size: Number of TIF files per RC.exe run; by default the files
+                are spread evenly over the workers, at most RC_MAX_BATCH_SIZE per run
             
         Returns:
             True if processing started successfully, False otherwise
@@ -65,25 +164,42 @@ class DDSProcessor:
         # Reset cancel flag
         self.cancel_flag = False
         
+        if batch_size is None:
+            batch_size = min(RC_MAX_BATCH_SIZE, max(1, -(-len(tif_files) // max_workers)))
+        
         # Start processing thread
         self.processing_thread = threading.Thread(
             target=self._process_thread,
-            args=(tif_files, max_workers),
+            args=(tif_files, max_workers, batch_size),
             daemon=True
         )
         self.processing_thread.start()
         
         return True
     
-    def _process_thread(self, tif_files, max_workers):
+    def _process_thread(self, tif_files, max_workers, batch_size):
         """
         Thread function to process TIF files.
         
         Args:
             tif_files: List of TIF file paths to process
             max_workers: Maximum number of worker threads
+            batch_size: Number of TIF files per RC.exe run
         """
         try:
+            # Process batches on the shared thread pool, which outlives this run
+            executor = _get_executor(max_workers)
+            
+            # Stat every TIF up front on the pool instead of one at a time on the
+            # workers; missing files are reported once and left out of the run
+            stats = list(executor.map(_stat_or_none, tif_files))
+            for tif_path, st in zip(tif_files, stats):
+                if st is None:
+                    print(f"TIF file not found: {tif_path}")
+            self._tif_sizes = {
+                tif_path: st.st_size for tif_path, st in zip(tif_files, stats) if st is not None
+            }
+            tif_files = list(self._tif_sizes)
             total_files = len(tif_files)
             
             # Exit if no files
@@ -96,37 +212,52 @@ class DDSProcessor:
             if self.progress_callback:
                 self.progress_callback(0.0, "Starting DDS generation", f"Found {total_files} TIF files")
             
-            # Process files with ThreadPoolExecutor
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Start all tasks
-                futures = {
-                    executor.submit(self._process_tif_file, file_path, i, total_files): (i, file_path)
-                    for i, file_path in enumerate(tif_files)
-                }
-                
-                # Wait for all futures to complete
-                completed = 0
-                for future in futures:
-                    try:
-                        future.result()
-                        completed += 1
-                        
-                        # Check if cancelled
-                        if self.cancel_flag:
-                            # Update progress with cancelled status
-                            if self.progress_callback:
-                                self.progress_callback(
-                                    completed / total_files,
-                                    "DDS generation cancelled",
-                                    f"Processed {completed} of {total_files} files"
-                                )
-                            # Cancel all pending futures
-                            for f in futures:
-                                if not f.done():
-                                    f.cancel()
-                            break
-                    except Exception as e:
-                        print(f"Error in future: {e}")
+            # Split the files into batches, each converted by one RC.exe run
+            batches = []
+            files = iter(tif_files)
+            start = 0
+            while True:
+                batch = list(islice(files, batch_size))
+                if not batch:
+                    break
+                batches.append((start, batch))
+                start += len(batch)
+            
+            # Start all tasks
+            futures = {
+                executor.submit(self._process_tif_batch, batch, start, total_files): (start, batch)
+                for start, batch in batches
+            }
+            
+            # Handle futures as they finish, so cancellation is noticed after the next batch to finish
+            completed = 0
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    completed += len(futures[future][1])
+                    
+                    # Check if cancelled
+                    if self.cancel_flag:
+                        # Update progress with cancelled status
+                        if self.progress_callback:
+                            self.progress_callback(
+                                completed / total_files,
+                                "DDS generation cancelled",
+                                f"Processed {completed} of {total_files} files"
+                            )
+                        # Cancel all pending futures
+                        for f in futures:
+                            if not f.done():
+                                f.cancel()
+                        break
+                except Exception as e:
+                    print(f"Error in future: {e}")
+            
+            # Let thumbnails still being generated in worker processes finish
+            with self._thumbnail_lock:
+                thumbnail_futures, self._thumbnail_futures = self._thumbnail_futures, []
+            if thumbnail_futures:
+                wait(thumbnail_futures)
             
             # Final progress update
             if self.progress_callback and not self.cancel_flag:
@@ -145,6 +276,103 @@ class DDSProcessor:
                     f"Error: {str(e)}"
                 )
     
+    def _process_tif_batch(self, tif_paths, start_index, total):
+        """
+        Process several TIF files with a single RC.exe run.
+        
+        The files are passed to RC.exe in a list file. If that run fails, each
+        file is retried on its own so one bad file does not fail the batch.
+        
+        Args:
+            tif_paths: Paths of the TIF files in this batch
+            start_index: Index of the first file of the batch in the full list
+            total: Total number of files
+            
+        Returns:
+            Number of files processed successfully
+        """
+        if len(tif_paths) == 1:
+            return int(self._process_tif_file(tif_paths[0], start_index, total))
+        
+        # Check if processing was cancelled
+        if self.cancel_flag:
+            return 0
+        
+        # Update progress
+        if self.progress_callback:
+            self.progress_callback(
+                start_index / total,
+                f"Processing {os.path.basename(tif_paths[0])} and {len(tif_paths) - 1} more",
+                f"Files {start_index + 1}-{start_index + len(tif_paths)} of {total}"
+            )
+        
+        list_file = None
+        try:
+            with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+                list_file = f.name
+                f.write("\n".join(tif_paths))
+            
+            # Run RC.exe once for the whole batch
+            logger.debug("RC.exe output for batch of %d files:", len(tif_paths))
+            returncode, stderr = run_rc([self.rc_exe_path, f"/listfile={list_file}"])
+        except Exception as e:
+            print(f"Error processing batch starting with {tif_paths[0]}: {e}")
+            returncode, stderr = -1, str(e)
+        finally:
+            if list_file:
+                try:
+                    os.remove(list_file)
+                except OSError:
+                    pass
+        
+        if returncode != 0:
+            # One print per failure keeps the worker threads off the stdout lock
+            print(f"RC.exe error for batch starting with {tif_paths[0]}, retrying files individually:\n{stderr}")
+            return sum(
+                self._process_tif_file(tif_path, start_index + offset, total)
+                for offset, tif_path in enumerate(tif_paths)
+            )
+        
+        # Generate thumbnails for the DDS files, reporting progress per file
+        for offset, tif_path in enumerate(tif_paths):
+            if self.cancel_flag:
+                break
+            if self.progress_callback:
+                self.progress_callback(
+                    (start_index + offset) / total,
+                    f"Processing {os.path.basename(tif_path)}",
+                    f"File {start_index + offset + 1} of {total}"
+                )
+            self._generate_dds_thumbnail(tif_path)
+        return len(tif_paths)
+    
+    def _generate_dds_thumbnail(self, tif_path):
+        """
+        Generate the thumbnail CryEngine shows for the DDS file of a TIF.
+        
+        Args:
+            tif_path: Path to the TIF file
+        """
+        thumbnail_path = f"{os.path.splitext(tif_path)[0]}.dds.thmb.png"
+        
+        # Large sources are decoded and resized in a worker process
+        if USE_THUMBNAIL_PROCESSES:
+            try:
+                size = self._tif_sizes.get(tif_path)
+                if size is None:
+                    size = os.path.getsize(tif_path)
+                if size > THUMBNAIL_PROCESS_MIN_BYTES:
+                    future = _get_thumbnail_pool().submit(
+                        ImageProcessor.generate_thumbnail, tif_path, thumbnail_path, (256, 256)
+                    )
+                    with self._thumbnail_lock:
+                        self._thumbnail_futures.append(future)
+                    return
+            except Exception as e:
+                print(f"Falling back to in-thread thumbnail for {tif_path}: {e}")
+        
+        ImageProcessor.generate_thumbnail(tif_path, thumbnail_path, (256, 256))
+    
     def _process_tif_file(self, tif_path, index, total):
         """
         Process a single TIF file with RC.exe.
@@ -171,25 +399,15 @@ class DDSProcessor:
                 )
             
             # Run RC.exe with the TIF file
-            result = subprocess.run(
-                [self.rc_exe_path, tif_path],
-                check=False,
-                capture_output=True,
-                text=True
-            )
-            
-            # Log the output
-            print(f"RC.exe output for {tif_path}:")
-            print(result.stdout)
+            logger.debug("RC.exe output for %s:", tif_path)
+            returncode, stderr = run_rc([self.rc_exe_path, tif_path])
             
-            if result.returncode != 0:
-                print(f"RC.exe error for {tif_path}:")
-                print(result.stderr)
+            if returncode != 0:
+                print(f"RC.exe error for {tif_path}:\n{stderr}")
                 return False
             
             # Generate thumbnail for DDS file
-            thumbnail_path = f"{os.path.splitext(tif_path)[0]}.dds.thmb.png"
-            ImageProcessor.generate_thumbnail(tif_path, thumbnail_path, (256, 256))
+            self._generate_dds_thumbnail(tif_path)
             
             return True
             
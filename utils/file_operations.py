@@ -7,8 +7,111 @@ This module provides utility functions for file and directory operations.
 """
 
 import os
+import sys
 import shutil
-import re
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Characters not allowed in file names, each mapped to an underscore
+_CLEAN_FILENAME_TABLE = str.maketrans({c: "_" for c in '\\/*?:"<>|'})
+
+# In-kernel copies are tried before shutil on Linux; copy_file_range can clone
+# extents on copy-on-write filesystems instead of copying data
+USE_KERNEL_COPY = sys.platform.startswith("linux")
+
+# Largest chunk requested from the kernel per copy call
+KERNEL_COPY_CHUNK_SIZE = 1 << 30
+
+# Threads listing subdirectories in get_files_by_extension; listing is I/O bound,
+# which matters most on network shares where every listing is a round trip
+SCAN_MAX_WORKERS = 16
+
+def _directory_index(directory):
+    """
+    Get the (case-normalized) names of the entries in a directory.
+    
+    The directory is listed on every call; a listing cached by the directory's
+    mtime can be stale on filesystems with coarse timestamps (FAT, SMB).
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Set of entry names, empty if the directory cannot be read
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        return set()
+
+def _scan_directory(path, extensions):
+    """
+    List one directory for get_files_by_extension.
+    
+    Args:
+        path: Directory to list
+        extensions: Tuple of lowercase extensions to include
+        
+    Returns:
+        Tuple of (matching file paths, subdirectory paths); both empty if the
+        directory cannot be read, as os.walk skips such directories
+    """
+    files = []
+    subdirs = []
+    try:
+        # DirEntry caches the file type, so no stat per entry
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(extensions):
+                    files.append(entry.path)
+    except OSError:
+        pass
+    return files, subdirs
+
+def _kernel_copy(source, destination):
+    """
+    Copy file contents without passing them through user space.
+    
+    copy_file_range is tried first, then sendfile. Only the data is copied.
+    
+    Args:
+        source: Source file path
+        destination: Destination file path
+        
+    Returns:
+        True if the data was copied, False if neither call is usable here
+    """
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        size = os.fstat(src_fd).st_size
+        
+        for copy in (getattr(os, "copy_file_range", None), getattr(os, "sendfile", None)):
+            if copy is None:
+                continue
+            offset = 0
+            try:
+                while offset < size:
+                    count = min(size - offset, KERNEL_COPY_CHUNK_SIZE)
+                    if copy is os.sendfile:
+                        sent = copy(dst_fd, src_fd, offset, count)
+                    else:
+                        sent = copy(src_fd, dst_fd, count, offset_src=offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # Unsupported for this pair of files; only fall through if nothing was written
+                if offset:
+                    raise
+                continue
+            if offset == size:
+                return True
+            if offset:
+                # Source shrank while copying; let shutil redo it
+                return False
+    return False
 
 class FileOperations:
     """
@@ -45,21 +148,29 @@ class FileOperations:
         Returns:
             List of file paths
         """
-        files = []
-        
         # Convert extensions to lowercase for case-insensitive comparison
-        extensions = [ext.lower() for ext in extensions]
+        extensions = tuple(ext.lower() for ext in extensions)
         
         # Check if directory exists
         if not os.path.exists(directory):
+            return []
+        
+        # A directory without subdirectories needs no thread pool
+        files, subdirs = _scan_directory(directory, extensions)
+        if not subdirs:
             return files
         
-        # Walk through directory and subdirectories
-        for root, _, filenames in os.walk(directory):
-            for filename in filenames:
-                ext = os.path.splitext(filename)[1].lower()
-                if ext in extensions:
-                    files.append(os.path.join(root, filename))
+        # List subdirectories concurrently, queueing their own subdirectories as they are found
+        with ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS) as executor:
+            pending = {executor.submit(_scan_directory, subdir, extensions) for subdir in subdirs}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, subdirs = future.result()
+                    files.extend(found)
+                    pending.update(
+                        executor.submit(_scan_directory, subdir, extensions) for subdir in subdirs
+                    )
         
         return files
     
@@ -84,8 +195,11 @@ class FileOperations:
             # Ensure destination directory exists
             os.makedirs(os.path.dirname(destination), exist_ok=True)
             
-            # Copy file
-            shutil.copy2(source, destination)
+            # Copy file, in the kernel where possible
+            if USE_KERNEL_COPY and _kernel_copy(source, destination):
+                shutil.copystat(source, destination)
+            else:
+                shutil.copy2(source, destination)
             return True
         except Exception as e:
             print(f"Error copying file from {source} to {destination}: {e}")
@@ -122,7 +236,7 @@ class FileOperations:
         """
         # Replace characters that are not allowed in filenames
         # with underscores
-        return re.sub(r'[\\/*?:"<>|]', '_', filename)
+        return filename.translate(_CLEAN_FILENAME_TABLE)
     
     @staticmethod
     def get_unique_filename(directory, base_filename):
@@ -139,11 +253,12 @@ class FileOperations:
         # Split base filename into name and extension
         name, ext = os.path.splitext(base_filename)
         
-        # Check if file already exists
+        # Probe against one listing of the directory instead of one stat per candidate
+        existing = _directory_index(directory)
         filename = base_filename
         counter = 1
         
-        while os.path.exists(os.path.join(directory, filename)):
+        while os.path.normcase(filename) in existing:
             # File exists, add a number and try again
             filename = f"{name}_{counter}{ext}"
             counter += 1
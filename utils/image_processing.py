@@ -7,8 +7,254 @@ This module provides utility functions for image processing tasks using Pillow (
 """
 
 from PIL import Image, ImageOps, ImageFilter, ImageChops, ImageStat
+import io
 import os
+import logging
+import functools
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Successful saves are only reported when this logger is set to DEBUG
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# numexpr evaluates the normal map expression in one multithreaded pass when available
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Numba compiles the normal map computation into one parallel pass when available
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _normal_kernel(height, scale, out):
+        """
+        Fill out (uint8 HxWx3) with the normal map of an 8-bit height map.
+        
+        Same result as the NumPy path of generate_normal_from_height: negated
+        central differences, with edge pixels repeated past the border.
+        """
+        rows, cols = height.shape
+        for y in prange(rows):
+            above = max(y - 1, 0)
+            below = min(y + 1, rows - 1)
+            for x in range(cols):
+                left = max(x - 1, 0)
+                right = min(x + 1, cols - 1)
+                dzdx = (np.float32(height[above, x]) - np.float32(height[below, x])) * scale
+                dzdy = (np.float32(height[y, left]) - np.float32(height[y, right])) * scale
+                k = 127.5 / np.sqrt(dzdx * dzdx + dzdy * dzdy + 1.0)
+                out[y, x, 0] = np.uint8(dzdx * k + 127.5)
+                out[y, x, 1] = np.uint8(dzdy * k + 127.5)
+                out[y, x, 2] = np.uint8(k + 127.5)
+else:
+    _normal_kernel = None
+
+# libjpeg-turbo decodes JPEGs for load_image without holding the GIL when available
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJPF_GRAY, TJCS_GRAY, TJCS_RGB, TJCS_YCbCr
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    # Not installed, or the libjpeg-turbo library itself could not be found
+    _turbo_jpeg = None
+
+# File extensions decoded with libjpeg-turbo
+TURBOJPEG_EXTENSIONS = (".jpg", ".jpeg")
+
+# tifffile writes large TIFF outputs tile by tile when available
+try:
+    import tifffile
+except ImportError:
+    tifffile = None
+
+# TIFF outputs with at least this many pixels are written tiled with tifffile
+TILED_TIFF_MIN_PIXELS = 2048 * 2048
+TIFF_TILE_SIZE = (256, 256)
+
+# Photometric interpretation for the modes written with tifffile
+_TIFFFILE_PHOTOMETRIC = {"L": "minisblack", "RGB": "rgb", "RGBA": "rgb"}
+
+# CuPy moves normal map generation for large height maps to a CUDA GPU when available
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+# Height maps with at least this many pixels are sent to the GPU; for smaller
+# ones the upload and download cost more than the CPU path
+GPU_NORMAL_MIN_PIXELS = 2048 * 2048
+
+# One thread per output pixel, same formula as _normal_kernel
+_CUDA_NORMAL_SOURCE = r"""
+extern "C" __global__
+void normal_from_height(const unsigned char* height, const float scale,
+                        unsigned char* out, const int rows, const int cols)
+{
+    int x = blockDim.x * blockIdx.x + threadIdx.x;
+    int y = blockDim.y * blockIdx.y + threadIdx.y;
+    if (x >= cols || y >= rows) {
+        return;
+    }
+    int i = y * cols + x;
+    int above = y > 0 ? i - cols : i;
+    int below = y + 1 < rows ? i + cols : i;
+    int left = x > 0 ? i - 1 : i;
+    int right = x + 1 < cols ? i + 1 : i;
+    float dzdx = ((float)height[above] - (float)height[below]) * scale;
+    float dzdy = ((float)height[left] - (float)height[right]) * scale;
+    float k = 127.5f / sqrtf(dzdx * dzdx + dzdy * dzdy + 1.0f);
+    out[3 * i] = (unsigned char)(dzdx * k + 127.5f);
+    out[3 * i + 1] = (unsigned char)(dzdy * k + 127.5f);
+    out[3 * i + 2] = (unsigned char)(k + 127.5f);
+}
+"""
+
+# Compiled on first launch by CuPy
+_cuda_normal_kernel = cupy.RawKernel(_CUDA_NORMAL_SOURCE, "normal_from_height") if cupy is not None else None
+
+def _normal_map_on_gpu(height_array, scale):
+    """
+    Compute a normal map on the GPU.
+    
+    Args:
+        height_array: 2D uint8 height map
+        scale: Strength divided by 2 * 255, as float32
+        
+    Returns:
+        uint8 numpy array of shape (rows, cols, 3)
+    """
+    rows, cols = height_array.shape
+    height_gpu = cupy.asarray(np.ascontiguousarray(height_array))
+    normal_gpu = cupy.empty((rows, cols, 3), dtype=cupy.uint8)
+    block = (16, 16)
+    grid = ((cols + block[0] - 1) // block[0], (rows + block[1] - 1) // block[1])
+    _cuda_normal_kernel(grid, block, (height_gpu, scale, normal_gpu, np.int32(rows), np.int32(cols)))
+    return cupy.asnumpy(normal_gpu)
+
+# 8-bit modes the ImageChops arithmetic operations work on directly
+_CHOP_MODES = ("L", "LA", "RGB", "RGBA")
+
+# Modes whose split() bands are all mode "L"
+_L_BAND_MODES = frozenset(("L", "LA", "RGB", "RGBA", "RGBX", "CMYK", "YCbCr", "LAB", "HSV"))
+
+# Decoded images kept by load_image; textures can be tens of megabytes each
+LOAD_IMAGE_CACHE_SIZE = 8
+
+def _open_image(file_path):
+    """
+    Open an image from an in-memory copy of its file.
+    
+    Decoding stays lazy, but the file descriptor is closed before returning, so
+    large batches of loaded images do not run into open file limits.
+    
+    Args:
+        file_path: Path to the image file
+        
+    Returns:
+        PIL image, not decoded yet
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    return Image.open(io.BytesIO(data))
+
+def _decode_jpeg(data):
+    """
+    Decode a grayscale or color JPEG with libjpeg-turbo.
+    
+    Args:
+        data: Contents of the JPEG file
+        
+    Returns:
+        Decoded PIL image, or None for JPEGs left to Pillow (e.g. CMYK)
+    """
+    colorspace = _turbo_jpeg.decode_header(data)[3]
+    if colorspace == TJCS_GRAY:
+        return Image.fromarray(_turbo_jpeg.decode(data, pixel_format=TJPF_GRAY)[:, :, 0], mode="L")
+    if colorspace in (TJCS_RGB, TJCS_YCbCr):
+        return Image.fromarray(_turbo_jpeg.decode(data, pixel_format=TJPF_RGB), mode="RGB")
+    return None
+
+@functools.lru_cache(maxsize=LOAD_IMAGE_CACHE_SIZE)
+def _decode_image(file_path, mtime_ns):
+    """
+    Open and fully decode an image; cached by path and modification time.
+    
+    Args:
+        file_path: Path to the image file
+        mtime_ns: Modification time of the file, so changed files are decoded again
+        
+    Returns:
+        Decoded PIL image, shared between callers and never modified
+    """
+    if _turbo_jpeg is not None and file_path.lower().endswith(TURBOJPEG_EXTENSIONS):
+        with open(file_path, "rb") as f:
+            data = f.read()
+        try:
+            image = _decode_jpeg(data)
+        except Exception as e:
+            print(f"libjpeg-turbo could not decode {file_path}, using Pillow: {e}")
+            image = None
+        if image is not None:
+            return image
+    
+    image = _open_image(file_path)
+    image.load()
+    return image
+
+def _merge_arrays(bands, mode):
+    """
+    Interleave single-channel bands into one image with a single numpy copy per band.
+    
+    Args:
+        bands: 2D uint8 numpy arrays or mode "L" PIL images, all the same size
+        mode: Mode of the merged image
+        
+    Returns:
+        Merged PIL image
+    """
+    first = bands[0]
+    height, width = first.shape[:2] if isinstance(first, np.ndarray) else (first.height, first.width)
+    merged = np.empty((height, width, len(bands)), dtype=np.uint8)
+    for i, band in enumerate(bands):
+        merged[:, :, i] = np.asarray(band)
+    if len(bands) == 1:
+        merged = merged[:, :, 0]
+    return Image.fromarray(merged, mode=mode)
+
+# Output directories already created by save_image/generate_thumbnail in this process
+_CREATED_DIRECTORIES = set()
+
+def _ensure_parent_directory(file_path):
+    """
+    Create the directory of an output file, once per directory and process.
+    
+    Args:
+        file_path: Path of the file about to be written
+    """
+    directory = os.path.dirname(file_path)
+    if directory and directory not in _CREATED_DIRECTORIES:
+        os.makedirs(directory, exist_ok=True)
+        _CREATED_DIRECTORIES.add(directory)
+
+# Reducing gap used when downscaling to an output resolution, as Image.thumbnail does
+RESIZE_REDUCING_GAP = 2.0
+
+# Resampling filter type names accepted by resize_image
+_FILTER_MAP = {
+    "NEAREST": Image.NEAREST,
+    "BILINEAR": Image.BILINEAR,
+    "BICUBIC": Image.BICUBIC,
+    "LANCZOS": Image.LANCZOS
+}
+
+# Per-band lookup tables for Image.point
+_IDENTITY_LUT = list(range(256))
+_INVERT_LUT = list(range(255, -1, -1))
 
 class ImageProcessor:
     """
@@ -16,18 +262,50 @@ class ImageProcessor:
     """
     
     @staticmethod
-    def load_image(file_path):
+    def batch_apply(fn, items, max_workers=None):
+        """
+        Apply an image function to several items on a thread pool.
+        
+        Threads rather than processes are used: Pillow's decode, resize, convert,
+        split/merge and ImageChops loops and NumPy's array operations release the
+        GIL, so the work spreads over cores without pickling images between processes.
+        
+        Args:
+            fn: Function taking one item, e.g. ImageProcessor.invert_image
+            items: Items to process, e.g. image data dictionaries
+            max_workers: Maximum number of threads, one per CPU by default
+            
+        Returns:
+            List of results in the order of items
+        """
+        items = list(items)
+        if len(items) < 2:
+            return [fn(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(fn, items))
+    
+    @staticmethod
+    def load_image(file_path, target_size=None):
         """
         Load an image from a file.
         
         Args:
             file_path: Path to the image file
+            target_size: Optional size the image will be reduced to; JPEGs are then
+                decoded at the smallest built-in scale still at least this large
             
         Returns:
             Loaded image object or None if loading failed
         """
         try:
-            image = Image.open(file_path)
+            if target_size:
+                image = _open_image(file_path)
+                # Only JPEG decoders support draft mode, other formats ignore it
+                image.draft(None, (target_size, target_size))
+            else:
+                # Repeated loads of an unchanged file copy the cached decode
+                image = _decode_image(file_path, os.stat(file_path).st_mtime_ns).copy()
             
             # Return image data dictionary
             return {
@@ -43,6 +321,13 @@ class ImageProcessor:
             print(f"Error loading image from {file_path}: {e}")
             return None
     
+    @staticmethod
+    def clear_image_cache():
+        """
+        Drop the decoded images kept by load_image.
+        """
+        _decode_image.cache_clear()
+    
     @staticmethod
     def save_image(image_data, file_path, file_format="TIFF"):
         """
@@ -62,20 +347,51 @@ class ImageProcessor:
                 return False
                 
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            _ensure_parent_directory(file_path)
             
             # Save image in specified format
             if file_format.lower() in ["tiff", "tif"]:
-                image.save(file_path, "TIFF", compression="lzw")
+                if not ImageProcessor._save_tiled_tiff(image, file_path):
+                    image.save(file_path, "TIFF", compression="lzw")
             else:
                 image.save(file_path, file_format)
                 
-            print(f"Saved image to {file_path}")
+            logger.debug("Saved image to %s", file_path)
             return True
         except Exception as e:
             print(f"Error saving image to {file_path}: {e}")
             return False
     
+    @staticmethod
+    def _save_tiled_tiff(image, file_path):
+        """
+        Write a large 8-bit image as a tiled, LZW-compressed TIFF with tifffile.
+        
+        Args:
+            image: PIL image to save
+            file_path: Path to save the image to
+            
+        Returns:
+            True if the file was written, False if Pillow should write it instead
+        """
+        if (tifffile is None or image.mode not in _TIFFFILE_PHOTOMETRIC
+                or image.width * image.height < TILED_TIFF_MIN_PIXELS):
+            return False
+        try:
+            tifffile.imwrite(
+                file_path,
+                np.asarray(image),
+                photometric=_TIFFFILE_PHOTOMETRIC[image.mode],
+                extrasamples=(2,) if image.mode == "RGBA" else None,  # 2: unassociated alpha
+                compression="lzw",
+                tile=TIFF_TILE_SIZE
+            )
+            return True
+        except Exception as e:
+            # LZW needs the imagecodecs package
+            print(f"Writing tiled TIFF failed, using Pillow: {e}")
+            return False
+    
     @staticmethod
     def resize_image(image_data, width, height, filter_type="LANCZOS"):
         """
@@ -95,27 +411,21 @@ class ImageProcessor:
             if image is None:
                 return image_data
             
-            # Map filter type string to PIL resampling filter
-            filter_map = {
-                "NEAREST": Image.NEAREST,
-                "BILINEAR": Image.BILINEAR,
-                "BICUBIC": Image.BICUBIC, 
-                "LANCZOS": Image.LANCZOS
-            }
-            
-            # Get filter
-            resample_filter = filter_map.get(filter_type.upper(), Image.LANCZOS)
+            # Get filter; the common upper-case names hit the map without upper()
+            resample_filter = _FILTER_MAP.get(filter_type)
+            if resample_filter is None:
+                resample_filter = _FILTER_MAP.get(str(filter_type).upper(), Image.LANCZOS)
             
             # Resize image
             resized_image = image.resize((width, height), resample_filter)
             
-            # Create new image data dictionary
-            resized_data = dict(image_data)
-            resized_data["image"] = resized_image
-            resized_data["width"] = width
-            resized_data["height"] = height
-            
-            return resized_data
+            # Create result image data dictionary
+            return {
+                **image_data,
+                "image": resized_image,
+                "width": width,
+                "height": height
+            }
         except Exception as e:
             print(f"Error resizing image: {e}")
             return image_data
@@ -166,8 +476,21 @@ class ImageProcessor:
             new_width = int(width * scale_factor)
             new_height = int(height * scale_factor)
             
-            # Resize image
-            return ImageProcessor.resize_image(image_data, new_width, new_height, "LANCZOS")
+            # Resize image; like thumbnail(), first shrink by an integer factor with
+            # reduce() while staying at least RESIZE_REDUCING_GAP times the target
+            # size, then finish with LANCZOS. Unlike thumbnail() the source is untouched,
+            # as it usually belongs to a texture group.
+            resized_image = image.resize(
+                (new_width, new_height), Image.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP
+            )
+            
+            # Create result image data dictionary
+            return {
+                **image_data,
+                "image": resized_image,
+                "width": new_width,
+                "height": new_height
+            }
                 
         except Exception as e:
             print(f"Error resizing to resolution: {e}")
@@ -191,33 +514,31 @@ class ImageProcessor:
                 return image_data
             
             # Ensure image has sufficient channels
-            bands = list(image.split())
-            if channel_index >= len(bands):
+            band_count = len(image.getbands())
+            if channel_index >= band_count:
                 print(f"Channel index {channel_index} out of range")
                 return image_data
             
-            # Invert the specified channel
-            bands[channel_index] = ImageOps.invert(bands[channel_index])
-            
-            # Recombine channels
-            if image.mode == "RGB":
-                new_image = Image.merge("RGB", bands)
-            elif image.mode == "RGBA":
-                new_image = Image.merge("RGBA", bands)
-            elif image.mode == "L":
-                new_image = bands[0]
+            if image.mode == "L":
+                new_image = ImageOps.invert(image)
             else:
                 # For other modes, convert to RGB first
-                rgb_image = image.convert("RGB")
-                rgb_bands = list(rgb_image.split())
-                rgb_bands[channel_index] = ImageOps.invert(rgb_bands[channel_index])
-                new_image = Image.merge("RGB", rgb_bands)
-            
-            # Create new image data dictionary
-            result = dict(image_data)
-            result["image"] = new_image
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGB")
+                    band_count = 3
+                
+                # One lookup table per band, inverting only the specified channel,
+                # applied in a single pass without splitting the image
+                lut = []
+                for i in range(band_count):
+                    lut.extend(_INVERT_LUT if i == channel_index else _IDENTITY_LUT)
+                new_image = image.point(lut)
             
-            return result
+            # Create result image data dictionary
+            return {
+                **image_data,
+                "image": new_image
+            }
         except Exception as e:
             print(f"Error flipping channel: {e}")
             return image_data
@@ -238,18 +559,18 @@ class ImageProcessor:
             if image is None:
                 return []
             
-            # Split image into individual channels
-            bands = image.split()
+            # Bands of the common modes are already 8-bit grayscale
+            convert_bands = image.mode not in _L_BAND_MODES
             
             # Create image data dictionaries for each channel
             channel_names = ["red", "green", "blue", "alpha"]
             result = []
             
-            for i, band in enumerate(bands):
+            for i, band in enumerate(image.split()):
                 channel_name = channel_names[i] if i < len(channel_names) else f"channel_{i}"
                 
                 # Convert band to L mode (8-bit grayscale)
-                if band.mode != "L":
+                if convert_bands and band.mode != "L":
                     band = band.convert("L")
                 
                 channel_data = {
@@ -277,7 +598,8 @@ class ImageProcessor:
         Combine individual channels into a single image.
         
         Args:
-            channels: List of image data dictionaries (one per channel)
+            channels: List of image data dictionaries (one per channel); the
+                'image' of a channel may also be a 2D uint8 numpy array
             output_mode: Output mode (RGB, RGBA, etc.)
             
         Returns:
@@ -295,16 +617,21 @@ class ImageProcessor:
                 if image is None:
                     continue
                 
-                # If image is not in L mode, convert it
-                if image.mode != "L":
-                    image = image.convert("L")
+                if isinstance(image, np.ndarray):
+                    # Already computed as an array, e.g. by a numpy stage of the pipeline
+                    image_height, image_width = image.shape[:2]
+                else:
+                    # If image is not in L mode, convert it
+                    if image.mode != "L":
+                        image = image.convert("L")
+                    image_width, image_height = image.size
                 
                 bands.append(image)
                 
                 # Get dimensions from first channel
                 if width == 0 or height == 0:
-                    width = image.width
-                    height = image.height
+                    width = image_width
+                    height = image_height
                     source_path = channel_data.get("path", "")
             
             # Check if we have enough channels for the desired mode
@@ -323,8 +650,12 @@ class ImageProcessor:
             if len(bands) > required_channels.get(output_mode, 0):
                 bands = bands[:required_channels.get(output_mode, len(bands))]
             
-            # Combine channels
-            combined_image = Image.merge(output_mode, bands)
+            # Combine channels; array channels are interleaved with numpy rather
+            # than being wrapped in images only for Image.merge to copy them again
+            if any(isinstance(band, np.ndarray) for band in bands):
+                combined_image = _merge_arrays(bands, output_mode)
+            else:
+                combined_image = Image.merge(output_mode, bands)
             
             # Create result image data dictionary
             result = {
@@ -362,8 +693,13 @@ class ImageProcessor:
             
             # Ensure both images have the same size
             if image1.size != image2.size:
-                # Resize the second image to match the first
-                image2 = image2.resize(image1.size, Image.LANCZOS)
+                # Resize the second image to match the first; it only scales the
+                # first, so the cheaper 2-tap filter is good enough
+                image2 = image2.resize(image1.size, Image.BILINEAR)
+            
+            # ImageChops needs both images in the same mode
+            if image1.mode != image2.mode:
+                image2 = image2.convert(image1.mode)
             
             # Multiply images
             result_image = ImageChops.multiply(image1, image2)
@@ -399,15 +735,26 @@ class ImageProcessor:
             if image is None:
                 return image_data
             
-            # Invert image
-            inverted_image = ImageOps.invert(image)
+            # Palette indices cannot be inverted meaningfully, invert the colors instead
+            if image.mode == "P":
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+            
+            # Invert image; a lookup table per band also covers LA and RGBA,
+            # which ImageOps.invert rejects. Alpha is kept as it is.
+            if image.mode in _L_BAND_MODES:
+                lut = []
+                for band in image.getbands():
+                    lut.extend(_IDENTITY_LUT if band == "A" else _INVERT_LUT)
+                inverted_image = image.point(lut)
+            else:
+                inverted_image = ImageOps.invert(image)
             
             # Create result image data dictionary
-            result = dict(image_data)
-            result["image"] = inverted_image
-            result["path"] = image_data.get("path", "") + "_inverted"
-            
-            return result
+            return {
+                **image_data,
+                "image": inverted_image,
+                "path": image_data.get("path", "") + "_inverted"
+            }
         except Exception as e:
             print(f"Error inverting image: {e}")
             return image_data
@@ -432,13 +779,13 @@ class ImageProcessor:
             grayscale_image = image.convert("L")
             
             # Create result image data dictionary
-            result = dict(image_data)
-            result["image"] = grayscale_image
-            result["path"] = image_data.get("path", "") + "_grayscale"
-            result["channels"] = 1
-            result["mode"] = "L"
-            
-            return result
+            return {
+                **image_data,
+                "image": grayscale_image,
+                "path": image_data.get("path", "") + "_grayscale",
+                "channels": 1,
+                "mode": "L"
+            }
         except Exception as e:
             print(f"Error converting to grayscale: {e}")
             return image_data
@@ -468,13 +815,13 @@ class ImageProcessor:
             colorized_image = ImageOps.colorize(image, (0, 0, 0), color_rgb)
             
             # Create result image data dictionary
-            result = dict(image_data)
-            result["image"] = colorized_image
-            result["path"] = image_data.get("path", "") + "_colorized"
-            result["channels"] = 3
-            result["mode"] = "RGB"
-            
-            return result
+            return {
+                **image_data,
+                "image": colorized_image,
+                "path": image_data.get("path", "") + "_colorized",
+                "channels": 3,
+                "mode": "RGB"
+            }
         except Exception as e:
             print(f"Error colorizing image: {e}")
             return image_data
@@ -560,22 +907,21 @@ class ImageProcessor:
             if alpha_image.size != base_image.size:
                 alpha_image = alpha_image.resize(base_image.size, Image.LANCZOS)
             
-            # Convert base to RGBA if needed and set alpha
-            if base_image.mode == "RGB":
-                r, g, b = base_image.split()
-                result_image = Image.merge("RGBA", (r, g, b, alpha_image))
-            else:  # RGBA
-                r, g, b, _ = base_image.split()
-                result_image = Image.merge("RGBA", (r, g, b, alpha_image))
+            # Convert base to RGBA if needed and set alpha in place, on a copy
+            # unless the base is already a converted image of our own
+            if base_image is image_data.get("image"):
+                base_image = base_image.copy()
+            base_image.putalpha(alpha_image)
+            result_image = base_image
             
             # Create result image data dictionary
-            result = dict(image_data)
-            result["image"] = result_image
-            result["path"] = image_data.get("path", "") + "_with_alpha"
-            result["channels"] = 4
-            result["mode"] = "RGBA"
-            
-            return result
+            return {
+                **image_data,
+                "image": result_image,
+                "path": image_data.get("path", "") + "_with_alpha",
+                "channels": 4,
+                "mode": "RGBA"
+            }
         except Exception as e:
             print(f"Error adding alpha channel: {e}")
             return image_data
@@ -604,18 +950,34 @@ class ImageProcessor:
             if base_image.size != blend_image.size:
                 blend_image = blend_image.resize(base_image.size, Image.LANCZOS)
             
-            # Convert images to numpy arrays (0-1 float)
-            base_array = np.array(base_image).astype(np.float32) / 255.0
-            blend_array = np.array(blend_image).astype(np.float32) / 255.0
-            
-            # Apply linear burn formula
-            result_array = np.maximum(0, base_array + blend_array - 1.0)
-            
-            # Convert back to 8-bit
-            result_array = (result_array * 255.0).astype(np.uint8)
-            
-            # Create PIL image from array
-            result_image = Image.fromarray(result_array)
+            if base_image.mode == blend_image.mode and base_image.mode in _CHOP_MODES:
+                # In 8-bit terms the formula is max(0, base - (255 - blend)),
+                # which Pillow computes without leaving its own buffers
+                result_image = ImageChops.subtract(base_image, ImageChops.invert(blend_image))
+            else:
+                base_array = np.asarray(base_image)
+                blend_array = np.asarray(blend_image)
+                
+                if base_array.dtype == np.uint8 and blend_array.dtype == np.uint8:
+                    # int16 holds base + blend, so the formula needs one buffer and no floats
+                    result_array = base_array.astype(np.int16)
+                    result_array += blend_array
+                    result_array -= 255
+                    np.maximum(result_array, 0, out=result_array)
+                    result_array = result_array.astype(np.uint8)
+                else:
+                    # Convert images to numpy arrays (0-1 float)
+                    base_array = base_array.astype(np.float32) / 255.0
+                    blend_array = blend_array.astype(np.float32) / 255.0
+                    
+                    # Apply linear burn formula
+                    result_array = np.maximum(0, base_array + blend_array - 1.0)
+                    
+                    # Convert back to 8-bit
+                    result_array = (result_array * 255.0).astype(np.uint8)
+                
+                # Create PIL image from array
+                result_image = Image.fromarray(result_array)
             
             # Create result image data dictionary
             result = {
@@ -653,63 +1015,87 @@ class ImageProcessor:
             if height_image.mode != "L":
                 height_image = height_image.convert("L")
             
-            # Convert to numpy array
-            height_array = np.array(height_image).astype(np.float32) / 255.0
-            
-            # Create empty normal map array (RGB)
-            normal_array = np.zeros((height_array.shape[0], height_array.shape[1], 3), dtype=np.float32)
-            
-            # Compute partial derivatives using Sobel operator
-            dzdx = np.zeros_like(height_array)
-            dzdy = np.zeros_like(height_array)
-            
-            # Sobel in X direction
-            dzdx[:-1, :] = height_array[1:, :] - height_array[:-1, :]
-            
-            # Sobel in Y direction
-            dzdy[:, :-1] = height_array[:, 1:] - height_array[:, :-1]
-            
-            # Normalize derivatives by strength
-            dzdx = -dzdx * strength
-            dzdy = -dzdy * strength
-            
-            # Compute normal vectors
-            # Normal X component
+            # Height values stay in 0-255; the 1/255 scale and the halving of the
+            # central differences (which span two pixels) are folded into the strength
+            scale = np.float32(strength / 510.0)
+            
+            if _cuda_normal_kernel is not None and height_image.width * height_image.height >= GPU_NORMAL_MIN_PIXELS:
+                try:
+                    normal_array = _normal_map_on_gpu(np.asarray(height_image), scale)
+                    return ImageProcessor._normal_map_result(height_data, normal_array)
+                except Exception as e:
+                    # No usable device or driver; compute on the CPU instead
+                    print(f"GPU normal map generation failed, using the CPU: {e}")
+            
+            if _normal_kernel is not None:
+                height_array = np.asarray(height_image)
+                rows, cols = height_array.shape
+                normal_array = np.empty((rows, cols, 3), dtype=np.uint8)
+                _normal_kernel(height_array, scale, normal_array)
+                return ImageProcessor._normal_map_result(height_data, normal_array)
+            
+            # Pad once by repeating the edge pixels, so the differences at the
+            # border need no special case and leave no seam
+            padded = np.pad(np.asarray(height_image), 1, mode="edge").astype(np.float32)
+            rows, cols = padded.shape[0] - 2, padded.shape[1] - 2
+            
+            # Negated central differences, taken between views of the padded map
+            dzdx = np.subtract(padded[:-2, 1:-1], padded[2:, 1:-1])
+            dzdx *= scale
+            dzdy = np.subtract(padded[1:-1, :-2], padded[1:-1, 2:])
+            dzdy *= scale
+            
+            # The normal is (dzdx, dzdy, 1) / norm, mapped from [-1,1] to [0,255]:
+            # 127.5 * component / norm + 127.5, with k = 127.5 / norm shared by all three
+            if numexpr is not None:
+                k = numexpr.evaluate("127.5 / sqrt(dzdx * dzdx + dzdy * dzdy + 1)")
+            else:
+                k = dzdx * dzdx
+                k += dzdy * dzdy
+                k += 1.0
+                np.sqrt(k, out=k)
+                np.divide(127.5, k, out=k)
+            
+            # Write each channel straight into the 8-bit output, reusing the derivative buffers
+            normal_array = np.empty((rows, cols, 3), dtype=np.uint8)
+            dzdx *= k
+            dzdx += 127.5
             normal_array[:, :, 0] = dzdx
-            
-            # Normal Y component
+            dzdy *= k
+            dzdy += 127.5
             normal_array[:, :, 1] = dzdy
+            k += 127.5
+            normal_array[:, :, 2] = k
             
-            # Normal Z component (always positive)
-            normal_array[:, :, 2] = 1.0
-            
-            # Normalize vectors
-            norm = np.sqrt(np.sum(normal_array**2, axis=2, keepdims=True))
-            normal_array = normal_array / (norm + 1e-8)  # Avoid division by zero
-            
-            # Convert from [-1,1] to [0,1] range
-            normal_array = normal_array * 0.5 + 0.5
-            
-            # Convert to 8-bit
-            normal_array = (normal_array * 255.0).astype(np.uint8)
-            
-            # Create PIL image
-            normal_image = Image.fromarray(normal_array, mode="RGB")
-            
-            # Create result image data dictionary
-            result = {
-                "path": height_data.get("path", "") + "_normal",
-                "image": normal_image,
-                "width": normal_image.width,
-                "height": normal_image.height,
-                "channels": 3,
-                "mode": "RGB"
-            }
-            
-            return result
+            return ImageProcessor._normal_map_result(height_data, normal_array)
         except Exception as e:
             print(f"Error generating normal map: {e}")
             return None
+    
+    @staticmethod
+    def _normal_map_result(height_data, normal_array):
+        """
+        Wrap a computed normal map in an image data dictionary.
+        
+        Args:
+            height_data: Height map image data dictionary the normal map was made from
+            normal_array: uint8 array of shape (height, width, 3)
+            
+        Returns:
+            Normal map image data dictionary
+        """
+        # Create PIL image
+        normal_image = Image.fromarray(normal_array, mode="RGB")
+        
+        # Create result image data dictionary
+        return {
+            "path": height_data.get("path", "") + "_normal",
+            "image": normal_image,
+            "width": normal_image.width,
+            "height": normal_image.height,
+            "channels": 3,
+            "mode": "RGB"
+        }
             
     @staticmethod
     def generate_thumbnail(image_path, output_path, size=(256, 256)):
@@ -725,19 +1111,19 @@ class ImageProcessor:
             True if successful, False otherwise
         """
         try:
-            # Open the image
-            image = Image.open(image_path)
-            
-            # Resize image to thumbnail size, keeping aspect ratio
-            image.thumbnail(size, Image.LANCZOS)
-            
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            # Save thumbnail
-            image.save(output_path, "PNG")
+            # Open the image; the file is closed as soon as the thumbnail is saved
+            with Image.open(image_path) as image:
+                # Resize image to thumbnail size, keeping aspect ratio; thumbnail()
+                # drafts the decode itself, so JPEGs are already decoded downscaled
+                image.thumbnail(size, Image.LANCZOS)
+                
+                # Create directory if it doesn't exist
+                _ensure_parent_directory(output_path)
+                
+                # Save thumbnail
+                image.save(output_path, "PNG")
             
-            print(f"Generated thumbnail at {output_path}")
+            logger.debug("Generated thumbnail at %s", output_path)
             return True
         except Exception as e:
             print(f"Error generating thumbnail: {e}")
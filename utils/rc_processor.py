@@ -8,11 +8,121 @@ RC Processor
 """
 
 import os
+import time
+import logging
+import tempfile
 import subprocess
 import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from utils.config_manager import ConfigManager
 from language.language_manager import get_text
 
+# RC.exe的逐行輸出只在此logger設為DEBUG時顯示
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# 為錯誤報告保留的RC.exe輸出末尾字符數
+RC_OUTPUT_TAIL_CHARS = 64 * 1024
+
+# 所有JSON轉CGF的RC.exe命令共用的參數
+RC_JSON_ARGS = ("/overwriteextension=fbx",)
+
+# 批次處理時輪詢已生成CGF文件的間隔（秒）
+PROGRESS_POLL_SECONDS = 0.5
+
+# RC.exe輸出目錄 -> 該目錄中文件名（已規範大小寫）的集合；在RC.exe執行前清除、返回後重新掃描
+_SCAN_CACHE = {}
+
+def _scan_directory(directory):
+    """
+    以單次os.scandir列出目錄中的文件名，代替逐個文件的os.path.exists。
+    
+    Args:
+        directory: 目錄路徑
+        
+    Returns:
+        文件名（已規範大小寫）的集合，無法讀取目錄時為空集合
+    """
+    try:
+        with os.scandir(directory or ".") as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        return set()
+
+def _in_directory(path):
+    """
+    通過緩存的目錄列表檢查文件是否存在，每個目錄只掃描一次。
+    
+    Args:
+        path: 文件路徑
+        
+    Returns:
+        如果文件存在，則為True，否則為False
+    """
+    directory = os.path.dirname(path)
+    names = _SCAN_CACHE.get(directory)
+    if names is None:
+        names = _SCAN_CACHE[directory] = _scan_directory(directory)
+    return os.path.normcase(os.path.basename(path)) in names
+
+def _group_by_directory(paths):
+    """
+    將文件路徑按目錄分組。
+    
+    Args:
+        paths: 文件路徑列表
+        
+    Returns:
+        目錄 -> 文件名（已規範大小寫）集合的字典
+    """
+    groups = collections.defaultdict(set)
+    for path in paths:
+        groups[os.path.dirname(path)].add(os.path.normcase(os.path.basename(path)))
+    return groups
+
+def _count_new_files(groups, since):
+    """
+    計算在某個時間之後生成或更新的文件數量，每個目錄只掃描一次。
+    
+    Args:
+        groups: _group_by_directory返回的字典
+        since: 時間戳，早於此時間的文件不計入
+        
+    Returns:
+        已生成的文件數量
+    """
+    count = 0
+    for directory, names in groups.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                for entry in entries:
+                    if os.path.normcase(entry.name) in names and entry.stat().st_mtime >= since:
+                        count += 1
+        except OSError:
+            pass
+    return count
+
+# (RC.exe路徑, 是否存在)，所有RCProcessor實例共用；首次使用時讀取，由RCProcessor.refresh_config()更新
+_RC_CONFIG = None
+
+# 所有RCProcessor實例共用的線程池，首次使用時創建
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+def _get_executor():
+    """
+    獲取共用的RC.exe線程池，首次使用時創建。
+    
+    Returns:
+        ThreadPoolExecutor，每個CPU一個線程
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _EXECUTOR
+
 class RCProcessor:
     """
     用於處理JSON配置文件並生成CryEngine模型格式的處理器類。
@@ -22,11 +132,13 @@ class RCProcessor:
         """
         初始化RC處理器。
         """
-        self.config_manager = ConfigManager()
-        self.rc_exe_path = self.config_manager.get("rc_exe_path", "")
-        self.processing_thread = None
+        self.config_manager = ConfigManager.shared()
+        # RC.exe在兩次處理之間不會移動，路徑只在首次使用和refresh_config()時讀取並檢查
+        self.rc_exe_path, self._rc_exe_found = _RC_CONFIG or self.refresh_config()
         self.cancel_flag = False
         self.progress_callback = None
+        self._futures = set()
+        self._futures_lock = threading.Lock()
     
     def set_progress_callback(self, callback):
         """
@@ -46,7 +158,7 @@ class RCProcessor:
             output_cgf_path: 可選的輸出CGF文件路徑。如果未提供，將使用與JSON相同的基本名稱。
             
         Returns:
-            如果處理成功開始，則為True，否則為False
+            處理任務的Future（可用add_done_callback獲取結果），如果無法開始則為False
         """
         # 檢查RC.exe路徑是否已設置
         if not self.rc_exe_path:
@@ -54,30 +166,202 @@ class RCProcessor:
             return False
         
         # 檢查RC.exe是否存在
-        if not os.path.exists(self.rc_exe_path):
+        if not self._rc_exe_found:
             print(f"在{self.rc_exe_path}找不到RC.exe")
             return False
         
-        # 檢查是否已經在處理中
-        if self.processing_thread and self.processing_thread.is_alive():
-            return False
-            
-        # 重置取消標誌
-        self.cancel_flag = False
-        
         # 如果沒有指定輸出CGF路徑，則使用與JSON相同的基本名稱
         if not output_cgf_path:
             output_cgf_path = os.path.splitext(json_path)[0] + ".cgf"
         
-        # 啟動處理線程
-        self.processing_thread = threading.Thread(
-            target=self._process_thread,
-            args=(json_path, output_cgf_path),
-            daemon=True
-        )
-        self.processing_thread.start()
+        # 提交到共用線程池
+        return self._submit(self._process_thread, json_path, output_cgf_path)
+    
+    def process_json_files(self, json_paths, output_dir=None):
+        """
+        以單次RC.exe調用處理多個JSON配置文件，生成CGF模型。
         
-        return True
+        所有文件通過列表文件傳給同一個RC.exe進程，省去每個文件啟動進程的開銷。
+        每個CGF使用與其JSON相同的基本名稱。
+        
+        Args:
+            json_paths: JSON配置文件路徑的列表
+            output_dir: 可選的輸出目錄。如果未提供，CGF生成在各自JSON所在的目錄。
+            
+        Returns:
+            處理任務的Future（可用add_done_callback獲取結果），如果無法開始則為False
+        """
+        json_paths = list(json_paths)
+        if not json_paths:
+            return False
+        
+        # 只有一個文件時使用單文件處理
+        if len(json_paths) == 1:
+            output_cgf_path = None
+            if output_dir:
+                output_cgf_path = os.path.join(
+                    output_dir, os.path.splitext(os.path.basename(json_paths[0]))[0] + ".cgf"
+                )
+            return self.process_json_file(json_paths[0], output_cgf_path)
+        
+        # 檢查RC.exe路徑是否已設置
+        if not self.rc_exe_path:
+            print("RC.exe路徑未設置")
+            return False
+        
+        # 檢查RC.exe是否存在
+        if not self._rc_exe_found:
+            print(f"在{self.rc_exe_path}找不到RC.exe")
+            return False
+        
+        # 提交到共用線程池
+        return self._submit(self._process_batch_thread, json_paths, output_dir)
+    
+    def _submit(self, fn, *args):
+        """
+        將處理任務提交到共用線程池並追蹤其Future。
+        
+        Args:
+            fn: 處理函數
+            *args: 處理函數的參數
+            
+        Returns:
+            任務的Future，其結果為處理是否成功
+        """
+        with self._futures_lock:
+            # 沒有進行中的任務時才重置取消標誌，以免撤銷對其他任務的取消
+            if not self._futures:
+                self.cancel_flag = False
+            future = _get_executor().submit(fn, *args)
+            self._futures.add(future)
+        future.add_done_callback(self._discard_future)
+        return future
+    
+    def _discard_future(self, future):
+        """
+        任務完成後停止追蹤其Future。
+        
+        Args:
+            future: 已完成的Future
+        """
+        with self._futures_lock:
+            self._futures.discard(future)
+    
+    def _process_batch_thread(self, json_paths, output_dir):
+        """
+        以單次RC.exe調用處理多個JSON文件的線程函數。
+        
+        Args:
+            json_paths: JSON配置文件路徑的列表
+            output_dir: 輸出目錄，或None表示輸出到各自JSON所在的目錄
+        """
+        list_file = None
+        try:
+            # 檢查是否取消處理
+            if self.cancel_flag:
+                return False
+            
+            # 跳過不存在的文件
+            existing_paths = []
+            for json_path in json_paths:
+                if os.path.exists(json_path):
+                    existing_paths.append(json_path)
+                else:
+                    print(f"找不到JSON文件: {json_path}")
+            if not existing_paths:
+                if self.progress_callback:
+                    self.progress_callback(0.0, "錯誤: 找不到JSON文件", f"{len(json_paths)}個文件都不存在")
+                return False
+            
+            # 預期生成的CGF文件
+            output_paths = []
+            for json_path in existing_paths:
+                base_filename = os.path.splitext(os.path.basename(json_path))[0] + ".cgf"
+                output_paths.append(os.path.join(output_dir or os.path.dirname(json_path), base_filename))
+            total = len(output_paths)
+            
+            # 更新進度
+            if self.progress_callback:
+                self.progress_callback(0.0, "開始RC.exe處理", f"處理{total}個JSON文件")
+            
+            # 構建RC命令，所有文件寫入同一個列表文件
+            with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+                list_file = f.name
+                f.write("\n".join(existing_paths))
+            cmd = [
+                self.rc_exe_path,
+                f"/listfile={list_file}",
+                *RC_JSON_ARGS,
+                f"/threads={os.cpu_count() or 1}"
+            ]
+            if output_dir:
+                cmd.append(f"/targetroot={output_dir}")
+            
+            # 執行命令，同時在背景線程中以已生成的CGF文件數量報告進度
+            print(f"執行命令: {subprocess.list2cmdline(cmd)}")
+            # 留出餘量，以應對時間戳精度較粗的文件系統
+            start_time = time.time() - 2
+            groups = _group_by_directory(output_paths)
+            done = threading.Event()
+            progress = [0.0]
+            
+            def poll_progress():
+                while not done.wait(PROGRESS_POLL_SECONDS):
+                    if self.progress_callback:
+                        count = _count_new_files(groups, start_time)
+                        progress[0] = count / total
+                        self.progress_callback(progress[0], "調用RC.exe", f"已生成 {count}/{total} 個CGF文件")
+            
+            poller = threading.Thread(target=poll_progress, daemon=True)
+            poller.start()
+            try:
+                returncode, output = self._run_rc(cmd, lambda: progress[0])
+            finally:
+                done.set()
+                poller.join()
+            
+            # 批次失敗時逐個文件重試，一個有問題的模型不會連累其他模型
+            if returncode != 0 and not self.cancel_flag:
+                print(f"RC.exe批次處理失敗（錯誤代碼: {returncode}），逐個文件重試:\n{output}")
+                results = []
+                for json_path, output_cgf_path in zip(existing_paths, output_paths):
+                    if self.cancel_flag:
+                        break
+                    results.append(self._process_thread(json_path, output_cgf_path))
+                return len(results) == total and all(results)
+            
+            # 檢查錯誤
+            if not self._check_rc_result(returncode, output):
+                return False
+            
+            # 檢查生成的文件是否都存在
+            count = _count_new_files(groups, start_time)
+            if count == total:
+                print(f"成功生成{total}個CGF文件")
+                if self.progress_callback:
+                    self.progress_callback(1.0, "RC.exe處理完成", f"生成 {total} 個文件")
+                return True
+            else:
+                print(f"警告: 雖然RC.exe成功執行，但只找到{count}/{total}個生成的CGF文件")
+                if self.progress_callback:
+                    self.progress_callback(1.0, "RC.exe處理不完整", f"已生成 {count}/{total} 個CGF文件")
+                return False
+            
+        except Exception as e:
+            print(f"處理JSON文件時發生錯誤: {e}")
+            if self.progress_callback:
+                self.progress_callback(
+                    1.0,
+                    "RC處理錯誤",
+                    f"錯誤: {str(e)}"
+                )
+            return False
+        finally:
+            if list_file:
+                try:
+                    os.remove(list_file)
+                except OSError:
+                    pass
     
     def _process_thread(self, json_path, output_cgf_path):
         """
@@ -115,45 +399,34 @@ class RCProcessor:
                 )
             
             # 構建RC命令
-            # 使用format: RC.exe Tree.json /overwriteextension=fbx /overwritefilename="Tree.cgf"
+            # 使用format: RC.exe Tree.json /overwriteextension=fbx /overwritefilename=Tree.cgf
+            # 參數列表本身已分隔各參數，文件名不能再加引號，否則引號會原樣傳給RC.exe
             base_filename = os.path.splitext(output_filename)[0]
             cmd = [
                 self.rc_exe_path,
                 json_path,
-                "/overwriteextension=fbx",
-                f"/overwritefilename=\"{base_filename}.cgf\""
+                *RC_JSON_ARGS,
+                f"/overwritefilename={base_filename}.cgf"
             ]
             
             # 執行命令
-            print(f"執行命令: {' '.join(cmd)}")
+            print(f"執行命令: {subprocess.list2cmdline(cmd)}")
             if self.progress_callback:
                 self.progress_callback(0.3, "調用RC.exe", "正在生成CGF文件...")
             
-            result = subprocess.run(
-                cmd,
-                check=False,
-                capture_output=True,
-                text=True
-            )
+            # RC.exe會改變輸出目錄的內容，使其緩存的列表失效
+            output_directory = os.path.dirname(output_cgf_path)
+            _SCAN_CACHE.pop(output_directory, None)
             
-            # 輸出處理結果
-            print(f"RC.exe輸出:")
-            print(result.stdout)
+            returncode, output = self._run_rc(cmd, lambda: 0.3)
             
             # 檢查錯誤
-            if result.returncode != 0:
-                print(f"RC.exe錯誤:")
-                print(result.stderr)
-                if self.progress_callback:
-                    self.progress_callback(
-                        1.0,
-                        "RC.exe處理失敗",
-                        f"錯誤代碼: {result.returncode}"
-                    )
+            if not self._check_rc_result(returncode, output):
                 return False
             
-            # 檢查生成的文件是否存在
-            if os.path.exists(output_cgf_path):
+            # 檢查生成的文件是否存在，RC.exe返回後重新掃描輸出目錄
+            _SCAN_CACHE[output_directory] = _scan_directory(output_directory)
+            if _in_directory(output_cgf_path):
                 print(f"成功生成CGF文件: {output_cgf_path}")
                 if self.progress_callback:
                     self.progress_callback(
@@ -182,11 +455,136 @@ class RCProcessor:
                 )
             return False
     
+    def _run_rc(self, cmd, get_progress):
+        """
+        執行RC.exe並逐行讀取其輸出，而不是等待結束後一次性取得。
+        
+        每行輸出作為狀態轉發給進度回調；只保留最後RC_OUTPUT_TAIL_CHARS個字符供錯誤報告。
+        處理被取消時終止RC.exe。
+        
+        Args:
+            cmd: RC.exe命令行
+            get_progress: 返回當前進度(0.0-1.0)的函數，用於轉發輸出行
+            
+        Returns:
+            (返回碼, 輸出末尾) 元組
+        """
+        # 沒有人接收輸出時丟棄標準輸出，只保留錯誤輸出
+        if self.progress_callback is None and not logger.isEnabledFor(logging.DEBUG):
+            return self._run_rc_quiet(cmd)
+        
+        tail = collections.deque()
+        tail_size = 0
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1
+        )
+        with process:
+            for line in process.stdout:
+                line = line.rstrip()
+                tail.append(line)
+                tail_size += len(line) + 1
+                while tail_size > RC_OUTPUT_TAIL_CHARS:
+                    tail_size -= len(tail.popleft()) + 1
+                logger.debug("RC.exe: %s", line)
+                
+                if self.cancel_flag:
+                    process.terminate()
+                    break
+                if line and self.progress_callback:
+                    self.progress_callback(get_progress(), "調用RC.exe", line)
+        return process.returncode, "\n".join(tail)
+    
+    def _run_rc_quiet(self, cmd):
+        """
+        執行RC.exe，其標準輸出直接丟棄，只收集錯誤輸出。處理被取消時終止RC.exe。
+        
+        Args:
+            cmd: RC.exe命令行
+            
+        Returns:
+            (返回碼, 錯誤輸出末尾) 元組
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        while True:
+            try:
+                _, stderr = process.communicate(timeout=PROGRESS_POLL_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                if self.cancel_flag and process.poll() is None:
+                    process.terminate()
+        output = stderr.decode(errors="replace") if process.returncode != 0 else ""
+        return process.returncode, output[-RC_OUTPUT_TAIL_CHARS:]
+    
+    def _check_rc_result(self, returncode, output):
+        """
+        檢查RC.exe的執行結果，失敗或取消時報告。
+        
+        Args:
+            returncode: RC.exe的返回碼
+            output: RC.exe輸出的末尾
+            
+        Returns:
+            如果RC.exe成功執行，則為True，否則為False
+        """
+        if self.cancel_flag:
+            if self.progress_callback:
+                self.progress_callback(1.0, "RC.exe處理已取消", "")
+            return False
+        
+        if returncode != 0:
+            print(f"RC.exe錯誤:\n{output}")
+            if self.progress_callback:
+                self.progress_callback(
+                    1.0,
+                    "RC.exe處理失敗",
+                    f"錯誤代碼: {returncode}"
+                )
+            return False
+        
+        return True
+    
+    @classmethod
+    def refresh_config(cls):
+        """
+        重新讀取所有RCProcessor共用的RC.exe路徑，用於在運行時更改設置之後。
+        已創建的實例需調用refresh()才會使用新路徑。
+        
+        Returns:
+            (RC.exe路徑, 是否存在) 元組
+        """
+        global _RC_CONFIG
+        rc_exe_path = ConfigManager.shared().get("rc_exe_path", "")
+        _RC_CONFIG = (rc_exe_path, bool(rc_exe_path) and os.path.exists(rc_exe_path))
+        return _RC_CONFIG
+    
+    def refresh(self):
+        """
+        重新讀取RC.exe路徑並清除緩存的目錄列表。
+        """
+        self.rc_exe_path, self._rc_exe_found = self.refresh_config()
+        _SCAN_CACHE.clear()
+    
     def cancel(self):
         """
         取消正在進行的處理。
         """
         self.cancel_flag = True
+        _SCAN_CACHE.clear()
+        
+        # 取消尚未開始的任務，已在運行的任務會檢查取消標誌
+        with self._futures_lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
     
     def is_processing(self):
         """
@@ -195,4 +593,5 @@ class RCProcessor:
         Returns:
             如果正在處理，則為True，否則為False
         """
-        return self.processing_thread is not None and self.processing_thread.is_alive()
+        with self._futures_lock:
+            return any(not future.done() for future in self._futures)
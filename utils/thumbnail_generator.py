@@ -9,29 +9,71 @@ Implemented exactly according to dev_example/render_script.py.
 
 import bpy
 import os
+import sys
 import math
+import numpy as np
 from mathutils import Vector
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 
-def _reset_scene():
-    """Clears the current Blender scene exactly as in the original script."""
+# Batches are rendered in worker processes, each with its own bpy; frozen builds cannot start them
+USE_THUMBNAIL_PROCESSES = not getattr(sys, "frozen", False)
+
+# Every worker imports its own bpy (hundreds of MB), so only a few are started
+THUMBNAIL_PROCESS_WORKERS = min(2, os.cpu_count() or 1)
+
+# Camera and sun kept across thumbnails rendered by this process
+_SHARED_CAMERA = None
+_SHARED_SUN = None
+
+# Set once the FBX importer add-on has been enabled in this process
+_FBX_IMPORTER_READY = False
+
+def _ensure_fbx_importer():
+    """Enables the FBX importer add-on once per process, so the first import doesn't pay for loading it."""
+    global _FBX_IMPORTER_READY
+    if _FBX_IMPORTER_READY:
+        return
     try:
-        # Use the exact same implementation as the original script
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
-        for collection in bpy.data.collections:
-            bpy.context.scene.collection.children.unlink(collection)
-        for collection in bpy.data.collections:
-            bpy.data.collections.remove(collection)
-        print("Scene reset using original script method.")
+        import addon_utils
+        addon_utils.enable("io_scene_fbx", default_set=True)
     except Exception as e:
-        print(f"Error during scene reset: {e}")
-        traceback.print_exc()
+        # Factory settings enable the add-on by default, so the import can still go ahead
+        print(f"Warning: Could not preload the FBX importer: {e}")
+    _FBX_IMPORTER_READY = True
+
+def _is_alive(obj):
+    """Checks that a kept object still exists and is linked to the scene."""
+    try:
+        return obj is not None and bpy.context.scene.objects.get(obj.name) == obj
+    except ReferenceError:
+        # The object was removed from bpy.data
+        return False
+
+def _move_to_scene_root(obj):
+    """Links an object directly to the scene collection, so purging collections leaves it in place."""
+    root = bpy.context.scene.collection
+    for collection in list(obj.users_collection):
+        if collection != root:
+            collection.objects.unlink(obj)
+    if root.objects.get(obj.name) is None:
+        root.objects.link(obj)
+    return obj
+
+def _purge_scene():
+    """Removes all scene objects but the shared camera and sun through bpy.data, without operators or undo steps."""
+    keep = [obj for obj in (_SHARED_CAMERA, _SHARED_SUN) if _is_alive(obj)]
+    bpy.data.batch_remove([obj for obj in bpy.context.scene.objects if obj not in keep])
+    bpy.data.batch_remove(list(bpy.data.collections))
+    bpy.data.batch_remove([mesh for mesh in bpy.data.meshes if mesh.users == 0])
+    _BBOX_CACHE.clear()
+    print("Scene purged, keeping the shared camera and sun.")
 
 def _setup_camera():
     """Creates and sets up a camera, exactly matching the original script."""
-    bpy.ops.object.camera_add()
-    camera = bpy.context.object
+    # Created through bpy.data; an operator would also trigger a depsgraph update
+    camera = bpy.data.objects.new("Camera", bpy.data.cameras.new("Camera"))
+    bpy.context.scene.collection.objects.link(camera)
     bpy.context.scene.camera = camera
     # Note: original script sets focal length in position_camera, not here
     print("Camera setup complete.")
@@ -40,28 +82,45 @@ def _setup_camera():
 def _setup_lighting():
     """Creates and sets up a sun light, matching old script."""
     # Match old script's location and rotation
-    bpy.ops.object.light_add(type='SUN', radius=1, location=(5, 5, 5)) 
-    sun = bpy.context.active_object
+    light = bpy.data.lights.new("Sun", type='SUN')
+    light.shadow_soft_size = 1
+    sun = bpy.data.objects.new("Sun", light)
+    sun.location = (5, 5, 5)
+    bpy.context.scene.collection.objects.link(sun)
     sun.data.energy = 2.0 # Keep energy setting
     sun.rotation_euler = (math.radians(45), 0, math.radians(45)) 
     print("Lighting setup complete (matched old script).")
     return sun
 
-def _get_object_dimensions():
-    """Calculates the bounding box dimensions and center of all mesh objects, exactly as in original script."""
-    objects = [o for o in bpy.context.scene.objects if o.type == 'MESH']
+# Local bounding boxes (8x3 arrays) of mesh data, shared by every object instancing it.
+# Keyed by mesh name, which is unique within one FBX; cleared by _purge_scene so
+# a mesh reusing a name from an earlier FBX is never mistaken for a cached one.
+_BBOX_CACHE = {}
+
+def _local_bound_box(ob):
+    """Returns the object's local bounding box corners, cached per mesh for unmodified objects."""
+    # Modifiers change the bounding box per object, so those are not shared
+    if ob.modifiers:
+        return np.array(ob.bound_box)
+    
+    key = ob.data.name
+    box = _BBOX_CACHE.get(key)
+    if box is None:
+        box = _BBOX_CACHE[key] = np.array(ob.bound_box)
+    return box
+
+def _get_object_dimensions(objects):
+    """Calculates the bounding box dimensions and center of the given mesh objects, exactly as in original script."""
     if not objects:
         return Vector((0, 0, 0)), Vector((0, 0, 0))
     
-    min_co = Vector((float('inf'),) * 3)
-    max_co = Vector((float('-inf'),) * 3)
+    # Transform the 8 bounding box corners of every object to world space in one batched product
+    boxes = np.array([_local_bound_box(ob) for ob in objects])
+    matrices = np.array([ob.matrix_world for ob in objects])
+    corners = boxes @ matrices[:, :3, :3].transpose(0, 2, 1) + matrices[:, np.newaxis, :3, 3]
     
-    for ob in objects:
-        matrix = ob.matrix_world
-        for v in ob.bound_box:
-            v_world = matrix @ Vector(v)
-            min_co = Vector(map(min, zip(min_co, v_world)))
-            max_co = Vector(map(max, zip(max_co, v_world)))
+    min_co = Vector(corners.min(axis=(0, 1)))
+    max_co = Vector(corners.max(axis=(0, 1)))
     
     print(f"Calculated dimensions: {max_co - min_co}, center: {(min_co + max_co) / 2}")
     return max_co - min_co, (min_co + max_co) / 2
@@ -96,33 +155,63 @@ def _position_camera(camera, dimensions, center):
     print(f"Camera positioned at: {camera.location}, height reduced by: {height_reduction}")
     print(f"Aimed at: {aim_point}, 20% below center, lens: {camera.data.lens}mm")
 
-def _center_objects():
-    """Centers objects in the scene, exactly as in original script."""
-    objects = [o for o in bpy.context.scene.objects if o.type == 'MESH']
+# Anti-aliasing samples for thumbnail renders; a 256x256 preview needs few
+THUMBNAIL_RENDER_SAMPLES = 8
+
+def _setup_render_engine(scene):
+    """Switches the scene to EEVEE with low samples, which rasterizes a tiny preview far faster than Cycles."""
+    # Blender 4.2-4.x names the engine BLENDER_EEVEE_NEXT; older and newer versions use BLENDER_EEVEE
+    engines = bpy.types.RenderSettings.bl_rna.properties['engine'].enum_items.keys()
+    scene.render.engine = 'BLENDER_EEVEE_NEXT' if 'BLENDER_EEVEE_NEXT' in engines else 'BLENDER_EEVEE'
+    
+    eevee = scene.eevee
+    eevee.taa_render_samples = THUMBNAIL_RENDER_SAMPLES
+    # Bloom and screen space reflections only exist in the legacy EEVEE
+    if hasattr(eevee, 'use_bloom'):
+        eevee.use_bloom = False
+    if hasattr(eevee, 'use_ssr'):
+        eevee.use_ssr = False
+    
+    # Keep render data between consecutive thumbnails
+    scene.render.use_persistent_data = True
+    print(f"Render engine set to {scene.render.engine} with {THUMBNAIL_RENDER_SAMPLES} samples.")
+
+def _center_objects(objects):
+    """Centers the given mesh objects in the scene, exactly as in original script."""
     if not objects:
         return
     
-    center = Vector((0, 0, 0))
-    for obj in objects:
-        center += obj.location
-    center /= len(objects)
+    cx, cy, cz = np.array([obj.location for obj in objects]).mean(axis=0)
     
+    # Component writes avoid a temporary Vector per object
     for obj in objects:
-        obj.location -= center
+        location = obj.location
+        location.x -= cx
+        location.y -= cy
+        location.z -= cz
     
-    print(f"Objects centered by offset: {-center}")
+    print(f"Objects centered by offset: {Vector((-cx, -cy, -cz))}")
+
 
+def _is_thumbnail_fresh(fbx_path, output_png_path):
+    """Returns True if the PNG exists and is not older than the FBX it was rendered from."""
+    try:
+        return os.stat(output_png_path).st_mtime >= os.stat(fbx_path).st_mtime
+    except OSError:
+        return False
 
-def generate_thumbnail(fbx_path, output_png_path):
+def generate_thumbnail(fbx_path, output_png_path, threads=None, force=False):
     """
     Generates a 256x256 PNG thumbnail for the given FBX model.
 
     Args:
         fbx_path (str): Path to the input FBX file.
         output_png_path (str): Path to save the output PNG thumbnail.
+        threads (int, optional): Number of render threads, auto-detected by Blender by default.
+        force (bool, optional): Render even if the PNG is already newer than the FBX.
 
     Returns:
-        bool: True if rendering was successful, False otherwise.
+        bool: True if rendering was successful or the thumbnail is up to date, False otherwise.
     """
     if not bpy:
         print("Error: bpy module not available. Cannot generate thumbnail.")
@@ -131,19 +220,40 @@ def generate_thumbnail(fbx_path, output_png_path):
     if not os.path.exists(fbx_path):
         print(f"Error: Input FBX file not found: {fbx_path}")
         return False
+    
+    if not force and _is_thumbnail_fresh(fbx_path, output_png_path):
+        print(f"Thumbnail is up to date, skipping: {output_png_path}")
+        return True
 
     print(f"Starting improved thumbnail generation for: {os.path.basename(fbx_path)}")
     
+    global _SHARED_CAMERA, _SHARED_SUN
+    
     try:
-        # 先清除場景中的所有對象
-        _reset_scene()
+        # 操作不需要撤銷記錄
+        bpy.context.preferences.edit.use_global_undo = False
+        _ensure_fbx_importer()
         
-        # 設置相機和燈光
-        camera = _setup_camera()
-        _setup_lighting()
+        # 先清除場景中的所有對象，保留上一次的相機和燈光
+        _purge_scene()
         
-        # 導入FBX模型
-        bpy.ops.import_scene.fbx(filepath=fbx_path)
+        # 設置相機和燈光，只在沒有可重用的相機和燈光時創建
+        if not _is_alive(_SHARED_CAMERA):
+            _SHARED_CAMERA = _move_to_scene_root(_setup_camera())
+        camera = _SHARED_CAMERA
+        bpy.context.scene.camera = camera
+        if not _is_alive(_SHARED_SUN):
+            _SHARED_SUN = _move_to_scene_root(_setup_lighting())
+        
+        # 導入FBX模型，跳過縮圖用不到的動畫、自定義屬性、細分和貼圖搜索
+        bpy.ops.import_scene.fbx(
+            filepath=fbx_path,
+            use_anim=False,
+            use_custom_props=False,
+            use_subsurf=False,
+            use_image_search=False,
+            ignore_leaf_bones=True
+        )
         
         # 檢查是否有導入任何網格物體
         mesh_objects = [o for o in bpy.context.scene.objects if o.type == 'MESH']
@@ -151,24 +261,43 @@ def generate_thumbnail(fbx_path, output_png_path):
             print(f"Warning: No mesh objects found in {os.path.basename(fbx_path)}. Attempting to continue...")
             # 快速解決方案：創建一個粒子系統小球來代表物體
             bpy.ops.mesh.primitive_ico_sphere_add(radius=0.1, location=(0, 0, 0))
+            mesh_objects = [bpy.context.active_object]
             print("Added placeholder sphere for rendering")
             
         # 使物體在場景中居中
-        _center_objects()
+        _center_objects(mesh_objects)
+        
+        # 所有設置都直接修改數據，只在讀取世界矩陣之前評估一次依賴圖
+        bpy.context.view_layer.update()
         
         # 獲取物體的尺寸和中心點
-        dimensions, center = _get_object_dimensions()
+        dimensions, center = _get_object_dimensions(mesh_objects)
         
         # 定位相機來捕捉物體
         _position_camera(camera, dimensions, center)
         
         # 設置渲染屬性
+        _setup_render_engine(bpy.context.scene)
         render = bpy.context.scene.render
+        render.use_simplify = True
+        render.simplify_subdivision_render = 0  # 不渲染模型自帶的細分修改器
         render.image_settings.file_format = 'PNG'
+        render.image_settings.compression = 15  # 縮圖很小，低壓縮級別可加快PNG編碼
+        render.image_settings.color_depth = '8'
+        # 使用標準色彩轉換，避免導入的場景設置Filmic等額外的逐像素轉換
+        scene = bpy.context.scene
+        scene.display_settings.display_device = 'sRGB'
+        scene.view_settings.view_transform = 'Standard'
         render.resolution_x = 256
         render.resolution_y = 256
         render.resolution_percentage = 100
         render.filepath = output_png_path
+        if threads:
+            # 多個進程同時渲染時固定線程數，避免線程數超過CPU數
+            render.threads_mode = 'FIXED'
+            render.threads = max(1, threads)
+        else:
+            render.threads_mode = 'AUTO'
         
         # 改進版本：從物體適當角度渲染
         # 徜常可以嘗試多個角度並選擇最好的一個，但存在複雜化風險，先試用此方法
@@ -184,6 +313,57 @@ def generate_thumbnail(fbx_path, output_png_path):
         traceback.print_exc()
         return False
 
+def _generate_thumbnail_pair(pair, threads, force):
+    """Worker entry point for generate_thumbnails_batch."""
+    fbx_path, output_png_path = pair
+    return generate_thumbnail(fbx_path, output_png_path, threads, force)
+
+def generate_thumbnails_batch(pairs, max_workers=THUMBNAIL_PROCESS_WORKERS, force=False):
+    """
+    Generates thumbnails for several FBX models in parallel worker processes.
+
+    bpy renders block the interpreter they run in, so each worker process
+    imports its own bpy and renders its share of the models. The CPUs are
+    split between the workers so their render threads don't oversubscribe.
+
+    Args:
+        pairs (list): (fbx_path, output_png_path) tuples.
+        max_workers (int, optional): Maximum number of worker processes, never more than THUMBNAIL_PROCESS_WORKERS.
+        force (bool, optional): Render even the thumbnails that are already newer than their FBX.
+
+    Returns:
+        list: One bool per pair, True if that thumbnail was rendered or is up to date.
+    """
+    pairs = list(pairs)
+    results = [True] * len(pairs)
+    
+    # Up-to-date thumbnails are skipped here so they don't take up a worker
+    stale = [i for i, (fbx_path, output_png_path) in enumerate(pairs)
+             if force or not _is_thumbnail_fresh(fbx_path, output_png_path)]
+    if len(stale) < len(pairs):
+        print(f"Skipping {len(pairs) - len(stale)} up-to-date thumbnails")
+    
+    for i, ok in zip(stale, _render_thumbnails([pairs[i] for i in stale], max_workers)):
+        results[i] = ok
+    return results
+
+def _render_thumbnails(pairs, max_workers):
+    """Renders the given (fbx_path, output_png_path) pairs, in worker processes when there are several."""
+    if len(pairs) < 2 or not USE_THUMBNAIL_PROCESSES:
+        return [generate_thumbnail(fbx_path, output_png_path, force=True) for fbx_path, output_png_path in pairs]
+    
+    workers = min(len(pairs), max_workers or THUMBNAIL_PROCESS_WORKERS, THUMBNAIL_PROCESS_WORKERS)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    print(f"Rendering {len(pairs)} thumbnails in {workers} worker processes with {threads} threads each")
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_generate_thumbnail_pair, pairs, [threads] * len(pairs), [True] * len(pairs)))
+    except Exception as e:
+        # A worker died (e.g. out of memory); render the batch in this process instead
+        print(f"Error in thumbnail worker processes, rendering in-process: {e}")
+        traceback.print_exc()
+        return [generate_thumbnail(fbx_path, output_png_path, force=True) for fbx_path, output_png_path in pairs]
+
 # Example usage (for testing purposes, not called by main app)
 if __name__ == "__main__":
     # This part is for testing the script directly